@@ -1,6 +1,8 @@
 import asyncio
+import atexit
 import logging
 import traceback
+from contextlib import nullcontext
 from typing import Any, Callable, Type
 
 import typer
@@ -10,6 +12,15 @@ from agentic_framework.constants import LOGS_DIR
 from agentic_framework.mcp import MCPConnectionError, MCPProvider
 from agentic_framework.registry import AgentRegistry
 
+# uvloop is an optional speedup (``uv sync --extra uvloop``) and is not available on Windows.
+_LOOP_FACTORY: Callable[[], asyncio.AbstractEventLoop] | None
+try:
+    import uvloop
+
+    _LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    _LOOP_FACTORY = None
+
 RUN_TIMEOUT_SECONDS = 600
 
 app = typer.Typer(
@@ -19,28 +30,41 @@ app = typer.Typer(
 )
 console = Console()
 
+# Lazily created on first use and shared by every agent run in this process.
+_RUNNER: asyncio.Runner | None = None
+
+# Set by configure_logging(); gates the cause chain and traceback shown for failed runs.
+_VERBOSE = False
+
+# Agent class and allowed MCP servers per name, filled in by _lookup_agent() as agents are used.
+_AGENT_INDEX: dict[str, tuple[Type[Any], list[str] | None]] = {}
+
 
 def configure_logging(verbose: bool) -> None:
+    global _VERBOSE
+    _VERBOSE = verbose
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     logging.basicConfig(
         level="DEBUG" if verbose else "INFO",
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="[%X]",
-        handlers=[logging.FileHandler(str(LOGS_DIR / "agent.log"))],
+        # delay=True: the log file is only opened when the first record is emitted.
+        handlers=[logging.FileHandler(str(LOGS_DIR / "agent.log"), delay=True)],
         force=True,
     )
 
 
 def _print_chained_causes(error: BaseException) -> None:
-    exc_ptr: BaseException | None = error
-    while exc_ptr is not None:
-        chained_cause: BaseException | None = getattr(exc_ptr, "__cause__", None) or getattr(
-            exc_ptr, "__context__", None
-        )
-        if chained_cause is None:
-            break
-        console.print(f"[red]  cause: {chained_cause}[/red]")
-        exc_ptr = chained_cause
+    lines: list[str] = []
+    seen = {id(error)}
+    chained_cause = error.__cause__ or error.__context__
+    # Track visited exceptions so a cyclic __cause__/__context__ chain cannot loop forever.
+    while chained_cause is not None and id(chained_cause) not in seen:
+        seen.add(id(chained_cause))
+        lines.append(f"[red]  cause: {chained_cause}[/red]")
+        chained_cause = chained_cause.__cause__ or chained_cause.__context__
+    if lines:
+        console.print("\n".join(lines))
 
 
 def _handle_mcp_connection_error(error: MCPConnectionError) -> None:
@@ -48,8 +72,11 @@ def _handle_mcp_connection_error(error: MCPConnectionError) -> None:
     cause = error.cause
 
     if hasattr(cause, "exceptions"):
-        for idx, sub_error in enumerate(cause.exceptions):
-            console.print(f"[red]  sub-exception {idx + 1}: {sub_error}[/red]")
+        console.print(
+            "\n".join(
+                f"[red]  sub-exception {idx + 1}: {sub_error}[/red]" for idx, sub_error in enumerate(cause.exceptions)
+            )
+        )
     elif error.__cause__:
         console.print(f"[red]  cause: {error.__cause__}[/red]")
 
@@ -58,30 +85,79 @@ def _handle_mcp_connection_error(error: MCPConnectionError) -> None:
         console.print("[yellow]Note:[/yellow] web-fetch requires a valid remote URL. Check mcp/config.py")
 
 
-async def _run_agent(
+async def _run_agent_batch(
     agent_cls: Type[Any],
-    input_text: str,
+    inputs: list[str],
     allowed_mcp: list[str] | None,
-) -> str:
-    if allowed_mcp:
-        provider = MCPProvider(server_names=allowed_mcp)
-        async with provider.tool_session() as mcp_tools:
-            agent = agent_cls(initial_mcp_tools=mcp_tools)
-            return str(await agent.run(input_text))
-
-    agent = agent_cls()
-    return str(await agent.run(input_text))
+    timeout_sec: int,
+) -> list[str]:
+    """Run a fresh agent per input, connecting to the agent's MCP servers once for the whole batch.
+
+    Every input gets its own ``timeout_sec`` budget; the first one also covers the MCP connection setup.
+    """
+    loop = asyncio.get_running_loop()
+    results: list[str] = []
+    async with asyncio.timeout(timeout_sec) as deadline:
+        session = MCPProvider(server_names=allowed_mcp).tool_session() if allowed_mcp else nullcontext(None)
+        async with session as mcp_tools:
+            for input_text in inputs:
+                if results:
+                    deadline.reschedule(loop.time() + timeout_sec)
+                agent = agent_cls(initial_mcp_tools=mcp_tools) if allowed_mcp else agent_cls()
+                result = await agent.run(input_text)
+                results.append(result if isinstance(result, str) else str(result))
+    return results
+
+
+def _get_runner() -> asyncio.Runner:
+    """Return the process-wide asyncio Runner, creating its event loop on first use."""
+    global _RUNNER
+    if _RUNNER is None:
+        _RUNNER = asyncio.Runner(loop_factory=_LOOP_FACTORY)
+        atexit.register(_RUNNER.close)
+    return _RUNNER
+
+
+def _lookup_agent(agent_name: str) -> tuple[Type[Any], list[str] | None] | None:
+    """Return the agent class and its allowed MCP servers, or None if the agent is unknown.
+
+    The registry imports the agent's module on first lookup; the result is kept in _AGENT_INDEX.
+    """
+    entry = _AGENT_INDEX.get(agent_name)
+    if entry is not None:
+        return entry
+    agent_cls = AgentRegistry.get(agent_name)
+    if agent_cls is None:
+        return None
+    entry = _AGENT_INDEX[agent_name] = (agent_cls, AgentRegistry.get_mcp_servers(agent_name))
+    return entry
+
+
+def _require_agent(agent_name: str) -> tuple[Type[Any], list[str] | None]:
+    """Like _lookup_agent(), but report an unknown agent on the console and exit with code 1."""
+    entry = _lookup_agent(agent_name)
+    if entry is None:
+        console.print(
+            f"[bold red]Error:[/bold red] Agent '{agent_name}' not found.\n"
+            "[yellow]Tip:[/yellow] Use 'list' command to see all available agents."
+        )
+        raise typer.Exit(code=1)
+    return entry
 
 
 def execute_agent(agent_name: str, input_text: str, timeout_sec: int) -> str:
-    agent_cls = AgentRegistry.get(agent_name)
-    if not agent_cls:
-        raise typer.Exit(code=1)
+    return execute_agent_many(agent_name, [input_text], timeout_sec)[0]
 
-    allowed_mcp = AgentRegistry.get_mcp_servers(agent_name)
+
+def execute_agent_many(agent_name: str, inputs: list[str], timeout_sec: int) -> list[str]:
+    """Run an agent once per input, reusing a single event loop and MCP tool session for all runs.
+
+    Each run gets its own timeout of ``timeout_sec`` seconds.
+    """
+    agent_cls, allowed_mcp = _require_agent(agent_name)
     try:
-        return asyncio.run(asyncio.wait_for(_run_agent(agent_cls, input_text, allowed_mcp), timeout=float(timeout_sec)))
-    except asyncio.TimeoutError as exc:
+        return _get_runner().run(_run_agent_batch(agent_cls, inputs, allowed_mcp, timeout_sec))
+    except TimeoutError as exc:
         raise TimeoutError(f"Run timed out after {timeout_sec}s.") from exc
 
 
@@ -97,64 +173,61 @@ def list_agents() -> None:
 @app.command(name="info")
 def agent_info(agent_name: str = typer.Argument(..., help="Name of the agent to inspect.")) -> None:
     """Show detailed information about an agent."""
-    agent_cls = AgentRegistry.get(agent_name)
-    if not agent_cls:
-        console.print(f"[bold red]Error:[/bold red] Agent '{agent_name}' not found.")
-        console.print("[yellow]Tip:[/yellow] Use 'list' command to see all available agents.")
-        raise typer.Exit(code=1)
-
-    console.print(f"[bold cyan]Agent Details:[/bold cyan] {agent_name}\n")
+    agent_cls, mcp_servers = _require_agent(agent_name)
+    # Collect every line first so the details are rendered in a single console write.
+    parts: list[str] = [f"[bold cyan]Agent Details:[/bold cyan] {agent_name}\n"]
 
     # Agent class name
-    console.print(f"[bold]Class:[/bold] {agent_cls.__name__}")
+    parts.append(f"[bold]Class:[/bold] {agent_cls.__name__}")
 
     # Module
-    console.print(f"[bold]Module:[/bold] {agent_cls.__module__}")
+    parts.append(f"[bold]Module:[/bold] {agent_cls.__module__}")
 
     # MCP servers
-    mcp_servers = AgentRegistry.get_mcp_servers(agent_name)
     if mcp_servers is None:
-        console.print("[bold]MCP Servers:[/bold] None (no MCP access)")
+        parts.append("[bold]MCP Servers:[/bold] None (no MCP access)")
     elif mcp_servers:
-        console.print(f"[bold]MCP Servers:[/bold] {', '.join(mcp_servers)}")
+        parts.append(f"[bold]MCP Servers:[/bold] {', '.join(mcp_servers)}")
     else:
-        console.print("[bold]MCP Servers:[/bold] (configured but empty list)")
+        parts.append("[bold]MCP Servers:[/bold] (configured but empty list)")
 
     # Create agent instance first (needed for system prompt and tools)
     agent = None
     try:
-        agent = agent_cls(initial_mcp_tools=[])  # type: ignore[call-arg]
+        agent = agent_cls(initial_mcp_tools=[])
     except Exception as e:
-        console.print(f"[yellow]Warning:[/yellow] Could not instantiate agent: {e}")
+        parts.append(f"[yellow]Warning:[/yellow] Could not instantiate agent: {e}")
 
     # System prompt (if available) - need to instantiate to access the property
-    console.print("\n[bold]System Prompt:[/bold]")
+    parts.append("\n[bold]System Prompt:[/bold]")
     if agent and hasattr(agent, "system_prompt"):
         try:
-            system_prompt = agent.system_prompt
-            console.print(system_prompt)
+            parts.append(str(agent.system_prompt))
         except Exception as e:
-            console.print(f"[dim](Could not access system prompt: {e})[/dim]")
+            parts.append(f"[dim](Could not access system prompt: {e})[/dim]")
     else:
-        console.print("[dim](No system prompt defined)[/dim]")
+        parts.append("[dim](No system prompt defined)[/dim]")
 
     # Tools info
-    console.print("\n[bold]Tools:[/bold]")
+    parts.append("\n[bold]Tools:[/bold]")
     if agent:
         try:
             tools = agent.get_tools()
 
             if not tools:
-                console.print("  No tools configured")
+                parts.append("  No tools configured")
             else:
-                for tool in tools:
-                    tool_name = getattr(tool, "name", tool.__class__.__name__)
-                    tool_desc = getattr(tool, "description", "(no description)")
-                    console.print(f"  - [green]{tool_name}[/green]: {tool_desc}")
+                parts.extend(
+                    f"  - [green]{getattr(tool, 'name', tool.__class__.__name__)}[/green]: "
+                    f"{getattr(tool, 'description', '(no description)')}"
+                    for tool in tools
+                )
         except Exception as e:
-            console.print(f"  [dim](Could not list tools: {e})[/dim]")
+            parts.append(f"  [dim](Could not list tools: {e})[/dim]")
     else:
-        console.print("  [dim](Could not instantiate agent to list tools)[/dim]")
+        parts.append("  [dim](Could not instantiate agent to list tools)[/dim]")
+
+    console.print("\n".join(parts))
 
 
 @app.callback(invoke_without_command=True)
@@ -164,12 +237,44 @@ def main(
 ) -> None:
     """Agentic Framework CLI."""
     configure_logging(verbose)
-    logging.info("Starting CLI")
+    logging.debug("Starting CLI")
     if ctx.invoked_subcommand is None:
         console.print("[bold yellow]No command provided. Use --help to see available commands.[/bold yellow]")
 
 
+def _run_agent_command(agent_name: str, input_text: str, timeout_sec: int) -> None:
+    """Run an agent from the CLI and report its result or failure on the console."""
+    # The success path writes through typer directly; Rich markup rendering is kept for errors.
+    typer.secho(f"Running agent: {agent_name}...", fg=typer.colors.BLUE, bold=True)
+
+    try:
+        result = execute_agent(agent_name=agent_name, input_text=input_text, timeout_sec=timeout_sec)
+        typer.secho(f"Result from {agent_name}:", fg=typer.colors.GREEN, bold=True)
+        typer.echo(result)
+    except typer.Exit:
+        raise
+    except TimeoutError as error:
+        console.print(
+            "[bold red]Error running agent:[/bold red] "
+            f"{error} Check MCP server connectivity or use --timeout to increase."
+        )
+        raise typer.Exit(code=1)
+    except MCPConnectionError as error:
+        _handle_mcp_connection_error(error)
+        raise typer.Exit(code=1)
+    except Exception as error:
+        console.print(f"[bold red]Error running agent:[/bold red] {error}")
+        if _VERBOSE:
+            _print_chained_causes(error)
+            console.print("[dim]" + traceback.format_exc() + "[/dim]")
+        else:
+            console.print("[dim]Run with --verbose to see full traceback.[/dim]")
+        raise typer.Exit(code=1)
+
+
 def create_agent_command(agent_name: str) -> Callable[[str, int], None]:
+    # Typer builds the CLI options from this signature, so the agent name is bound by the closure
+    # rather than as an extra parameter; the shared body lives in _run_agent_command.
     def command(
         input_text: str = typer.Option(..., "--input", "-i", help="Input text for the agent."),
         timeout_sec: int = typer.Option(
@@ -180,41 +285,13 @@ def create_agent_command(agent_name: str) -> Callable[[str, int], None]:
         ),
     ) -> None:
         """Run agent."""
-        if not AgentRegistry.get(agent_name):
-            console.print(f"[bold red]Error:[/bold red] Agent '{agent_name}' not found.")
-            raise typer.Exit(code=1)
-
-        console.print(f"[bold blue]Running agent:[/bold blue] {agent_name}...")
-
-        try:
-            result = execute_agent(agent_name=agent_name, input_text=input_text, timeout_sec=timeout_sec)
-            console.print(f"[bold green]Result from {agent_name}:[/bold green]")
-            console.print(result)
-        except typer.Exit:
-            raise
-        except TimeoutError as error:
-            console.print(
-                "[bold red]Error running agent:[/bold red] "
-                f"{error} Check MCP server connectivity or use --timeout to increase."
-            )
-            raise typer.Exit(code=1)
-        except MCPConnectionError as error:
-            _handle_mcp_connection_error(error)
-            raise typer.Exit(code=1)
-        except Exception as error:
-            console.print(f"[bold red]Error running agent:[/bold red] {error}")
-            _print_chained_causes(error)
-            if logging.getLogger().isEnabledFor(logging.DEBUG):
-                console.print("[dim]" + traceback.format_exc() + "[/dim]")
-            else:
-                console.print("[dim]Run with --verbose to see full traceback.[/dim]")
-            raise typer.Exit(code=1)
+        _run_agent_command(agent_name, input_text, timeout_sec)
 
     command.__doc__ = f"Run the {agent_name} agent."
     return command
 
 
-AgentRegistry.discover_agents()
+# list_agents() discovers agents without importing them; each agent's module is imported when it runs.
 for _name in AgentRegistry.list_agents():
     app.command(name=_name)(create_agent_command(_name))
 
@@ -1,12 +1,28 @@
+import functools
 import os
 from pathlib import Path
-from typing import Any, Literal
+from types import MappingProxyType
+from typing import Any, Callable, Literal, Mapping
 
-from dotenv import load_dotenv
 
-load_dotenv()  # Load .env before reading environment variables
+def _load_env() -> None:
+    """Load .env into os.environ.
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+    Set AGENTIC_SKIP_DOTENV=1 when the environment is injected directly (e.g. in containers)
+    to skip importing python-dotenv and reading .env altogether.
+    """
+    if os.environ.get("AGENTIC_SKIP_DOTENV") == "1":
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+_load_env()  # Load .env before reading environment variables
+
+# abspath() is pure string work; Path.resolve() would stat every component to follow symlinks.
+BASE_DIR = Path(os.path.abspath(__file__)).parent.parent.parent
+BASE_DIR_STR = str(BASE_DIR)
 LOGS_DIR = BASE_DIR / "logs"
 
 Provider = Literal[
@@ -23,22 +39,57 @@ Provider = Literal[
     "huggingface",
 ]
 
-# Default models for each provider
-DEFAULT_MODELS: dict[Provider, str] = {
-    "anthropic": "claude-haiku-4-5-20251001",
-    "openai": "gpt-4o-mini",
-    "ollama": "llama3.2",
-    "azure_openai": "gpt-4o-mini",
-    "google_vertexai": "gemini-2.0-flash-exp",
-    "google_genai": "gemini-2.0-flash-exp",
-    "groq": "llama-3.3-70b-versatile",
-    "mistralai": "mistral-large-latest",
-    "cohere": "command-r-plus",
-    "bedrock": "anthropic.claude-3-5-sonnet-20241022-v2:0",
-    "huggingface": "meta-llama/Llama-3.2-3B-Instruct",
-}
-
-
+# Default models for each provider (read-only)
+DEFAULT_MODELS: Mapping[Provider, str] = MappingProxyType(
+    {
+        "anthropic": "claude-haiku-4-5-20251001",
+        "openai": "gpt-4o-mini",
+        "ollama": "llama3.2",
+        "azure_openai": "gpt-4o-mini",
+        "google_vertexai": "gemini-2.0-flash-exp",
+        "google_genai": "gemini-2.0-flash-exp",
+        "groq": "llama-3.3-70b-versatile",
+        "mistralai": "mistral-large-latest",
+        "cohere": "command-r-plus",
+        "bedrock": "anthropic.claude-3-5-sonnet-20241022-v2:0",
+        "huggingface": "meta-llama/Llama-3.2-3B-Instruct",
+    }
+)
+
+# Environment variable that overrides the default model of each provider
+_MODEL_NAME_ENV_VARS: Mapping[Provider, str] = MappingProxyType(
+    {
+        "anthropic": "ANTHROPIC_MODEL_NAME",
+        "openai": "OPENAI_MODEL_NAME",
+        "ollama": "OLLAMA_MODEL_NAME",
+        "azure_openai": "AZURE_OPENAI_MODEL_NAME",
+        "google_vertexai": "GOOGLE_VERTEX_MODEL_NAME",
+        "google_genai": "GOOGLE_GENAI_MODEL_NAME",
+        "groq": "GROQ_MODEL_NAME",
+        "mistralai": "MISTRAL_MODEL_NAME",
+        "cohere": "COHERE_MODEL_NAME",
+        "bedrock": "BEDROCK_MODEL_NAME",
+        "huggingface": "HUGGINGFACE_MODEL_NAME",
+    }
+)
+
+# Environment variables that select each provider, in priority order.
+_PROVIDER_RULES: tuple[tuple[tuple[str, ...], Provider], ...] = (
+    (("ANTHROPIC_API_KEY",), "anthropic"),
+    (("GOOGLE_VERTEX_PROJECT_ID", "GOOGLE_VERTEX_CREDENTIALS"), "google_vertexai"),
+    (("GOOGLE_API_KEY",), "google_genai"),
+    (("AZURE_OPENAI_API_KEY",), "azure_openai"),
+    (("GROQ_API_KEY",), "groq"),
+    (("MISTRAL_API_KEY",), "mistralai"),
+    (("COHERE_API_KEY",), "cohere"),
+    (("AWS_PROFILE", "AWS_ACCESS_KEY_ID"), "bedrock"),
+    (("HUGGINGFACEHUB_API_TOKEN",), "huggingface"),
+    (("OLLAMA_BASE_URL", "OLLAMA_ENABLED"), "ollama"),
+    (("OPENAI_API_KEY",), "openai"),
+)
+
+
+@functools.lru_cache(maxsize=1)
 def detect_provider() -> Provider:
     """Detect which LLM provider to use based on available API keys.
 
@@ -60,152 +111,177 @@ def detect_provider() -> Provider:
     Note:
         Ollama is special as it runs locally without an API key.
         It's checked via OLLAMA_BASE_URL environment variable.
+
+        The result is cached for the lifetime of the process. Call
+        ``refresh_provider_cache()`` after changing the environment.
     """
-    # Check in order of priority
-    if os.getenv("ANTHROPIC_API_KEY"):
-        return "anthropic"
-    if os.getenv("GOOGLE_VERTEX_PROJECT_ID") or os.getenv("GOOGLE_VERTEX_CREDENTIALS"):
-        return "google_vertexai"
-    if os.getenv("GOOGLE_API_KEY"):
-        return "google_genai"
-    if os.getenv("AZURE_OPENAI_API_KEY"):
-        return "azure_openai"
-    if os.getenv("GROQ_API_KEY"):
-        return "groq"
-    if os.getenv("MISTRAL_API_KEY"):
-        return "mistralai"
-    if os.getenv("COHERE_API_KEY"):
-        return "cohere"
-    if os.getenv("AWS_PROFILE") or os.getenv("AWS_ACCESS_KEY_ID"):
-        return "bedrock"
-    if os.getenv("HUGGINGFACEHUB_API_TOKEN"):
-        return "huggingface"
-    if os.getenv("OLLAMA_BASE_URL") or os.getenv("OLLAMA_ENABLED"):
-        return "ollama"
+    env = os.environ
+    for env_keys, provider in _PROVIDER_RULES:
+        # Empty values count as unset, matching os.getenv() truthiness.
+        if any(env.get(key) for key in env_keys):
+            return provider
     # Final fallback
-    if os.getenv("OPENAI_API_KEY"):
-        return "openai"
     return "openai"
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_model() -> str:
     """Get the default model name based on available provider.
 
     Returns:
         Default model name for the detected provider. Can be overridden
         with environment variables like ANTHROPIC_MODEL_NAME, OPENAI_MODEL_NAME, etc.
+        Cached like detect_provider(); use ``refresh_provider_cache()`` to reset.
     """
     provider = detect_provider()
 
     # Allow override via environment variables
-    env_model_names = {
-        "anthropic": os.getenv("ANTHROPIC_MODEL_NAME"),
-        "openai": os.getenv("OPENAI_MODEL_NAME"),
-        "ollama": os.getenv("OLLAMA_MODEL_NAME"),
-        "azure_openai": os.getenv("AZURE_OPENAI_MODEL_NAME"),
-        "google_vertexai": os.getenv("GOOGLE_VERTEX_MODEL_NAME"),
-        "google_genai": os.getenv("GOOGLE_GENAI_MODEL_NAME"),
-        "groq": os.getenv("GROQ_MODEL_NAME"),
-        "mistralai": os.getenv("MISTRAL_MODEL_NAME"),
-        "cohere": os.getenv("COHERE_MODEL_NAME"),
-        "bedrock": os.getenv("BEDROCK_MODEL_NAME"),
-        "huggingface": os.getenv("HUGGINGFACE_MODEL_NAME"),
-    }
-
-    if env_model_name := env_model_names.get(provider):
+    if env_model_name := os.getenv(_MODEL_NAME_ENV_VARS[provider]):
         return env_model_name
 
     return DEFAULT_MODELS.get(provider, "gpt-4o-mini")
 
 
-# Legacy constant for backward compatibility
-DEFAULT_MODEL = get_default_model()
+def refresh_provider_cache() -> None:
+    """Forget the cached provider, default model and shared model instances.
 
+    The next call re-reads the environment (including API keys picked up by new model clients).
+    """
+    detect_provider.cache_clear()
+    get_default_model.cache_clear()
+    _shared_model.cache_clear()
 
-def _create_model(model_name: str, temperature: float) -> Any:
-    """Create the appropriate LLM model instance based on detected provider.
 
-    Args:
-        model_name: Name of the model to use.
-        temperature: Temperature setting for the model.
+def __getattr__(name: str) -> Any:
+    """Resolve legacy module attributes lazily (PEP 562).
 
-    Returns:
-        The appropriate Chat model instance for the detected provider.
+    ``DEFAULT_MODEL`` is kept for backward compatibility but is only computed on first
+    access, so importing this module does not trigger provider detection.
     """
-    provider = detect_provider()
+    if name == "DEFAULT_MODEL":
+        return get_default_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _make_anthropic(model_name: str, temperature: float) -> Any:
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(model=model_name, temperature=temperature)  # type: ignore[call-arg]
 
-    if provider == "anthropic":
-        from langchain_anthropic import ChatAnthropic
 
-        return ChatAnthropic(model=model_name, temperature=temperature)  # type: ignore[call-arg]
+def _make_ollama(model_name: str, temperature: float) -> Any:
+    from langchain_community.chat_models import ChatOllama
 
-    if provider == "ollama":
-        from langchain_community.chat_models import ChatOllama
+    return ChatOllama(
+        model=model_name,
+        temperature=temperature,
+        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+    )
 
-        return ChatOllama(
-            model=model_name,
-            temperature=temperature,
-            base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-        )
 
-    if provider == "azure_openai":
-        from langchain_openai import AzureChatOpenAI
-        from pydantic.types import SecretStr
+def _make_azure_openai(model_name: str, temperature: float) -> Any:
+    from langchain_openai import AzureChatOpenAI
+    from pydantic.types import SecretStr
 
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        return AzureChatOpenAI(
-            model=model_name,
-            temperature=temperature,
-            api_key=SecretStr(api_key) if api_key else None,
-            azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-            api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
-            azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
-        )
+    api_key = os.getenv("AZURE_OPENAI_API_KEY")
+    return AzureChatOpenAI(
+        model=model_name,
+        temperature=temperature,
+        api_key=SecretStr(api_key) if api_key else None,
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
+        azure_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME"),
+    )
 
-    if provider == "google_vertexai":
-        from langchain_google_vertexai import ChatVertexAI
 
-        return ChatVertexAI(model=model_name, temperature=temperature)
+def _make_google_vertexai(model_name: str, temperature: float) -> Any:
+    from langchain_google_vertexai import ChatVertexAI
 
-    if provider == "google_genai":
-        from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatVertexAI(model=model_name, temperature=temperature)
 
-        return ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
 
-    if provider == "groq":
-        from langchain_groq import ChatGroq
+def _make_google_genai(model_name: str, temperature: float) -> Any:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
-        return ChatGroq(model=model_name, temperature=temperature)
+    return ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
 
-    if provider == "mistralai":
-        from langchain_mistralai import ChatMistralAI
 
-        return ChatMistralAI(model_name=model_name, temperature=temperature)
+def _make_groq(model_name: str, temperature: float) -> Any:
+    from langchain_groq import ChatGroq
 
-    if provider == "cohere":
-        from langchain_cohere import ChatCohere
+    return ChatGroq(model=model_name, temperature=temperature)
 
-        return ChatCohere(model=model_name, temperature=temperature)
 
-    if provider == "bedrock":
-        from langchain_aws import ChatBedrock
+def _make_mistralai(model_name: str, temperature: float) -> Any:
+    from langchain_mistralai import ChatMistralAI
 
-        # Set AWS region via environment variable if specified
-        if bedrock_region := os.getenv("BEDROCK_REGION"):
-            os.environ["AWS_DEFAULT_REGION"] = bedrock_region
+    return ChatMistralAI(model_name=model_name, temperature=temperature)
 
-        return ChatBedrock(model=model_name, temperature=temperature)
 
-    if provider == "huggingface":
-        from langchain_huggingface import ChatHuggingFace
+def _make_cohere(model_name: str, temperature: float) -> Any:
+    from langchain_cohere import ChatCohere
 
-        # HuggingFace ChatModel may not support temperature in all cases
-        try:
-            return ChatHuggingFace(model_id=model_name, temperature=temperature)
-        except Exception:
-            return ChatHuggingFace(model_id=model_name)
+    return ChatCohere(model=model_name, temperature=temperature)
 
-    # Default fallback to OpenAI
+
+def _make_bedrock(model_name: str, temperature: float) -> Any:
+    from langchain_aws import ChatBedrock
+
+    # Set AWS region via environment variable if specified
+    if bedrock_region := os.getenv("BEDROCK_REGION"):
+        os.environ["AWS_DEFAULT_REGION"] = bedrock_region
+
+    return ChatBedrock(model=model_name, temperature=temperature)
+
+
+def _make_huggingface(model_name: str, temperature: float) -> Any:
+    from langchain_huggingface import ChatHuggingFace
+
+    # HuggingFace ChatModel may not support temperature in all cases
+    try:
+        return ChatHuggingFace(model_id=model_name, temperature=temperature)
+    except Exception:
+        return ChatHuggingFace(model_id=model_name)
+
+
+def _make_openai(model_name: str, temperature: float) -> Any:
     from langchain_openai import ChatOpenAI
 
     return ChatOpenAI(model=model_name, temperature=temperature)
+
+
+# Provider -> model factory. Each factory imports its provider SDK lazily.
+_PROVIDER_FACTORIES: dict[Provider, Callable[[str, float], Any]] = {
+    "anthropic": _make_anthropic,
+    "openai": _make_openai,
+    "ollama": _make_ollama,
+    "azure_openai": _make_azure_openai,
+    "google_vertexai": _make_google_vertexai,
+    "google_genai": _make_google_genai,
+    "groq": _make_groq,
+    "mistralai": _make_mistralai,
+    "cohere": _make_cohere,
+    "bedrock": _make_bedrock,
+    "huggingface": _make_huggingface,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _shared_model(provider: Provider, model_name: str, temperature: float) -> Any:
+    return _PROVIDER_FACTORIES.get(provider, _make_openai)(model_name, temperature)
+
+
+def _create_model(model_name: str, temperature: float) -> Any:
+    """Create the appropriate LLM model instance based on detected provider.
+
+    Args:
+        model_name: Name of the model to use.
+        temperature: Temperature setting for the model.
+
+    Returns:
+        The appropriate Chat model instance for the detected provider.
+        Falls back to OpenAI for unknown providers. Agents asking for the same
+        provider, model and temperature share one instance (and its HTTP client);
+        ``refresh_provider_cache()`` drops the shared instances.
+    """
+    return _shared_model(detect_provider(), model_name, temperature)
@@ -1,9 +1,26 @@
 """Core agent building blocks.
 
-Agent modules are discovered dynamically via AgentRegistry.discover_agents().
+Agent modules are discovered dynamically via AgentRegistry.discover_agents() or
+AgentRegistry.discover_lightweight().
 Keep this file free of imports that instantiate concrete agents.
 """
 
-from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
 
 __all__ = ["LangGraphMCPAgent"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported classes on first access (PEP 562).
+
+    Importing an agent module from this package then only loads LangGraph and the MCP
+    adapters when that agent actually builds on LangGraphMCPAgent.
+    """
+    if name == "LangGraphMCPAgent":
+        from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
+
+        return LangGraphMCPAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,52 @@
+"""Checkpointers used by LangGraph-based agents."""
+
+from collections import OrderedDict
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import ChannelVersions, Checkpoint, CheckpointMetadata, CheckpointTuple
+from langgraph.checkpoint.memory import InMemorySaver
+
+DEFAULT_MAX_THREADS = 1000
+
+
+class BoundedInMemorySaver(InMemorySaver):
+    """InMemorySaver that keeps at most ``max_threads`` conversation threads.
+
+    Threads are tracked in least-recently-used order (saving or reading a checkpoint counts
+    as a use); when a new thread would exceed the limit, the oldest one is deleted with all
+    of its checkpoints, writes and blobs.
+    """
+
+    def __init__(self, *, max_threads: int = DEFAULT_MAX_THREADS, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.max_threads = max_threads
+        self._thread_order: OrderedDict[str, None] = OrderedDict()
+
+    def _touch(self, thread_id: str) -> None:
+        self._thread_order[thread_id] = None
+        self._thread_order.move_to_end(thread_id)
+        while len(self._thread_order) > self.max_threads:
+            oldest, _ = self._thread_order.popitem(last=False)
+            super().delete_thread(oldest)
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        if thread_id in self._thread_order:
+            self._thread_order.move_to_end(thread_id)
+        return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        saved = super().put(config, checkpoint, metadata, new_versions)
+        self._touch(config["configurable"]["thread_id"])
+        return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._thread_order.pop(thread_id, None)
+        super().delete_thread(thread_id)
@@ -6,9 +6,9 @@ from agentic_framework.registry import AgentRegistry
 class ChefAgent(LangGraphMCPAgent):
     """A recipe-focused agent with MCP web search capabilities."""
 
-    @property
-    def system_prompt(self) -> str:
-        return """You are a personal chef.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are a personal chef.
         The user will give you a list of ingredients they have left over in their house.
         Using the web search tool (web_fetch_search), search the web for recipes
         that can be made with the ingredients they have.
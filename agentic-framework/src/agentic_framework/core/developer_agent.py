@@ -1,8 +1,9 @@
+import functools
 from typing import Any, Sequence
 
 from langchain_core.tools import StructuredTool
 
-from agentic_framework.constants import BASE_DIR
+from agentic_framework.constants import BASE_DIR_STR
 from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
 from agentic_framework.registry import AgentRegistry
 from agentic_framework.tools import (
@@ -15,6 +16,22 @@ from agentic_framework.tools import (
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _developer_tools() -> tuple[StructuredTool, ...]:
+    """Build the codebase tools once per process; they hold no per-agent state."""
+    tools = (
+        CodeSearcher(BASE_DIR_STR),
+        FileFinderTool(BASE_DIR_STR),
+        StructureExplorerTool(BASE_DIR_STR),
+        FileOutlinerTool(BASE_DIR_STR),
+        FileFragmentReaderTool(BASE_DIR_STR),
+        FileEditorTool(BASE_DIR_STR),
+    )
+    return tuple(
+        StructuredTool.from_function(func=tool.invoke, name=tool.name, description=tool.description) for tool in tools
+    )
+
+
 @AgentRegistry.register("developer", mcp_servers=["webfetch"])
 class DeveloperAgent(LangGraphMCPAgent):
     """
@@ -22,9 +39,9 @@ class DeveloperAgent(LangGraphMCPAgent):
     Equipped with tools to search, structure, and read code, plus MCP capabilities.
     """
 
-    @property
-    def system_prompt(self) -> str:
-        return """You are a Principal Software Engineer assistant.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are a Principal Software Engineer assistant.
 Your goal is to help the user understand and maintain their codebase.
 
 ## AVAILABLE TOOLS
@@ -87,43 +104,4 @@ Always provide clear, concise explanations and suggest improvements when relevan
 """
 
     def local_tools(self) -> Sequence[Any]:
-        # Initialize tool instances with project root
-        searcher = CodeSearcher(str(BASE_DIR))
-        finder = FileFinderTool(str(BASE_DIR))
-        explorer = StructureExplorerTool(str(BASE_DIR))
-        outliner = FileOutlinerTool(str(BASE_DIR))
-        reader = FileFragmentReaderTool(str(BASE_DIR))
-        editor = FileEditorTool(str(BASE_DIR))
-
-        return [
-            StructuredTool.from_function(
-                func=searcher.invoke,
-                name=searcher.name,
-                description=searcher.description,
-            ),
-            StructuredTool.from_function(
-                func=finder.invoke,
-                name=finder.name,
-                description=finder.description,
-            ),
-            StructuredTool.from_function(
-                func=explorer.invoke,
-                name=explorer.name,
-                description=explorer.description,
-            ),
-            StructuredTool.from_function(
-                func=outliner.invoke,
-                name=outliner.name,
-                description=outliner.description,
-            ),
-            StructuredTool.from_function(
-                func=reader.invoke,
-                name=reader.name,
-                description=reader.description,
-            ),
-            StructuredTool.from_function(
-                func=editor.invoke,
-                name=editor.name,
-                description=editor.description,
-            ),
-        ]
+        return _developer_tools()
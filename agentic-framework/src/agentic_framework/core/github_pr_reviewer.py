@@ -1,25 +1,198 @@
 """GitHub PR Review Agent for automated code review using the GitHub API."""
 
+import functools
+import json
 import os
+import random
+import threading
 import time
-from typing import Any, Sequence
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Sequence
+from urllib.parse import parse_qs, urlsplit
 
 import requests
 from langchain_core.tools import StructuredTool
+from requests.adapters import HTTPAdapter
 
 from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
 from agentic_framework.registry import AgentRegistry
 
+# orjson is an optional speedup (``uv sync --extra orjson``) for multi-megabyte file and comment listings.
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _GITHUB_API_BASE = "https://api.github.com"
-_RETRYABLE_STATUS_CODES = frozenset({429, 503, 504})
+_RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+_RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
 _MAX_RETRIES = 3
+_MAX_BACKOFF = 30.0
+# Largest page size GitHub's list endpoints accept.
+_PER_PAGE = 100
+# Longest server-requested cooldown worth sleeping through; beyond it the response is returned as is.
+_MAX_RATE_LIMIT_WAIT = 60.0
+# Per-file patch size kept in get_pr_diff output; AGENTIC_MAX_PATCH_BYTES overrides it.
+_DEFAULT_MAX_PATCH_BYTES = 8192
+# Generated files whose diffs are large and carry nothing worth reviewing.
+_GENERATED_FILENAMES = frozenset(
+    {
+        "package-lock.json",
+        "npm-shrinkwrap.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "poetry.lock",
+        "uv.lock",
+        "Pipfile.lock",
+        "Cargo.lock",
+        "Gemfile.lock",
+        "composer.lock",
+        "go.sum",
+    }
+)
+
+# Epoch second at which each credential's exhausted primary rate limit resets, keyed by Authorization header.
+_RATE_LIMIT_RESETS: dict[str, float] = {}
+# Below this many remaining calls, requests are spread evenly over the time left until the reset.
+_LOW_QUOTA_THRESHOLD = 50
+# (remaining calls, reset epoch second) for each credential whose quota is running low.
+_LOW_QUOTAS: dict[str, tuple[int, float]] = {}
+# Epoch second of the latest request sent (or reserved) for each low-quota credential.
+_LAST_REQUEST_AT: dict[str, float] = {}
+# Guards _RATE_LIMIT_RESETS, _LOW_QUOTAS and _LAST_REQUEST_AT, which _executor() workers share.
+_QUOTA_LOCK = threading.Lock()
+
+# One keep-alive connection pool for every tool call, so a review pays for the TLS handshake once.
+# Retries are handled by _github_request, so the adapter itself never retries.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10, max_retries=0))
+
+# Last ETag, parsed body and Link relations per (Authorization header, URL) for read-only GETs, least
+# recently used first. GitHub answers a matching If-None-Match with 304, which does not count against
+# the primary rate limit.
+_ETAG_CACHE: OrderedDict[tuple[str, str], tuple[str, Any, dict[str, Any]]] = OrderedDict()
+_ETAG_CACHE_SIZE = 256
+_ETAG_LOCK = threading.Lock()
+
+# GETs currently on the wire, keyed like _ETAG_CACHE; identical concurrent GETs wait on the same Future.
+_INFLIGHT: dict[tuple[str, str], "Future[tuple[Any, dict[str, Any]]]"] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: bursts of up to ``capacity`` calls, then ``rate`` calls per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it has accrued if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (the balance may go negative) so concurrent callers queue up fairly.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Shared by all six tools: 80 requests/minute with bursts of 10 stays well below GitHub's primary
+# (5000/hour) and secondary (per-minute) limits.
+_RATE_LIMITER = _TokenBucket(rate=80 / 60, capacity=10)
+
+# Jitter source seeded from the OS, so forked worker processes do not retry in lockstep.
+_RANDOM = random.SystemRandom()
+
+
+def _server_retry_delay(headers: Mapping[str, str]) -> float | None:
+    """Return the seconds GitHub asks the client to wait, or None if it gave no hint.
+
+    Honors ``Retry-After`` (delta seconds or an HTTP date) and, when the quota is
+    exhausted (``X-RateLimit-Remaining: 0``), ``X-RateLimit-Reset`` (epoch seconds).
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    reset = headers.get("X-RateLimit-Reset")
+    if headers.get("X-RateLimit-Remaining") == "0" and reset:
+        try:
+            return max(0.0, float(reset) - time.time())
+        except ValueError:
+            pass
+    return None
+
+
+def _record_quota(limit_key: str, headers: Mapping[str, str]) -> None:
+    """Remember a credential's remaining quota from a response while it is below _LOW_QUOTA_THRESHOLD."""
+    try:
+        remaining = int(headers.get("X-RateLimit-Remaining", ""))
+        reset_at = float(headers.get("X-RateLimit-Reset", ""))
+    except (TypeError, ValueError):
+        return
+    with _QUOTA_LOCK:
+        if 0 < remaining < _LOW_QUOTA_THRESHOLD:
+            _LOW_QUOTAS[limit_key] = (remaining, reset_at)
+            _LAST_REQUEST_AT[limit_key] = max(_LAST_REQUEST_AT.get(limit_key, 0.0), time.time())
+        else:
+            _LOW_QUOTAS.pop(limit_key, None)
+
+
+def _pace_low_quota(limit_key: str) -> None:
+    """Sleep so that a credential's last few calls are spread until its quota resets.
+
+    With ``remaining`` calls left and ``reset_at - now`` seconds to go, requests are spaced
+    at least ``(reset_at - now) / remaining`` seconds apart (capped at _MAX_RATE_LIMIT_WAIT).
+    The send time is reserved under the lock, so concurrent callers queue up behind each other.
+    """
+    with _QUOTA_LOCK:
+        quota = _LOW_QUOTAS.get(limit_key)
+        if quota is None:
+            return
+        remaining, reset_at = quota
+        now = time.time()
+        if now >= reset_at:
+            del _LOW_QUOTAS[limit_key]
+            return
+        interval = (reset_at - now) / remaining
+        send_at = max(now, _LAST_REQUEST_AT.get(limit_key, 0.0) + interval)
+        delay = min(send_at - now, _MAX_RATE_LIMIT_WAIT)
+        _LAST_REQUEST_AT[limit_key] = now + delay
+    if delay > 0:
+        time.sleep(delay)
 
 
 def _github_request(method: str, url: str, **kwargs: Any) -> requests.Response:
-    """Make a GitHub API request with exponential backoff for transient errors.
+    """Make a GitHub API request with backoff for transient errors and rate limits.
 
-    Retries up to _MAX_RETRIES times on 429 (rate limited), 503, and 504 responses,
-    with delays of 1s, 2s between attempts (2**attempt seconds).
+    Retries up to _MAX_RETRIES times on 429 (rate limited), 502, 503, and 504 responses, on
+    403 responses that report an exhausted rate limit, and on connection errors and
+    timeouts. The delay is the one GitHub asks for (``Retry-After`` / ``X-RateLimit-Reset``)
+    plus up to 0.5s of jitter, or otherwise a "full jitter" backoff drawn uniformly from
+    [0, min(_MAX_BACKOFF, 2**attempt)] seconds. Requests for a credential whose quota is
+    known to be exhausted wait for the reset before being sent, and once fewer than
+    _LOW_QUOTA_THRESHOLD calls remain the rest are spread out until the reset.
 
     Args:
         method: HTTP method — "get" or "post".
@@ -29,26 +202,151 @@ def _github_request(method: str, url: str, **kwargs: Any) -> requests.Response:
     Returns:
         requests.Response from the last attempt.
     """
+    limit_key = str((kwargs.get("headers") or {}).get("Authorization", ""))
+    with _QUOTA_LOCK:
+        wait = _RATE_LIMIT_RESETS.get(limit_key, 0.0) - time.time()
+    if 0 < wait <= _MAX_RATE_LIMIT_WAIT:
+        time.sleep(wait + _RANDOM.uniform(0, 0.5))
+
     for attempt in range(_MAX_RETRIES):
-        if method == "get":
-            response = requests.get(url, **kwargs)
+        is_last_attempt = attempt == _MAX_RETRIES - 1
+        _pace_low_quota(limit_key)
+        _RATE_LIMITER.acquire()
+        try:
+            if method == "get":
+                response = _SESSION.get(url, **kwargs)
+            else:
+                response = _SESSION.post(url, **kwargs)
+        except _RETRYABLE_EXCEPTIONS:
+            if is_last_attempt:
+                raise
+            server_delay = None
         else:
-            response = requests.post(url, **kwargs)
-        if response.status_code not in _RETRYABLE_STATUS_CODES:
-            return response
-        if attempt < _MAX_RETRIES - 1:
-            time.sleep(2**attempt)
-    return response
-
-
-def _get_headers() -> dict[str, str]:
-    """Build GitHub API request headers from the GITHUB_TOKEN environment variable."""
-    token = os.environ.get("GITHUB_TOKEN", "")
-    return {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
+            server_delay = _server_retry_delay(response.headers)
+            with _QUOTA_LOCK:
+                if response.headers.get("X-RateLimit-Remaining") == "0" and server_delay is not None:
+                    _RATE_LIMIT_RESETS[limit_key] = time.time() + server_delay
+                else:
+                    _RATE_LIMIT_RESETS.pop(limit_key, None)
+            _record_quota(limit_key, response.headers)
+
+            rate_limited = response.status_code == 403 and server_delay is not None
+            retryable = response.status_code in _RETRYABLE_STATUS_CODES or rate_limited
+            too_long = server_delay is not None and server_delay > _MAX_RATE_LIMIT_WAIT
+            if not retryable or is_last_attempt or too_long:
+                return response
+        time.sleep(_retry_delay(attempt, server_delay))
+    raise AssertionError("unreachable: the last attempt always returns or raises")
+
+
+def _retry_delay(attempt: int, server_delay: float | None) -> float:
+    """Seconds to wait before the next attempt: the server's requested delay plus jitter, else full jitter."""
+    if server_delay is not None:
+        return server_delay + _RANDOM.uniform(0, 0.5)
+    return _RANDOM.uniform(0, min(_MAX_BACKOFF, 2**attempt))
+
+
+@functools.lru_cache(maxsize=1)
+def _executor() -> ThreadPoolExecutor:
+    """Return the thread pool used to overlap independent GitHub requests, created on first use."""
+    return ThreadPoolExecutor(max_workers=8, thread_name_prefix="github-api")
+
+
+def _github_get(url: str, headers: Mapping[str, str], **kwargs: Any) -> tuple[Any, dict[str, Any]]:
+    """GET a read-only GitHub resource and return its parsed JSON body and ``Link`` relations.
+
+    Revalidates previously fetched URLs with ``If-None-Match``; on ``304 Not Modified`` the
+    cached body is returned without downloading or parsing it again. A GET that is already
+    in flight for the same URL and credentials is not sent twice: later callers wait for
+    the first one's result (or exception).
+
+    Raises:
+        requests.HTTPError: If GitHub answers with an error status.
+    """
+    key = (headers.get("Authorization", ""), url)
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(key)
+        if pending is None:
+            future: Future[tuple[Any, dict[str, Any]]] = Future()
+            _INFLIGHT[key] = future
+    if pending is not None:
+        return pending.result()
+
+    try:
+        result = _fetch_get(key, url, headers, **kwargs)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+def _fetch_get(key: tuple[str, str], url: str, headers: Mapping[str, str], **kwargs: Any) -> tuple[Any, dict[str, Any]]:
+    with _ETAG_LOCK:
+        cached = _ETAG_CACHE.get(key)
+    if cached is not None:
+        headers = {**headers, "If-None-Match": cached[0]}
+    response = _github_request("get", url, headers=headers, **kwargs)
+    if cached is not None and response.status_code == 304:
+        with _ETAG_LOCK:
+            # Another worker may have evicted the entry since it was read.
+            if key in _ETAG_CACHE:
+                _ETAG_CACHE.move_to_end(key)
+        return cached[1], cached[2]
+    response.raise_for_status()
+    data = _json_loads(response.content)
+    links = response.links
+    etag = response.headers.get("ETag")
+    if etag:
+        with _ETAG_LOCK:
+            _ETAG_CACHE[key] = (etag, data, links)
+            _ETAG_CACHE.move_to_end(key)
+            if len(_ETAG_CACHE) > _ETAG_CACHE_SIZE:
+                _ETAG_CACHE.popitem(last=False)
+    return data, links
+
+
+def _github_get_json(url: str, headers: Mapping[str, str], **kwargs: Any) -> Any:
+    """GET a read-only GitHub resource and return its parsed JSON body (see _github_get)."""
+    return _github_get(url, headers, **kwargs)[0]
+
+
+def _github_get_all_pages(url: str, headers: Mapping[str, str], **kwargs: Any) -> list[Any]:
+    """GET every page of a paginated GitHub listing and return the concatenated items.
+
+    Pages hold _PER_PAGE items. The first response's ``Link: rel="last"`` gives the page
+    count, and the remaining pages are fetched concurrently, then merged in page order.
+    """
+    first_url = f"{url}?per_page={_PER_PAGE}"
+    items, links = _github_get(first_url, headers, **kwargs)
+    last_url = links.get("last", {}).get("url")
+    last_page = int(parse_qs(urlsplit(last_url).query)["page"][0]) if last_url else 1
+    page_urls = [f"{first_url}&page={page}" for page in range(2, last_page + 1)]
+    items = list(items)
+    for page_items in _executor().map(lambda page_url: _github_get_json(page_url, headers, **kwargs), page_urls):
+        items.extend(page_items)
+    return items
+
+
+@functools.lru_cache(maxsize=4)
+def _headers_for_token(token: str) -> Mapping[str, str]:
+    """Build the (read-only) GitHub API request headers for ``token``, once per token."""
+    return MappingProxyType(
+        {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+    )
+
+
+def _get_headers() -> Mapping[str, str]:
+    """Return GitHub API request headers for the current GITHUB_TOKEN environment variable."""
+    return _headers_for_token(os.environ.get("GITHUB_TOKEN", ""))
 
 
 def _check_token() -> str | None:
@@ -64,6 +362,41 @@ def _check_token() -> str | None:
     return None
 
 
+def _max_patch_bytes() -> int:
+    """Return the per-file patch size limit, overridable with AGENTIC_MAX_PATCH_BYTES."""
+    try:
+        return max(0, int(os.environ.get("AGENTIC_MAX_PATCH_BYTES", _DEFAULT_MAX_PATCH_BYTES)))
+    except ValueError:
+        return _DEFAULT_MAX_PATCH_BYTES
+
+
+def _clip_patch(patch: str, limit: int) -> str:
+    """Cut ``patch`` to at most ``limit`` UTF-8 bytes, noting how much was dropped."""
+    encoded = patch.encode("utf-8")
+    if len(encoded) <= limit:
+        return patch
+    kept = encoded[:limit].decode("utf-8", errors="ignore")
+    return f"{kept}\n…[truncated {len(encoded) - limit} bytes]"
+
+
+def _format_file_diff(file: dict[str, Any], max_patch_bytes: int = _DEFAULT_MAX_PATCH_BYTES) -> str:
+    """Render one changed file of get_pr_diff's output as a single string.
+
+    Patches of generated files (lockfiles, checksums) are omitted and the rest are clipped
+    to ``max_patch_bytes``, since every byte is re-tokenized on each later model call.
+    """
+    filename = file.get("filename", "")
+    section = (
+        f"\n\n--- {filename} [{file.get('status', '')}] +{file.get('additions', 0)}/-{file.get('deletions', 0)} ---"
+    )
+    patch = file.get("patch")
+    if not patch:
+        return section
+    if filename.rsplit("/", 1)[-1] in _GENERATED_FILENAMES:
+        return f"{section}\n…[patch omitted for generated file]"
+    return f"{section}\n{_clip_patch(patch, max_patch_bytes)}"
+
+
 def get_pr_diff(repo: str, pr_number: int) -> str:
     """Fetch the file diffs for a GitHub pull request.
 
@@ -80,24 +413,31 @@ def get_pr_diff(repo: str, pr_number: int) -> str:
         return err
     try:
         url = f"{_GITHUB_API_BASE}/repos/{repo}/pulls/{pr_number}/files"
-        response = _github_request("get", url, headers=_get_headers(), timeout=30)
-        response.raise_for_status()
-        files: list[dict[str, Any]] = response.json()
-        lines = [f"PR #{pr_number} diff for {repo} ({len(files)} file(s) changed):"]
-        for f in files:
-            filename = f.get("filename", "")
-            status = f.get("status", "")
-            additions = f.get("additions", 0)
-            deletions = f.get("deletions", 0)
-            patch = f.get("patch", "")
-            lines.append(f"\n--- {filename} [{status}] +{additions}/-{deletions} ---")
-            if patch:
-                lines.append(str(patch))
-        return "\n".join(lines)
+        files: list[dict[str, Any]] = _github_get_all_pages(url, headers=_get_headers(), timeout=30)
+        header = f"PR #{pr_number} diff for {repo} ({len(files)} file(s) changed):"
+        max_patch_bytes = _max_patch_bytes()
+        return header + "".join(_format_file_diff(file, max_patch_bytes) for file in files)
     except Exception as exc:
         return f"Error fetching PR diff for {repo}#{pr_number}: {exc}"
 
 
+def _format_review_comment(comment: dict[str, Any]) -> str:
+    """Render one inline review comment of get_pr_comments' output."""
+    line = comment.get("line") or comment.get("original_line", "")
+    return (
+        f"  id={comment.get('id', '')} author={comment.get('user', {}).get('login', 'unknown')} "
+        f"file={comment.get('path', '')} line={line}\n  {comment.get('body', '')}"
+    )
+
+
+def _format_issue_comment(comment: dict[str, Any]) -> str:
+    """Render one general (issue) comment of get_pr_comments' output."""
+    return (
+        f"  id={comment.get('id', '')} author={comment.get('user', {}).get('login', 'unknown')}\n"
+        f"  {comment.get('body', '')}"
+    )
+
+
 def get_pr_comments(repo: str, pr_number: int) -> str:
     """Fetch review and general comments for a pull request.
 
@@ -117,35 +457,22 @@ def get_pr_comments(repo: str, pr_number: int) -> str:
         review_url = f"{_GITHUB_API_BASE}/repos/{repo}/pulls/{pr_number}/comments"
         issue_url = f"{_GITHUB_API_BASE}/repos/{repo}/issues/{pr_number}/comments"
 
-        review_resp = _github_request("get", review_url, headers=headers, timeout=30)
-        review_resp.raise_for_status()
-        review_comments: list[dict[str, Any]] = review_resp.json()
-
-        issue_resp = _github_request("get", issue_url, headers=headers, timeout=30)
-        issue_resp.raise_for_status()
-        issue_comments: list[dict[str, Any]] = issue_resp.json()
+        # The two listings are independent: fetch review comments in the pool while this thread gets the rest.
+        review_future = _executor().submit(_github_get_json, review_url, headers=headers, timeout=30)
+        issue_comments: list[dict[str, Any]] = _github_get_json(issue_url, headers=headers, timeout=30)
+        review_comments: list[dict[str, Any]] = review_future.result()
 
         lines: list[str] = [f"Comments for PR #{pr_number} in {repo}:"]
 
         if review_comments:
             lines.append("\n[Inline Review Comments]")
-            for c in review_comments:
-                user = str(c.get("user", {}).get("login", "unknown"))
-                cid = str(c.get("id", ""))
-                path = str(c.get("path", ""))
-                line = str(c.get("line") or c.get("original_line", ""))
-                body = str(c.get("body", ""))
-                lines.append(f"  id={cid} author={user} file={path} line={line}\n  {body}")
+            lines.extend(map(_format_review_comment, review_comments))
         else:
             lines.append("\n[Inline Review Comments] None")
 
         if issue_comments:
             lines.append("\n[General Comments]")
-            for c in issue_comments:
-                user = str(c.get("user", {}).get("login", "unknown"))
-                cid = str(c.get("id", ""))
-                body = str(c.get("body", ""))
-                lines.append(f"  id={cid} author={user}\n  {body}")
+            lines.extend(map(_format_issue_comment, issue_comments))
         else:
             lines.append("\n[General Comments] None")
 
@@ -262,9 +589,7 @@ def get_pr_metadata(repo: str, pr_number: int) -> str:
         return err
     try:
         url = f"{_GITHUB_API_BASE}/repos/{repo}/pulls/{pr_number}"
-        response = _github_request("get", url, headers=_get_headers(), timeout=30)
-        response.raise_for_status()
-        data: dict[str, Any] = response.json()
+        data: dict[str, Any] = _github_get_json(url, headers=_get_headers(), timeout=30)
         title = str(data.get("title", ""))
         description = str(data.get("body") or "")
         author = str(data.get("user", {}).get("login", "unknown"))
@@ -290,6 +615,59 @@ def get_pr_metadata(repo: str, pr_number: int) -> str:
         return f"Error fetching PR metadata for {repo}#{pr_number}: {exc}"
 
 
+@functools.lru_cache(maxsize=1)
+def _github_tools() -> tuple[StructuredTool, ...]:
+    """Build the GitHub StructuredTools once per process; they hold no per-agent state."""
+    return (
+        StructuredTool.from_function(
+            func=get_pr_metadata,
+            name="get_pr_metadata",
+            description=(
+                "Fetch pull request metadata: title, description, author, base branch, "
+                "head SHA, and change statistics. Always call this first to get the head SHA "
+                "before posting inline comments."
+            ),
+        ),
+        StructuredTool.from_function(
+            func=get_pr_diff,
+            name="get_pr_diff",
+            description=(
+                "Fetch the file diffs for a GitHub pull request. Returns filename, status, "
+                "additions/deletions, and patch content for each changed file."
+            ),
+        ),
+        StructuredTool.from_function(
+            func=get_pr_comments,
+            name="get_pr_comments",
+            description=(
+                "Fetch both inline review comments and top-level general comments for a pull "
+                "request. Returns comment id, author, body, file, and line number."
+            ),
+        ),
+        StructuredTool.from_function(
+            func=post_review_comment,
+            name="post_review_comment",
+            description=(
+                "Post an inline code review comment on a specific file and line number. "
+                "Requires commit_sha — use get_pr_metadata to retrieve the head SHA first."
+            ),
+        ),
+        StructuredTool.from_function(
+            func=post_general_comment,
+            name="post_general_comment",
+            description=(
+                "Post a top-level (general) comment on a pull request. Use for overall "
+                "summaries or replies to general comment threads."
+            ),
+        ),
+        StructuredTool.from_function(
+            func=reply_to_review_comment,
+            name="reply_to_review_comment",
+            description=("Reply to an existing inline review comment thread. Use the comment id from get_pr_comments."),
+        ),
+    )
+
+
 @AgentRegistry.register("github-pr-reviewer")
 class GitHubPRReviewerAgent(LangGraphMCPAgent):
     """GitHub PR Review Agent that reads diffs and posts inline and summary review comments.
@@ -304,9 +682,9 @@ class GitHubPRReviewerAgent(LangGraphMCPAgent):
         bin/agent.sh github-pr-reviewer -i "Read comments on PR #42 in owner/repo and reply to unanswered questions"
     """
 
-    @property
-    def system_prompt(self) -> str:
-        return """You are an expert code reviewer with deep knowledge of software engineering best practices.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are an expert code reviewer with deep knowledge of software engineering best practices.
 
 ## Your Review Process
 
@@ -364,53 +742,4 @@ Post a `post_general_comment` at the end of every full review with this structur
 
     def local_tools(self) -> Sequence[Any]:
         """Return the six GitHub API tools available to this agent."""
-        return [
-            StructuredTool.from_function(
-                func=get_pr_metadata,
-                name="get_pr_metadata",
-                description=(
-                    "Fetch pull request metadata: title, description, author, base branch, "
-                    "head SHA, and change statistics. Always call this first to get the head SHA "
-                    "before posting inline comments."
-                ),
-            ),
-            StructuredTool.from_function(
-                func=get_pr_diff,
-                name="get_pr_diff",
-                description=(
-                    "Fetch the file diffs for a GitHub pull request. Returns filename, status, "
-                    "additions/deletions, and patch content for each changed file."
-                ),
-            ),
-            StructuredTool.from_function(
-                func=get_pr_comments,
-                name="get_pr_comments",
-                description=(
-                    "Fetch both inline review comments and top-level general comments for a pull "
-                    "request. Returns comment id, author, body, file, and line number."
-                ),
-            ),
-            StructuredTool.from_function(
-                func=post_review_comment,
-                name="post_review_comment",
-                description=(
-                    "Post an inline code review comment on a specific file and line number. "
-                    "Requires commit_sha — use get_pr_metadata to retrieve the head SHA first."
-                ),
-            ),
-            StructuredTool.from_function(
-                func=post_general_comment,
-                name="post_general_comment",
-                description=(
-                    "Post a top-level (general) comment on a pull request. Use for overall "
-                    "summaries or replies to general comment threads."
-                ),
-            ),
-            StructuredTool.from_function(
-                func=reply_to_review_comment,
-                name="reply_to_review_comment",
-                description=(
-                    "Reply to an existing inline review comment thread. Use the comment id from get_pr_comments."
-                ),
-            ),
-        ]
+        return _github_tools()
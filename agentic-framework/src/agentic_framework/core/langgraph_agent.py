@@ -1,18 +1,44 @@
-from abc import abstractmethod
-from typing import Any, Dict, List, Sequence, Union
+import asyncio
+import json
+import re
+import uuid
+from collections import OrderedDict
+from typing import Any, ClassVar, Dict, List, Sequence, Union
 
 from langchain.agents import create_agent
 from langchain_core.messages import BaseMessage, HumanMessage
-from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 
 from agentic_framework.constants import _create_model, get_default_model
-from agentic_framework.interfaces.base import Agent
+from agentic_framework.core.checkpoint import BoundedInMemorySaver
+from agentic_framework.interfaces.base import Agent, _extract_text
 from agentic_framework.mcp import MCPProvider
 
 
 class LangGraphMCPAgent(Agent):
     """Reusable base class for LangGraph agents with optional MCP tools."""
 
+    __slots__ = (
+        "_model_name",
+        "_temperature",
+        "_model",
+        "_mcp_provider",
+        "_initial_mcp_tools",
+        "_default_config",
+        "_tools",
+        "_graph",
+        "_init_lock",
+        "_checkpointer",
+    )
+
+    # Built once with the class, so every instance (and every graph) shares one string.
+    SYSTEM_PROMPT: ClassVar[str]
+    # Compiled graphs of agents without MCP tools, least recently used last. Keys hold the model
+    # and tool objects' ids; the cached graph keeps those objects alive, so the ids stay unique.
+    # Graphs with MCP tools are never shared, as those tools may belong to a closed tool_session().
+    _GRAPH_CACHE: ClassVar["OrderedDict[tuple[Any, ...], Any]"] = OrderedDict()
+    _GRAPH_CACHE_SIZE: ClassVar[int] = 32
+
     def __init__(
         self,
         model_name: str | None = None,
@@ -20,68 +46,172 @@ class LangGraphMCPAgent(Agent):
         mcp_provider: MCPProvider | None = None,
         initial_mcp_tools: List[Any] | None = None,
         thread_id: str = "1",
+        checkpointer: BaseCheckpointSaver | None = None,
         **kwargs: Any,
     ):
+        # Checked here rather than when the class is defined, so intermediate base classes need no prompt.
+        if type(self).system_prompt is LangGraphMCPAgent.system_prompt and not hasattr(self, "SYSTEM_PROMPT"):
+            raise TypeError(f"{type(self).__name__} must set SYSTEM_PROMPT or override the system_prompt property.")
         if model_name is None:
             model_name = get_default_model()
-        self.model = _create_model(model_name, temperature)
+        self._model_name = model_name
+        self._temperature = temperature
+        self._model: Any = None
         self._mcp_provider = mcp_provider
         self._initial_mcp_tools = initial_mcp_tools
-        self._thread_id = thread_id
-        self._tools: List[Any] = list(self.local_tools())
+        # Built once; LangGraph only reads the config it is given.
+        self._default_config: Dict[str, Any] = {"configurable": {"thread_id": thread_id}}
+        self._tools: tuple[Any, ...] = tuple(self.local_tools())
         self._graph: Any | None = None
+        self._init_lock = asyncio.Lock()
+        # Agents that use distinct thread ids (like the travel coordinator's specialists) may share one.
+        self._checkpointer = checkpointer if checkpointer is not None else BoundedInMemorySaver()
+
+    @property
+    def model(self) -> Any:
+        """The chat model, created on first use so agents that never run never build a client."""
+        if self._model is None:
+            self._model = _create_model(self._model_name, self._temperature)
+        return self._model
 
     @property
-    @abstractmethod
     def system_prompt(self) -> str:
-        """Prompt that defines agent behavior."""
+        """Prompt that defines agent behavior; subclasses set SYSTEM_PROMPT or override this."""
+        return self.SYSTEM_PROMPT
 
     def local_tools(self) -> Sequence[Any]:
         """Built-in tools available even without MCP."""
-        return []
+        return ()
 
-    async def _load_mcp_tools(self) -> List[Any]:
+    async def _load_mcp_tools(self) -> Sequence[Any]:
+        # Only read to extend self._tools, so the caller's list is returned as is rather than copied.
         if self._initial_mcp_tools is not None:
-            return list(self._initial_mcp_tools)
+            return self._initial_mcp_tools
         if self._mcp_provider is None:
-            return []
+            return ()
         return await self._mcp_provider.get_tools()
 
-    async def _ensure_initialized(self) -> None:
+    async def _ensure_initialized(self) -> Any:
+        """Build the agent graph on first use and return it."""
         if self._graph is not None:
-            return
-
-        self._tools.extend(await self._load_mcp_tools())
-        self._graph = create_agent(
-            model=self.model,
-            tools=self._tools,
-            system_prompt=self.system_prompt,
-            checkpointer=InMemorySaver(),
+            return self._graph
+
+        # Concurrent first runs would otherwise each load MCP tools and build a graph.
+        async with self._init_lock:
+            if self._graph is None:
+                mcp_tools = await self._load_mcp_tools()
+                tools = (*self._tools, *mcp_tools)
+                graph = self._compile_graph(tools, shareable=not mcp_tools)
+                # Conversation state stays per instance; only the graph structure is shared.
+                self._graph = graph.copy(update={"checkpointer": self._checkpointer})
+                # Set only once the graph exists, so a failed build that is retried starts from the local tools.
+                self._tools = tools
+            return self._graph
+
+    def _compile_graph(self, tools: tuple[Any, ...], shareable: bool) -> Any:
+        """Return the compiled graph for ``tools``, reusing a cached one when ``shareable``."""
+        if not shareable:
+            return create_agent(model=self.model, tools=tools, system_prompt=self.system_prompt)
+        key = (
+            type(self),
+            self._mcp_provider,
+            id(self.model),
+            self.system_prompt,
+            tuple(map(id, tools)),
         )
+        graph = self._GRAPH_CACHE.get(key)
+        if graph is not None:
+            self._GRAPH_CACHE.move_to_end(key)
+            return graph
+        graph = create_agent(model=self.model, tools=tools, system_prompt=self.system_prompt)
+        self._GRAPH_CACHE[key] = graph
+        if len(self._GRAPH_CACHE) > self._GRAPH_CACHE_SIZE:
+            self._GRAPH_CACHE.popitem(last=False)
+        return graph
 
     def _normalize_messages(self, input_data: Union[str, List[BaseMessage]]) -> List[BaseMessage]:
         if isinstance(input_data, str):
             return [HumanMessage(content=input_data)]
         return input_data
 
-    def _default_config(self) -> Dict[str, Any]:
-        return {"configurable": {"thread_id": self._thread_id}}
-
     async def run(
         self,
         input_data: Union[str, List[BaseMessage]],
         config: Dict[str, Any] | None = None,
     ) -> Union[str, BaseMessage]:
-        await self._ensure_initialized()
-
-        if self._graph is None:
-            raise RuntimeError("Agent graph failed to initialize.")
-
-        result = await self._graph.ainvoke(
+        graph = await self._ensure_initialized()
+        result = await graph.ainvoke(
             {"messages": self._normalize_messages(input_data)},
-            config=config or self._default_config(),
+            config=config or self._default_config,
         )
-        return str(result["messages"][-1].content)
+        return _extract_text(result["messages"][-1])
 
-    def get_tools(self) -> List[Any]:
-        return list(self._tools)
+    async def run_batch(
+        self,
+        inputs: Sequence[Union[str, List[BaseMessage]]],
+        config: Dict[str, Any] | None = None,
+    ) -> List[str]:
+        """Run several inputs through one graph.abatch() call.
+
+        Each input gets its own conversation thread (the base thread ID suffixed with its
+        index) so concurrent runs do not interleave in the checkpointer.
+        """
+        graph = await self._ensure_initialized()
+        results = await graph.abatch(
+            [{"messages": self._normalize_messages(input_data)} for input_data in inputs],
+            config=[self._batch_item_config(config, index) for index in range(len(inputs))],
+        )
+        return [_extract_text(result["messages"][-1]) for result in results]
+
+    async def run_multi(self, inputs: List[str], config: Dict[str, Any] | None = None) -> List[str]:
+        """Answer several independent string requests with one agent run.
+
+        The requests are sent as one numbered message and the model is asked for a JSON array
+        with one answer per request, so the system prompt and round-trip are paid once instead
+        of per input. If the reply is not such an array, the inputs are answered separately
+        through run_batch(). The combined run uses a throwaway thread so the caller's
+        conversation history is left untouched.
+        """
+        if len(inputs) < 2:
+            return await self.run_batch(inputs, config=config)
+        reply = await self.run(_multi_request_prompt(inputs), config=self._multi_run_config(config))
+        answers = _parse_multi_reply(str(reply), len(inputs))
+        if answers is None:
+            return await self.run_batch(inputs, config=config)
+        return answers
+
+    def _batch_item_config(self, config: Dict[str, Any] | None, index: int) -> Dict[str, Any]:
+        config = config or self._default_config
+        configurable = dict(config.get("configurable", {}))
+        configurable["thread_id"] = f"{configurable.get('thread_id', '1')}:{index}"
+        return {**config, "configurable": configurable}
+
+    def _multi_run_config(self, config: Dict[str, Any] | None) -> Dict[str, Any]:
+        config = config or self._default_config
+        configurable = dict(config.get("configurable", {}))
+        configurable["thread_id"] = f"{configurable.get('thread_id', '1')}:multi:{uuid.uuid4().hex}"
+        return {**config, "configurable": configurable}
+
+    def get_tools(self) -> tuple[Any, ...]:
+        return self._tools
+
+
+def _multi_request_prompt(inputs: List[str]) -> str:
+    numbered = "\n\n".join(f"Request {number}:\n{text}" for number, text in enumerate(inputs, 1))
+    return (
+        f"Answer each of the following {len(inputs)} independent requests.\n\n{numbered}\n\n"
+        f"Reply with only a JSON array of {len(inputs)} strings, where element i is the complete "
+        "answer to request i."
+    )
+
+
+def _parse_multi_reply(reply: str, count: int) -> List[str] | None:
+    """Return the answers in a run_multi reply, or None if it is not a JSON array of ``count`` strings."""
+    text = re.sub(r"^```(?:json)?\s*|\s*```$", "", reply.strip())
+    try:
+        answers = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(answers, list) and len(answers) == count and all(isinstance(answer, str) for answer in answers):
+        return answers
+    return None
@@ -0,0 +1,53 @@
+"""In-process cache for deterministic LLM responses."""
+
+import hashlib
+import json
+from collections import OrderedDict
+
+
+class LLMCache:
+    """LRU cache of LLM responses keyed on a SHA-256 hash of the provider, model and prompt.
+
+    Only deterministic calls (temperature 0) should be cached; callers decide when that holds.
+    ``hits`` and ``misses`` count lookups since the cache was created or last cleared.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def make_key(provider: str, model_name: str, system_prompt: str, prompt: str) -> str:
+        """Return the cache key for a prompt sent to a provider's model."""
+        payload = json.dumps(
+            {"provider": provider, "model": model_name, "system": system_prompt, "prompt": prompt}, sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or None on a miss."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,10 +1,11 @@
-from typing import Any, Dict, List, Union
+from typing import Any, ClassVar, Dict, List, Union, cast
 
 from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
 
-from agentic_framework.constants import _create_model, get_default_model
-from agentic_framework.interfaces.base import Agent
+from agentic_framework.constants import _create_model, detect_provider, get_default_model
+from agentic_framework.core.llm_cache import LLMCache
+from agentic_framework.interfaces.base import Agent, _extract_text
 from agentic_framework.registry import AgentRegistry
 
 
@@ -13,16 +14,54 @@ class SimpleAgent(Agent):
     """
     A simple agent implementation using LangChain.
     No MCP access (mcp_servers=None in registry).
+    With ``cache_responses=True`` and temperature 0, responses are cached per provider,
+    model and input across instances.
     """
 
-    def __init__(self, model_name: str | None = None, temperature: float = 0.0, **kwargs: Any) -> None:
+    __slots__ = ("model_name", "temperature", "cache_responses", "prompt", "_model", "_chain")
+
+    SYSTEM_PROMPT = "You are a helpful assistant."
+    # Built once with the class; every instance only pipes it into its own model.
+    PROMPT: ClassVar[ChatPromptTemplate] = ChatPromptTemplate.from_messages(
+        [("system", SYSTEM_PROMPT), ("user", "{input}")]
+    )
+    response_cache: ClassVar[LLMCache] = LLMCache()
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        temperature: float = 0.0,
+        cache_responses: bool = False,
+        **kwargs: Any,
+    ) -> None:
         if model_name is None:
             model_name = get_default_model()
-        self.model = _create_model(model_name, temperature)
-        self.prompt = ChatPromptTemplate.from_messages(
-            [("system", "You are a helpful assistant."), ("user", "{input}")]
-        )
-        self.chain = self.prompt | self.model
+        self.model_name = model_name
+        self.temperature = temperature
+        self.cache_responses = cache_responses
+        self.prompt = self.PROMPT
+        self._model: Any = None
+        self._chain: Any = None
+
+    @property
+    def model(self) -> Any:
+        """The chat model, created on first use so agents that never run never build a client."""
+        if self._model is None:
+            self._model = _create_model(self.model_name, self.temperature)
+        return self._model
+
+    @property
+    def chain(self) -> Any:
+        """The ``prompt | model`` pipeline, built on first use."""
+        if self._chain is None:
+            self._chain = self.prompt | self.model
+        return self._chain
+
+    def _cache_key(self, input_data: str) -> str | None:
+        """Return the response cache key for ``input_data``, or None if responses are not cached."""
+        if not self.cache_responses or self.temperature != 0:
+            return None
+        return LLMCache.make_key(detect_provider(), self.model_name, self.SYSTEM_PROMPT, input_data)
 
     async def run(
         self,
@@ -33,10 +72,37 @@ class SimpleAgent(Agent):
         Run the agent with the given input string.
         """
         if isinstance(input_data, str):
+            cache_key = self._cache_key(input_data)
+            if cache_key is not None:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
             response = await self.chain.ainvoke({"input": input_data})
-            return str(response.content)
+            content = _extract_text(response)
+            if cache_key is not None:
+                self.response_cache.set(cache_key, content)
+            return content
 
         raise NotImplementedError("SimpleAgent currently only supports string input.")
 
-    def get_tools(self) -> List[Any]:
-        return []
+    async def run_batch(self, inputs: List[str], config: Dict[str, Any] | None = None) -> List[str]:
+        """
+        Run the agent on several input strings with a single batched model call.
+        Cached responses are reused; only the misses are sent to the model.
+        """
+        keys = [self._cache_key(text) for text in inputs]
+        results: List[str | None] = [self.response_cache.get(key) if key is not None else None for key in keys]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            responses = await self.chain.abatch([{"input": inputs[index]} for index in pending], config=config)
+            for index, response in zip(pending, responses):
+                content = _extract_text(response)
+                key = keys[index]
+                if key is not None:
+                    self.response_cache.set(key, content)
+                results[index] = content
+        return cast(List[str], results)
+
+    def get_tools(self) -> tuple[Any, ...]:
+        return ()
@@ -6,9 +6,9 @@ from agentic_framework.registry import AgentRegistry
 class TravelAgent(LangGraphMCPAgent):
     """Travel assistant that relies on flight-search MCP tools."""
 
-    @property
-    def system_prompt(self) -> str:
-        return """You are a helpful travel agent.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are a helpful travel agent.
         The user will give you the origin, destination and a date.
         Using the Kiwi MCP server, search for flights to the destination
         from the user's origin.
@@ -1,9 +1,9 @@
-from copy import deepcopy
+import asyncio
 from typing import Any, Dict, List
 
 from langchain_core.messages import BaseMessage
 
-from agentic_framework.constants import DEFAULT_MODEL
+from agentic_framework.core.checkpoint import BoundedInMemorySaver
 from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
 from agentic_framework.interfaces.base import Agent
 from agentic_framework.mcp import MCPProvider
@@ -11,9 +11,9 @@ from agentic_framework.registry import AgentRegistry
 
 
 class FlightSpecialistAgent(LangGraphMCPAgent):
-    @property
-    def system_prompt(self) -> str:
-        return """You are a flight specialist.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are a flight specialist.
         Prefer tools that provide flight search data (e.g. Kiwi MCP) and return:
         - candidate outbound/return options
         - price, duration, number of stops
@@ -22,9 +22,9 @@ class FlightSpecialistAgent(LangGraphMCPAgent):
 
 
 class CityIntelAgent(LangGraphMCPAgent):
-    @property
-    def system_prompt(self) -> str:
-        return """You are a destination intelligence specialist.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are a destination intelligence specialist.
         Use web retrieval tools (e.g. web-fetch MCP) to extract practical travel facts:
         - local transport options
         - expected weather in the period requested
@@ -34,9 +34,9 @@ class CityIntelAgent(LangGraphMCPAgent):
 
 
 class TravelReviewerAgent(LangGraphMCPAgent):
-    @property
-    def system_prompt(self) -> str:
-        return """You are a senior travel coordinator.
+    __slots__ = ()
+
+    SYSTEM_PROMPT = """You are a senior travel coordinator.
         You receive analyses from flight and destination specialists.
         Reconcile conflicts, call out assumptions, and produce a final itinerary brief.
         Output sections in this order:
@@ -53,9 +53,11 @@ class TravelReviewerAgent(LangGraphMCPAgent):
 class TravelCoordinatorAgent(Agent):
     """Coordinator example: 3 specialist agents + 2 MCP servers."""
 
+    __slots__ = ("_thread_id", "_flight", "_city", "_reviewer", "_specialists", "_mcp_provider", "_prewarm_lock")
+
     def __init__(
         self,
-        model_name: str = DEFAULT_MODEL,
+        model_name: str | None = None,
         temperature: float = 0.2,
         mcp_provider: MCPProvider | None = None,
         initial_mcp_tools: List[Any] | None = None,
@@ -67,24 +69,47 @@ class TravelCoordinatorAgent(Agent):
             "temperature": temperature,
             "mcp_provider": mcp_provider,
             "initial_mcp_tools": initial_mcp_tools,
+            # The stages use distinct thread ids, so one saver holds all three conversations.
+            "checkpointer": BoundedInMemorySaver(),
             **kwargs,
         }
+        self._thread_id = thread_id
         self._flight = FlightSpecialistAgent(thread_id=f"{thread_id}:flight", **shared_kwargs)
         self._city = CityIntelAgent(thread_id=f"{thread_id}:city", **shared_kwargs)
         self._reviewer = TravelReviewerAgent(thread_id=f"{thread_id}:review", **shared_kwargs)
         self._specialists = [self._flight, self._city, self._reviewer]
+        # Only needed when the specialists would otherwise each fetch MCP tools themselves.
+        self._mcp_provider = mcp_provider if initial_mcp_tools is None else None
+        self._prewarm_lock = asyncio.Lock()
+
+    async def _prewarm(self) -> None:
+        """Load MCP tools once and hand the same list to every specialist before it first runs."""
+        if self._mcp_provider is None:
+            return
+        async with self._prewarm_lock:
+            if self._mcp_provider is None:
+                return
+            tools = await self._mcp_provider.get_tools()
+            for specialist in self._specialists:
+                specialist._initial_mcp_tools = tools
+            self._mcp_provider = None
 
     @staticmethod
     def _stage_config(config: Dict[str, Any] | None, suffix: str) -> Dict[str, Any] | None:
         if config is None:
             return None
 
-        stage_config = deepcopy(config)
-        configurable = stage_config.setdefault("configurable", {})
+        # Only "configurable" is changed, so the rest (callbacks and the like) is shared, not copied.
+        configurable = dict(config.get("configurable") or {})
         thread_id = configurable.get("thread_id")
         if isinstance(thread_id, str):
             configurable["thread_id"] = f"{thread_id}:{suffix}"
-        return stage_config
+        return {**config, "configurable": configurable}
+
+    def _batch_item_config(self, config: Dict[str, Any] | None, index: int) -> Dict[str, Any]:
+        configurable = dict((config or {}).get("configurable") or {})
+        configurable["thread_id"] = f"{configurable.get('thread_id', self._thread_id)}:{index}"
+        return {**(config or {}), "configurable": configurable}
 
     async def run(
         self,
@@ -94,17 +119,17 @@ class TravelCoordinatorAgent(Agent):
         if not isinstance(input_data, str):
             raise NotImplementedError("TravelCoordinatorAgent currently supports string input only.")
 
-        flight_report = await self._flight.run(
-            f"User request:\n{input_data}\n\nProvide flight recommendations.",
-            config=self._stage_config(config, "flight"),
-        )
-        city_report = await self._city.run(
-            "User request:\n"
-            f"{input_data}\n\n"
-            "Flight specialist report:\n"
-            f"{flight_report}\n\n"
-            "Now provide destination intelligence that complements the flight options.",
-            config=self._stage_config(config, "city"),
+        await self._prewarm()
+        # Destination facts depend only on the request, so both specialists run concurrently.
+        flight_report, city_report = await asyncio.gather(
+            self._flight.run(
+                f"User request:\n{input_data}\n\nProvide flight recommendations.",
+                config=self._stage_config(config, "flight"),
+            ),
+            self._city.run(
+                f"User request:\n{input_data}\n\nProvide destination intelligence for this trip.",
+                config=self._stage_config(config, "city"),
+            ),
         )
         final_brief = await self._reviewer.run(
             "User request:\n"
@@ -118,8 +143,5 @@ class TravelCoordinatorAgent(Agent):
         )
         return str(final_brief)
 
-    def get_tools(self) -> List[Any]:
-        all_tools: List[Any] = []
-        for specialist in self._specialists:
-            all_tools.extend(specialist.get_tools())
-        return all_tools
+    def get_tools(self) -> tuple[Any, ...]:
+        return tuple(tool for specialist in self._specialists for tool in specialist.get_tools())
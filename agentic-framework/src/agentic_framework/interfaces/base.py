@@ -1,11 +1,17 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from langchain_core.messages import BaseMessage
 
 
 class Agent(ABC):
-    """Abstract Base Class for an Agent."""
+    """Abstract Base Class for an Agent.
+
+    Subclasses declare ``__slots__`` so per-request agent instances carry no ``__dict__``.
+    """
+
+    __slots__ = ()
 
     @abstractmethod
     async def run(
@@ -17,10 +23,68 @@ class Agent(ABC):
         pass
 
     @abstractmethod
-    def get_tools(self) -> List[Any]:
-        """Return available tools for this agent."""
+    def get_tools(self) -> Sequence[Any]:
+        """Return available tools for this agent (an immutable tuple in the built-in agents)."""
         pass
 
+    async def run_batch_async(
+        self,
+        inputs: Sequence[Union[str, List[BaseMessage]]],
+        *,
+        max_concurrency: int = 10,
+        rpm: float | None = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> List[Union[str, BaseMessage, BaseException]]:
+        """Run the agent on every input concurrently, at most ``max_concurrency`` at a time.
+
+        ``rpm`` additionally spaces run starts evenly so no more than ``rpm`` begin per minute.
+        Results keep input order; a failed run yields its exception instead of cancelling the rest.
+
+        Raises:
+            ValueError: If ``max_concurrency`` is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        interval = 60.0 / rpm if rpm else 0.0
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+
+        async def run_one(index: int, input_data: Union[str, List[BaseMessage]]) -> Union[str, BaseMessage]:
+            nonlocal next_start
+            async with semaphore:
+                if interval:
+                    now = loop.time()
+                    start = max(now, next_start)
+                    next_start = start + interval
+                    if start > now:
+                        await asyncio.sleep(start - now)
+                return await self.run(input_data, config=self._batch_item_config(config, index))
+
+        return await asyncio.gather(
+            *(run_one(index, input_data) for index, input_data in enumerate(inputs)),
+            return_exceptions=True,
+        )
+
+    def _batch_item_config(self, config: Optional[Dict[str, Any]], index: int) -> Optional[Dict[str, Any]]:
+        """Config for the ``index``-th input of a batch; stateful agents give each its own thread."""
+        return config
+
+
+def _extract_text(message: BaseMessage) -> str:
+    """Return a message's text, joining the text blocks of multi-part content.
+
+    Other blocks (tool calls, images, reasoning) are not part of the answer and are skipped.
+    """
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part["text"]
+        for part in content
+        if isinstance(part, str) or (isinstance(part, dict) and part.get("type") == "text")
+    )
+
 
 class Tool(ABC):
     """Abstract Base Class for a Tool."""
@@ -4,7 +4,8 @@ Single source of truth for all MCP servers. Which agent may use which servers
 is defined in AgentRegistry.register(..., mcp_servers=...).
 """
 
-from typing import Any, Dict
+import functools
+from typing import Any, Dict, Sequence
 
 # All available MCP servers. Each entry must include "transport".
 # Resolved at runtime via get_mcp_servers_config() (e.g. env vars for API keys).
@@ -22,17 +23,30 @@ DEFAULT_MCP_SERVERS: Dict[str, Dict[str, Any]] = {
 
 def get_mcp_servers_config(
     override: Dict[str, Dict[str, Any]] | None = None,
+    server_names: Sequence[str] | None = None,
 ) -> Dict[str, Dict[str, Any]]:
     """Return MCP server config for MultiServerMCPClient.
 
-    Merges DEFAULT_MCP_SERVERS with optional override. Does not mutate any shared state.
+    Merges DEFAULT_MCP_SERVERS with optional override. When ``server_names`` is given, only
+    those servers (in that order, skipping unknown names) are returned and resolved. Defaults
+    are resolved once per process and only overridden entries are resolved again. Every call
+    returns fresh dicts, so callers may mutate the result without touching shared state.
     """
-    base = {k: dict(v) for k, v in DEFAULT_MCP_SERVERS.items()}
-    if override:
-        for k, v in override.items():
-            base[k] = dict(base.get(k, {}))
-            base[k].update(v)
-    return {k: _resolve_server_config(k, v) for k, v in base.items()}
+    defaults = _resolved_defaults()
+    names = list(dict.fromkeys([*defaults, *(override or {})])) if server_names is None else server_names
+    config: Dict[str, Dict[str, Any]] = {}
+    for k in names:
+        if override and k in override:
+            config[k] = _resolve_server_config(k, {**DEFAULT_MCP_SERVERS.get(k, {}), **override[k]})
+        elif k in defaults:
+            config[k] = dict(defaults[k])
+    return config
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_defaults() -> Dict[str, Dict[str, Any]]:
+    """Resolve DEFAULT_MCP_SERVERS once; ``_resolved_defaults.cache_clear()`` re-reads it."""
+    return {k: _resolve_server_config(k, dict(v)) for k, v in DEFAULT_MCP_SERVERS.items()}
 
 
 def _resolve_server_config(server_name: str, raw: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,20 +1,81 @@
 """MCP provider: injectable MCP client and session-scoped tools for agents."""
 
-from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, cast
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
 
 from langchain_mcp_adapters.client import MultiServerMCPClient
-from langchain_mcp_adapters.sessions import (
-    Connection,
-    SSEConnection,
-    StdioConnection,
-    StreamableHttpConnection,
-    WebsocketConnection,
-)
-from langchain_mcp_adapters.tools import load_mcp_tools
+from langchain_mcp_adapters.sessions import Connection
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool, load_mcp_tools
+from mcp.types import Tool as MCPTool
 
 from agentic_framework.mcp.config import get_mcp_servers_config
 
+DEFAULT_TOOLS_TTL = 300.0
+CONN_TIMEOUT = 15
+# Servers tool_session connects to at once (MCP_MAX_PARALLEL overrides); opened sessions stay open.
+DEFAULT_MAX_PARALLEL = 8
+
+# Tools fetched per server configuration, shared by every provider in the process:
+# (monotonic fetch time, tools). Specialist agents and repeated sessions reuse one ListTools.
+_TOOLS_CACHE: Dict[str, Tuple[float, List[Any]]] = {}
+# In-flight fetches per server configuration, so concurrent first callers share one round-trip.
+_TOOLS_FETCHES: Dict[str, "asyncio.Task[List[Any]]"] = {}
+# Directory for the on-disk tool definition cache shared across processes; unset disables it.
+TOOLS_CACHE_DIR_ENV = "AGENTIC_MCP_TOOLS_CACHE_DIR"
+
+
+def _forget_fetch(cache_key: str, task: "asyncio.Task[List[Any]]") -> None:
+    if _TOOLS_FETCHES.get(cache_key) is task:
+        del _TOOLS_FETCHES[cache_key]
+
+
+def _tools_cache_path(cache_key: str) -> Path | None:
+    """Return the on-disk cache file for a server configuration, or None when disabled."""
+    directory = os.environ.get(TOOLS_CACHE_DIR_ENV)
+    if not directory:
+        return None
+    return Path(directory).expanduser() / f"{hashlib.sha256(cache_key.encode()).hexdigest()}.json"
+
+
+def _read_tool_definitions(path: Path, ttl: float) -> Dict[str, List[MCPTool]] | None:
+    """Return the MCP tool definitions stored at ``path`` if younger than ``ttl`` seconds."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if time.time() - data["fetched_at"] >= ttl:
+            return None
+        return {name: [MCPTool.model_validate(tool) for tool in tools] for name, tools in data["servers"].items()}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logging.debug(f"Ignoring unreadable MCP tools cache {path}: {e}")
+        return None
+
+
+def _write_tool_definitions(path: Path, definitions: Dict[str, List[MCPTool]]) -> None:
+    """Store MCP tool definitions at ``path``, replacing any previous file atomically."""
+    data = {
+        "fetched_at": time.time(),
+        "servers": {
+            name: [tool.model_dump(mode="json", by_alias=True, exclude_none=True) for tool in tools]
+            for name, tools in definitions.items()
+        },
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        logging.debug(f"Could not write MCP tools cache {path}: {e}")
+
 
 class MCPConnectionError(Exception):
     """Raised when an MCP server fails to connect."""
@@ -33,62 +94,105 @@ class MCPProvider:
 
     def __init__(
         self,
-        servers_config: Dict[
-            str,
-            StdioConnection | SSEConnection | StreamableHttpConnection | WebsocketConnection,
-        ]
-        | None = None,
+        servers_config: Dict[str, Connection] | None = None,
         server_names: Optional[List[str]] = None,
+        tools_ttl: float = DEFAULT_TOOLS_TTL,
     ):
-        if servers_config is not None:
-            self._config = dict(servers_config)
-        else:
-            resolved = get_mcp_servers_config()
-            if server_names is not None:
-                self._config = {k: cast(Connection, resolved[k]) for k in server_names if k in resolved}
-            else:
-                self._config = cast(Dict[str, Connection], resolved)
+        # The shared config module stays free of adapter types; its entries are Connection-shaped.
+        self._config: Dict[str, Connection] = (
+            dict(servers_config)
+            if servers_config is not None
+            else cast(Dict[str, Connection], get_mcp_servers_config(server_names=server_names))
+        )
 
         self._client = MultiServerMCPClient(self._config)
-        self._tools_cache: Optional[List[Any]] = None
+        self._tools_ttl = tools_ttl
+        self._cache_key = json.dumps(self._config, sort_keys=True, default=str)
 
     @property
     def client(self) -> MultiServerMCPClient:
         return self._client
 
     async def get_tools(self) -> List[Any]:
-        """Return LangChain tools from configured server(s). Cached after first call.
-        Leaves connections open; use tool_session() in CLI so connections close.
-        """
-        if self._tools_cache is None:
-            self._tools_cache = await self._client.get_tools()
-        return self._tools_cache
+        """Return LangChain tools from configured server(s). Cached for ``tools_ttl`` seconds.
+        The cache is process-wide and keyed by server configuration, and concurrent callers
+        share a single in-flight fetch, so every provider for the same servers pays for one
+        round-trip. Leaves connections open; use tool_session() in CLI so connections close.
 
-    @asynccontextmanager
-    async def tool_session(self, fail_fast: bool = True) -> Any:
+        When ``AGENTIC_MCP_TOOLS_CACHE_DIR`` is set, the servers' tool definitions are also kept
+        on disk for ``tools_ttl`` seconds, so a fresh process skips listing them again. Each tool
+        still opens its own session when called.
         """
-        Async context manager: load MCP tools with sessions that close on exit.
+        cached = _TOOLS_CACHE.get(self._cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self._tools_ttl:
+            return cached[1]
+        task = _TOOLS_FETCHES.get(self._cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._fetch_tools())
+            task.add_done_callback(partial(_forget_fetch, self._cache_key))
+            _TOOLS_FETCHES[self._cache_key] = task
+        # Shielded so a caller that is cancelled does not cancel the fetch the others are waiting on.
+        return await asyncio.shield(task)
 
-        IMPORTANT: Connections are opened sequentially. While slightly slower than
-        parallel, this avoids "Attempted to exit cancel scope in a different task"
-        errors from anyio (used by mcp) which requires task identity for cleanup.
-        """
-        import asyncio
-        import logging
-        from contextlib import AsyncExitStack
+    async def _fetch_tools(self) -> List[Any]:
+        path = _tools_cache_path(self._cache_key)
+        tools = await (self._client.get_tools() if path is None else self._load_tools_through_disk(path))
+        _TOOLS_CACHE[self._cache_key] = (time.monotonic(), tools)
+        return tools
+
+    async def _load_tools_through_disk(self, path: Path) -> List[Any]:
+        definitions = _read_tool_definitions(path, self._tools_ttl)
+        if definitions is None:
+            listed = await asyncio.gather(*(self._list_server_tools(name) for name in self._config))
+            definitions = dict(zip(self._config, listed))
+            _write_tool_definitions(path, definitions)
+        return [
+            convert_mcp_tool_to_langchain_tool(
+                None,
+                tool,
+                connection=self._config[name],
+                callbacks=self._client.callbacks,
+                tool_interceptors=self._client.tool_interceptors,
+                server_name=name,
+                tool_name_prefix=self._client.tool_name_prefix,
+                handle_tool_errors=self._client.handle_tool_errors,
+            )
+            for name, tools in definitions.items()
+            for tool in tools
+        ]
+
+    async def _list_server_tools(self, name: str) -> List[MCPTool]:
+        """Return every tool definition ``name`` advertises, following ListTools pagination."""
+        tools: List[MCPTool] = []
+        cursor: str | None = None
+        async with self._client.session(name) as session:
+            while True:
+                page = await session.list_tools(cursor=cursor)
+                tools.extend(page.tools)
+                cursor = page.nextCursor
+                if not cursor:
+                    return tools
 
-        CONN_TIMEOUT = 15
-        all_tools = []
+    async def _hold_session(
+        self,
+        name: str,
+        ready: "asyncio.Future[List[Any]]",
+        release: asyncio.Event,
+        connect_slots: asyncio.Semaphore,
+    ) -> None:
+        """Open ``name``'s session, report its tools through ``ready`` and keep it open until ``release``.
 
-        # We use a stack to track entered contexts for reliable cleanup
+        The session is entered and exited by this one task, as anyio's cancel scopes (used by
+        mcp) require, which is what lets tool_session connect to every server concurrently.
+        A ``connect_slots`` slot is held only while connecting, so its timeout starts once the
+        server's turn comes and an open session never blocks another server's handshake.
+        """
         async with AsyncExitStack() as stack:
-            for name in self._config:
-                try:
+            try:
+                async with connect_slots:
                     logging.debug(f"Connecting to MCP server: {name}")
                     async with asyncio.timeout(CONN_TIMEOUT):
-                        # We enter the context manager in the SAME task that will exit it
                         session = await stack.enter_async_context(self._client.session(name))
-
                         tools = await load_mcp_tools(
                             session,
                             callbacks=self._client.callbacks,
@@ -96,8 +200,39 @@ class MCPProvider:
                             server_name=name,
                             tool_name_prefix=self._client.tool_name_prefix,
                         )
-                        logging.info(f"Loaded {len(tools)} tools from MCP server: {name}")
-                        all_tools.extend(tools)
+            except Exception as e:
+                ready.set_exception(e)
+                return
+            logging.info(f"Loaded {len(tools)} tools from MCP server: {name}")
+            ready.set_result(tools)
+            await release.wait()
+            # During stack exit, some servers (like those with misconfigured http transport)
+            # might return 405 on DELETE or have other cleanup issues; tool_session logs them
+            # so one server's cleanup failure doesn't mask the agent's result.
+            logging.debug(f"Closing MCP session: {name}")
+
+    @asynccontextmanager
+    async def tool_session(self, fail_fast: bool = True) -> Any:
+        """
+        Async context manager: load MCP tools with sessions that close on exit.
+
+        Servers are connected concurrently, each from its own task that also closes its
+        session on exit, so startup takes the slowest server's time rather than the sum.
+        At most ``MCP_MAX_PARALLEL`` (default 8) handshakes run at once to bound socket and
+        memory use with large server inventories. Tools are yielded in server configuration order.
+        """
+        loop = asyncio.get_running_loop()
+        release = asyncio.Event()
+        connect_slots = asyncio.Semaphore(int(os.environ.get("MCP_MAX_PARALLEL", DEFAULT_MAX_PARALLEL)))
+        ready: Dict[str, asyncio.Future[List[Any]]] = {name: loop.create_future() for name in self._config}
+        holders = [
+            asyncio.create_task(self._hold_session(name, ready[name], release, connect_slots)) for name in self._config
+        ]
+        try:
+            all_tools: List[Any] = []
+            for name, future in ready.items():
+                try:
+                    all_tools.extend(await future)
                 except (asyncio.TimeoutError, TimeoutError) as e:
                     err = TimeoutError(f"Connection timed out after {CONN_TIMEOUT}s")
                     if fail_fast:
@@ -110,11 +245,17 @@ class MCPProvider:
                     logging.error(f"Failed to connect to MCP server '{name}': {e}")
 
             # Once all (or some) tools are loaded, yield them to the agent
-            try:
-                yield all_tools
-            finally:
-                # During stack exit, some servers (like those with misconfigured http transport)
-                # might return 405 on DELETE or have other cleanup issues.
-                # We want to ensure one server's cleanup failure doesn't mask the agent's result.
-                # AsyncExitStack already handles this by aggregation, but let's be aware.
-                logging.debug("Exiting MCP tool session stack")
+            yield all_tools
+        finally:
+            logging.debug("Exiting MCP tool session")
+            release.set()
+            for name, holder in zip(ready, holders):
+                if not ready[name].done():
+                    holder.cancel()
+            for name, result in zip(ready, await asyncio.gather(*holders, return_exceptions=True)):
+                if isinstance(result, Exception):
+                    logging.debug(f"Error while closing MCP session '{name}': {result}")
+            # Failures after a fail-fast error are not reported; mark them retrieved all the same.
+            for future in ready.values():
+                if future.done() and not future.cancelled():
+                    future.exception()
@@ -1,7 +1,10 @@
+import ast
 import importlib
+import importlib.util
 import logging
 import pkgutil
-from typing import Callable, Dict, List, Optional, Type
+from importlib.metadata import EntryPoint, entry_points
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 from agentic_framework.interfaces.base import Agent
 
@@ -9,9 +12,67 @@ from agentic_framework.interfaces.base import Agent
 # import (agent modules do "from agentic_framework.registry import AgentRegistry").
 # Must be a package whose __init__.py does NOT import concrete agent modules.
 _AGENTS_PACKAGE_NAME = "agentic_framework.core"
+# Entry point group through which installed packages contribute agents ("name = module:AgentClass").
+_ENTRY_POINT_GROUP = "agentic_framework.agents"
 _logger = logging.getLogger(__name__)
 
 
+def _read_registrations(modinfo: pkgutil.ModuleInfo) -> Optional[List[Tuple[str, Optional[List[str]]]]]:
+    """Return (name, mcp_servers) for every @AgentRegistry.register(...) in a module's source.
+
+    Returns None when the module has to be imported instead: it is a package, its source
+    is not available, a registration uses arguments that are not literals, or the module
+    refers to AgentRegistry or ``register`` in any other way (an alias, a qualified
+    ``registry.AgentRegistry.register``, a programmatic ``register(name)(cls)`` call), since
+    such a registration cannot be read from the source.
+    """
+    if modinfo.ispkg:
+        return None
+    spec = modinfo.module_finder.find_spec(modinfo.name, None)  # type: ignore[call-arg]
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    with open(spec.origin, "rb") as source:
+        tree = ast.parse(source.read(), filename=spec.origin)
+
+    registrations: List[Tuple[str, Optional[List[str]]]] = []
+    # The AgentRegistry.register / AgentRegistry nodes of the decorators read below.
+    parsed: set[int] = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            if not (
+                isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Attribute)
+                and decorator.func.attr == "register"
+                and isinstance(decorator.func.value, ast.Name)
+                and decorator.func.value.id == "AgentRegistry"
+            ):
+                continue
+            parsed.update((id(decorator.func), id(decorator.func.value)))
+            args = dict(zip(("name", "mcp_servers"), decorator.args))
+            args.update((kw.arg, kw.value) for kw in decorator.keywords if kw.arg is not None)
+            try:
+                name = ast.literal_eval(args["name"])
+                mcp_servers = ast.literal_eval(args["mcp_servers"]) if "mcp_servers" in args else None
+            except (KeyError, ValueError):
+                return None
+            if not isinstance(name, str):
+                return None
+            registrations.append((name, mcp_servers))
+
+    for node in ast.walk(tree):
+        if id(node) in parsed:
+            continue
+        if (
+            (isinstance(node, ast.Attribute) and node.attr in ("register", "AgentRegistry"))
+            or (isinstance(node, ast.Name) and node.id == "AgentRegistry")
+            or (isinstance(node, ast.alias) and node.name == "AgentRegistry" and node.asname is not None)
+        ):
+            return None
+    return registrations
+
+
 class DuplicateAgentRegistrationError(Exception):
     """Raised when attempting to register an agent with a name that's already in use."""
 
@@ -28,6 +89,11 @@ class DuplicateAgentRegistrationError(Exception):
 class AgentRegistry:
     _registry: Dict[str, Type[Agent]] = {}
     _mcp_servers: Dict[str, Optional[List[str]]] = {}
+    # Agents found by discover_lightweight() whose module has not been imported yet: name -> module.
+    _agent_modules: Dict[str, str] = {}
+    # Agents advertised by installed packages' entry points that have not been loaded yet.
+    _agent_entry_points: Dict[str, EntryPoint] = {}
+    _discovered: bool = False  # Set once either discovery method has scanned the agents package
     _strict_registration: bool = False  # If True, duplicates raise an error
 
     @classmethod
@@ -81,23 +147,101 @@ class AgentRegistry:
 
     @classmethod
     def get(cls, name: str) -> Optional[Type[Agent]]:
-        """Get an agent class by name."""
-        return cls._registry.get(name)
+        """Get an agent class by name, importing its module first if it was only discovered lightweight."""
+        agent_cls = cls._registry.get(name)
+        if agent_cls is None:
+            cls._ensure_discovered()
+        if agent_cls is None and name in cls._agent_modules:
+            importlib.import_module(cls._agent_modules.pop(name))
+            agent_cls = cls._registry.get(name)
+        if agent_cls is None and name in cls._agent_entry_points:
+            agent_cls = cls._load_entry_point(cls._agent_entry_points.pop(name))
+        return agent_cls
 
     @classmethod
     def get_mcp_servers(cls, name: str) -> Optional[List[str]]:
         """Return the list of MCP server names this agent is allowed to use, or None if no access."""
+        if name not in cls._mcp_servers:
+            cls._ensure_discovered()
+        if name in cls._agent_entry_points:
+            cls.get(name)
         return cls._mcp_servers.get(name)
 
     @classmethod
     def list_agents(cls) -> list[str]:
-        """List all registered agent names."""
-        return list(cls._registry.keys())
+        """List all registered agent names, including ones discovered but not imported yet."""
+        cls._ensure_discovered()
+        return list(dict.fromkeys([*cls._registry, *cls._agent_modules, *cls._agent_entry_points]))
 
     @classmethod
     def discover_agents(cls) -> None:
-        """Import all modules in the agents package so @AgentRegistry.register() decorators run."""
+        """Import all modules in the agents package so @AgentRegistry.register() decorators run.
+
+        Agents contributed through entry points are loaded as well.
+        """
         agents_pkg = importlib.import_module(_AGENTS_PACKAGE_NAME)
         prefix = agents_pkg.__name__ + "."
         for modinfo in pkgutil.iter_modules(agents_pkg.__path__, prefix):
             importlib.import_module(modinfo.name)
+        cls._agent_modules.clear()
+        for entry_point in entry_points(group=_ENTRY_POINT_GROUP):
+            if entry_point.name not in cls._registry:
+                cls._load_entry_point(entry_point)
+        cls._agent_entry_points.clear()
+        cls._discovered = True
+
+    @classmethod
+    def discover_lightweight(cls) -> None:
+        """Find agents by reading the agents package source instead of importing every module.
+
+        Names and MCP servers come from the literal @AgentRegistry.register(...) arguments; get()
+        imports an agent's module on first use. Modules that cannot be read this way are imported now.
+        Agents from the ``agentic_framework.agents`` entry point group are recorded by name and
+        likewise loaded on first use.
+
+        A name declared by two modules has both imported, so register() warns about it or, in
+        strict mode, raises DuplicateAgentRegistrationError as it does for discover_agents().
+        """
+        spec = importlib.util.find_spec(_AGENTS_PACKAGE_NAME)
+        if spec is None or spec.submodule_search_locations is None:
+            cls.discover_agents()
+            return
+        prefix = _AGENTS_PACKAGE_NAME + "."
+        for modinfo in pkgutil.iter_modules(spec.submodule_search_locations, prefix):
+            registrations = _read_registrations(modinfo)
+            if registrations is None:
+                importlib.import_module(modinfo.name)
+                continue
+            for name, mcp_servers in registrations:
+                earlier = cls._agent_modules.get(name)
+                if earlier is not None and earlier != modinfo.name:
+                    importlib.import_module(cls._agent_modules.pop(name))
+                    importlib.import_module(modinfo.name)
+                elif name in cls._registry:
+                    if cls._registry[name].__module__ != modinfo.name:
+                        importlib.import_module(modinfo.name)
+                else:
+                    cls._agent_modules[name] = modinfo.name
+                    cls._mcp_servers[name] = mcp_servers
+        # Names recorded above that a module imported later in the scan registered as well.
+        for name in [name for name in cls._agent_modules if name in cls._registry]:
+            importlib.import_module(cls._agent_modules.pop(name))
+        for entry_point in entry_points(group=_ENTRY_POINT_GROUP):
+            if entry_point.name not in cls._registry and entry_point.name not in cls._agent_modules:
+                cls._agent_entry_points[entry_point.name] = entry_point
+        cls._discovered = True
+
+    @classmethod
+    def _load_entry_point(cls, entry_point: EntryPoint) -> Optional[Type[Agent]]:
+        """Import an agent entry point; a class that did not register itself gets no MCP access."""
+        agent_cls = entry_point.load()
+        if entry_point.name not in cls._registry:
+            cls._registry[entry_point.name] = agent_cls
+            cls._mcp_servers[entry_point.name] = None
+        return cls._registry[entry_point.name]
+
+    @classmethod
+    def _ensure_discovered(cls) -> None:
+        """Run discover_lightweight() the first time the registry is queried without prior discovery."""
+        if not cls._discovered:
+            cls.discover_lightweight()
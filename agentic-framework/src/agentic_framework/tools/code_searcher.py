@@ -1,8 +1,12 @@
 import subprocess
-from typing import Any, List, Union
+import tempfile
+from itertools import chain, islice
+from typing import Any, List, Sequence, Union
 
 from agentic_framework.interfaces.base import Tool
 
+MAX_MATCHES = 30
+
 
 class CodeSearcher(Tool):
     """Wraps ripgrep (rg) for ultra-fast codebase querying."""
@@ -22,28 +26,55 @@ class CodeSearcher(Tool):
         """Executes a search across the codebase. input_str is the search query."""
         return self.grep_search(input_str)
 
-    def grep_search(self, query: str, glob: str = "*") -> Union[List[str], str]:
+    def grep_search(self, query: Union[str, Sequence[str]], glob: str = "*") -> Union[List[str], str]:
         """
         Executes a search across the codebase using ripgrep.
+        ``query`` may be several patterns; ripgrep then walks the tree once and reports
+        lines matching any of them.
         Returns matches in vimgrep format (file:line:col:text).
         """
+        queries = [query] if isinstance(query, str) else list(query)
+        if not queries:
+            return "No matches found."
         try:
             # --vimgrep: file:line:col:text
             # --smart-case: case-insensitive unless query has uppercase
             # --iglob: filter by glob pattern
             # --max-columns: limit long lines to avoid token blowup
-            cmd = ["rg", "--vimgrep", "--smart-case", "--max-columns", "500", "--iglob", glob, query, self.root_dir]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            # --max-count: stop reading a file once it alone fills the result
+            # -e: one per pattern, which also keeps patterns starting with "-" from reading as flags
+            cmd = [
+                "rg",
+                "--vimgrep",
+                "--smart-case",
+                "--max-columns",
+                "500",
+                "--max-count",
+                str(MAX_MATCHES),
+                "--iglob",
+                glob,
+                *chain.from_iterable(("-e", q) for q in queries),
+                self.root_dir,
+            ]
+            # stderr goes to a file, not a pipe: nothing drains it while stdout is read, so a
+            # chatty ripgrep could otherwise fill the pipe buffer and block.
+            with tempfile.TemporaryFile(mode="w+") as stderr_file:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
 
-            if result.returncode == 0:
-                lines = result.stdout.splitlines()
-                if not lines:
-                    return "No matches found."
-                return lines[:30]  # Increased to 30 for more context
-
-            if result.stderr:
-                return f"Error executing rg: {result.stderr}"
-            return "No matches found."
+                # Read only the lines we return; ripgrep is stopped instead of scanning the rest of the tree.
+                assert proc.stdout is not None
+                lines = [line.rstrip("\n") for line in islice(proc.stdout, MAX_MATCHES)]
+                if lines:
+                    proc.terminate()
+                    proc.communicate()
+                    return lines
 
+                proc.communicate()
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
         except FileNotFoundError:
             return "Error: ripgrep (rg) is not installed. Please install it to use this tool."
+
+        if proc.returncode not in (0, 1) and stderr:
+            return f"Error executing rg: {stderr}"
+        return "No matches found."
@@ -1,10 +1,26 @@
+import ast
+import functools
+import mmap
+import os
 import re
 import subprocess
+import time
+from array import array
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 from agentic_framework.interfaces.base import Tool
 
+# rapidfuzz is an optional speedup (``uv sync --extra rapidfuzz``) that ranks file names in-process
+# instead of piping the file list through fzf.
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz import process as fuzz_process
+except ImportError:
+    fuzz = None
+    fuzz_process = None
+
 # Language detection by file extension
 LANGUAGE_EXTENSIONS: Dict[str, str] = {
     ".py": "python",
@@ -116,13 +132,20 @@ class CodebaseExplorer:
             r"\.mypy_cache",
             r"\.pytest_cache",
         ]
-
-    def _is_ignored(self, path: Path) -> bool:
-        try:
-            rel_path = str(path.relative_to(self.root_dir))
-        except ValueError:
+        # One alternation is matched per path instead of one search per pattern.
+        self._ignore_re = re.compile("|".join(f"(?:{pattern})" for pattern in self.ignore_patterns))
+        self._root_str = str(self.root_dir)
+        self._root_prefix = os.path.join(self._root_str, "")
+
+    def _is_ignored(self, path: Union[str, Path]) -> bool:
+        path_str = str(path)
+        if path_str.startswith(self._root_prefix):
+            rel_path = path_str[len(self._root_prefix) :]
+        elif path_str == self._root_str:
+            rel_path = "."
+        else:
             return True
-        return any(re.search(pattern, rel_path) for pattern in self.ignore_patterns)
+        return self._ignore_re.search(rel_path) is not None
 
 
 class StructureExplorerTool(CodebaseExplorer, Tool):
@@ -145,26 +168,44 @@ class StructureExplorerTool(CodebaseExplorer, Tool):
         return self._build_tree(self.root_dir, depth=0, max_depth=max_depth)
 
     def _build_tree(self, current_dir: Path, depth: int, max_depth: int) -> Dict[str, Any]:
-        tree: Dict[str, Any] = {"name": current_dir.name or str(current_dir), "type": "directory", "children": []}
+        """Walk the tree breadth-first with os.scandir, whose entries carry their own type and stat."""
+        root: Dict[str, Any] = {"name": current_dir.name or str(current_dir), "type": "directory", "children": []}
+        pending: Deque[Tuple[str, Dict[str, Any], int]] = deque([(str(current_dir), root, depth)])
+
+        while pending:
+            dir_path, tree, level = pending.popleft()
+            if level >= max_depth:
+                continue
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+                for entry in entries:
+                    if self._is_ignored(entry.path):
+                        continue
+
+                    if entry.is_dir():
+                        child: Dict[str, Any] = {"name": entry.name, "type": "directory", "children": []}
+                        tree["children"].append(child)
+                        pending.append((entry.path, child, level + 1))
+                    else:
+                        tree["children"].append(
+                            {"name": entry.name, "type": "file", "size_kb": round(entry.stat().st_size / 1024, 2)}
+                        )
+            except PermissionError:
+                tree["error"] = "Permission denied"
 
-        if depth >= max_depth:
-            return tree
+        return root
 
-        try:
-            for item in sorted(current_dir.iterdir()):
-                if self._is_ignored(item):
-                    continue
 
-                if item.is_dir():
-                    tree["children"].append(self._build_tree(item, depth + 1, max_depth))
-                else:
-                    tree["children"].append(
-                        {"name": item.name, "type": "file", "size_kb": round(item.stat().st_size / 1024, 2)}
-                    )
-        except PermissionError:
-            tree["error"] = "Permission denied"
+_PYTHON_DEFINITIONS = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
 
-        return tree
+def _clip_signature(line: str) -> str:
+    """Clean up a signature line, limiting its length for readability."""
+    signature = line.strip()
+    if len(signature) > 100:
+        signature = signature[:97] + "..."
+    return signature
 
 
 class FileOutlinerTool(CodebaseExplorer, Tool):
@@ -190,6 +231,11 @@ class FileOutlinerTool(CodebaseExplorer, Tool):
         if language is None:
             return f"Error: Unsupported file type for {file_path}. Supported: Python, JS/TS, Rust, Go, Java, C/C++, PHP"
 
+        if language == "python":
+            outline = self._extract_python_outline(full_path)
+            if outline is not None:
+                return outline
+
         patterns = LANGUAGE_PATTERNS.get(language, [])
         return self._extract_outline(full_path, patterns)
 
@@ -198,22 +244,38 @@ class FileOutlinerTool(CodebaseExplorer, Tool):
         ext = Path(file_path).suffix.lower()
         return LANGUAGE_EXTENSIONS.get(ext)
 
+    def _extract_python_outline(self, file_path: Path) -> Optional[List[Dict[str, Any]]]:
+        """Extract a Python outline from the AST, or None when the file does not parse.
+
+        Unlike the line regexes this skips "def"/"class" text inside strings and docstrings.
+        Callers fall back to the regex outline for files that do not parse (e.g. mid-edit).
+        """
+        try:
+            source = file_path.read_bytes()
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            return None
+        except OSError as e:
+            return [{"error": f"Error reading file: {e}"}]
+
+        # ast line numbers count \n, \r\n and \r; str.splitlines() also splits on other characters.
+        lines = source.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        definitions = sorted(node.lineno for node in ast.walk(tree) if isinstance(node, _PYTHON_DEFINITIONS))
+        return [{"line": line_num, "signature": _clip_signature(lines[line_num - 1])} for line_num in definitions]
+
     def _extract_outline(self, file_path: Path, patterns: List[str]) -> List[Dict[str, Any]]:
         """Extract code outline using regex patterns."""
         outline: List[Dict[str, Any]] = []
-        compiled_patterns = [re.compile(p) for p in patterns]
+        if not patterns:
+            return outline
+        # One alternation per line instead of trying each pattern in turn.
+        combined = re.compile("|".join(f"(?:{p})" for p in patterns))
 
         try:
             with open(file_path, "r", encoding="utf-8", errors="replace") as f:
                 for line_num, line in enumerate(f, 1):
-                    for pattern in compiled_patterns:
-                        if pattern.search(line):
-                            # Clean up the signature (limit length for readability)
-                            signature = line.strip()
-                            if len(signature) > 100:
-                                signature = signature[:97] + "..."
-                            outline.append({"line": line_num, "signature": signature})
-                            break  # Only match first pattern per line
+                    if combined.search(line):
+                        outline.append({"line": line_num, "signature": _clip_signature(line)})
             return outline
         except Exception as e:
             return [{"error": f"Error reading file: {e}"}]
@@ -231,6 +293,11 @@ class FileFragmentReaderTool(CodebaseExplorer, Tool):
         return "Reads a specific line range from a file. Input format: 'path:start:end' (e.g. 'src/cli.py:1:20')."
 
     def invoke(self, input_str: str) -> Any:
+        """Return lines ``start`` to ``end`` of a file, with every line ending turned into a newline.
+
+        The first read of a file (or of a new version of it) scans the whole file to index its
+        lines; later reads seek straight to the requested range.
+        """
         try:
             parts = input_str.split(":")
             if len(parts) < 3:
@@ -243,16 +310,69 @@ class FileFragmentReaderTool(CodebaseExplorer, Tool):
             if not full_path.exists():
                 return f"Error: File {file_path} not found."
 
-            with open(full_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                return "".join(lines[max(0, start_line - 1) : end_line])
+            # The line index is built once per file version; then only the requested bytes are read.
+            stat = full_path.stat()
+            starts = _line_starts(str(full_path), stat.st_mtime_ns, stat.st_size)
+            selected = range(len(starts))[max(0, start_line - 1) : end_line]
+            if not selected:
+                return ""
+            begin = starts[selected[0]]
+            stop = starts[selected[-1] + 1] if selected[-1] + 1 < len(starts) else stat.st_size
+            with open(full_path, "rb") as f:
+                f.seek(begin)
+                chunk = f.read(stop - begin)
+            # Match text mode's universal newlines.
+            return chunk.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
         except Exception as e:
             return f"Error: {e}"
 
 
+# Line endings recognised by text mode's universal newlines.
+_LINE_END = re.compile(rb"\r\n?|\n")
+
+
+@functools.lru_cache(maxsize=32)
+def _line_starts(path: str, mtime_ns: int, size: int) -> "array[int]":
+    """Return the byte offset at which each line of ``path`` starts.
+
+    Lines end at CRLF, CR or LF, as in text mode. Building the index reads the
+    whole file once; ``mtime_ns`` and ``size`` are part of the cache key only, so an edited
+    file is re-indexed.
+    """
+    starts = array("Q")
+    if size == 0:
+        return starts
+    starts.append(0)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        starts.extend(match.end() for match in _LINE_END.finditer(mm) if match.end() < size)
+    return starts
+
+
+# Seconds a file listing is reused, so back-to-back searches skip re-running fd.
+FILE_LIST_TTL = 5
+
+
+@functools.lru_cache(maxsize=8)
+def _list_files(root_dir: str, time_bucket: int) -> Tuple[str, ...]:
+    """Return every file under ``root_dir`` relative to it, as listed by fd.
+
+    ``time_bucket`` is part of the cache key only, expiring listings after ``FILE_LIST_TTL``.
+    Raises CalledProcessError when fd fails, so failures are never cached.
+    """
+    # -H: include hidden files; .gitignore is still respected.
+    fd_cmd = ["fd", "--color", "never", "-H", ".", root_dir]
+    fd_result = subprocess.run(fd_cmd, capture_output=True, text=True, check=False)
+    if fd_result.returncode != 0:
+        raise subprocess.CalledProcessError(fd_result.returncode, fd_cmd, stderr=fd_result.stderr)
+    prefix = os.path.join(root_dir, "")
+    return tuple(f[len(prefix) :] if f.startswith(prefix) else f for f in fd_result.stdout.splitlines())
+
+
 class FileFinderTool(CodebaseExplorer, Tool):
     """Tool to find files by name using 'fd'."""
 
+    MAX_RESULTS = 30
+
     @property
     def name(self) -> str:
         return "find_files"
@@ -266,51 +386,37 @@ class FileFinderTool(CodebaseExplorer, Tool):
 
     def invoke(self, pattern: str) -> Any:
         try:
-            # First, get candidates using fd
-            # -H: hidden files, -I: ignore .gitignore for faster full list if needed,
-            # but usually we want to respect it, so let's stick to standard fd.
-            # We'll list all files and let fzf rank them.
-            fd_cmd = ["fd", "--color", "never", "-H", ".", str(self.root_dir)]
-            fd_result = subprocess.run(fd_cmd, capture_output=True, text=True, check=False)
-
-            if fd_result.returncode != 0:
-                if fd_result.stderr:
-                    return f"Error executing fd: {fd_result.stderr}"
-                return "No files found."
-
-            all_files = fd_result.stdout
-            if not all_files:
-                return "No files found."
-
-            # Use fzf to rank the files based on the pattern
-            # fzf -f performs a non-interactive fuzzy search
-            try:
-                fzf_cmd = ["fzf", "-f", pattern]
-                fzf_result = subprocess.run(fzf_cmd, input=all_files, capture_output=True, text=True, check=False)
-                if fzf_result.returncode == 0:
-                    ranked_files = fzf_result.stdout.splitlines()
-                else:
-                    # Fallback to simple substring match if fzf returns nothing or fails
-                    ranked_files = [f for f in all_files.splitlines() if pattern.lower() in f.lower()]
-            except FileNotFoundError:
-                # Fallback if fzf is missing
-                ranked_files = [f for f in all_files.splitlines() if pattern.lower() in f.lower()]
-
-            # Convert absolute paths back to relative and limit results
-            relative_files = []
-            for f in ranked_files[:30]:  # Limit to top 30
-                try:
-                    relative_files.append(str(Path(f).relative_to(self.root_dir)))
-                except ValueError:
-                    relative_files.append(f)
-
-            if not relative_files:
-                return "No matches found for the given pattern."
-
-            return relative_files
+            all_files = _list_files(str(self.root_dir), int(time.monotonic() // FILE_LIST_TTL))
+        except subprocess.CalledProcessError as e:
+            return f"Error executing fd: {e.stderr}" if e.stderr else "No files found."
         except FileNotFoundError:
             return "Error: Required search tools (fd) not found."
 
+        if not all_files:
+            return "No files found."
+
+        ranked_files = self._rank(pattern, all_files)[: self.MAX_RESULTS]
+        if not ranked_files:
+            return "No matches found for the given pattern."
+        return ranked_files
+
+    def _rank(self, pattern: str, files: Tuple[str, ...]) -> List[str]:
+        """Order ``files`` by how well they fuzzy-match ``pattern``, best first."""
+        if fuzz_process is not None:
+            matches = fuzz_process.extract(pattern, files, scorer=fuzz.WRatio, limit=self.MAX_RESULTS, score_cutoff=40)
+            return [match for match, _score, _index in matches]
+        # fzf -f performs a non-interactive fuzzy search
+        try:
+            fzf_result = subprocess.run(
+                ["fzf", "-f", pattern], input="\n".join(files), capture_output=True, text=True, check=False
+            )
+            if fzf_result.returncode == 0:
+                return fzf_result.stdout.splitlines()
+        except FileNotFoundError:
+            pass
+        # Fallback to simple substring match if fzf is missing, returns nothing or fails
+        return [f for f in files if pattern.lower() in f.lower()]
+
 
 class FileEditorTool(CodebaseExplorer, Tool):
     """Tool to safely edit files with line-based operations."""
@@ -0,0 +1,14 @@
+import pytest
+
+from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
+from agentic_framework.mcp import provider
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Keep process-wide caches (and the fakes tests install in them) from leaking between tests."""
+    LangGraphMCPAgent._GRAPH_CACHE.clear()
+    provider._TOOLS_CACHE.clear()
+    yield
+    LangGraphMCPAgent._GRAPH_CACHE.clear()
+    provider._TOOLS_CACHE.clear()
@@ -6,6 +6,14 @@ import pytest
 from langchain_core.messages import HumanMessage
 
 from agentic_framework.core.simple_agent import SimpleAgent
+from agentic_framework.interfaces.base import Agent
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    SimpleAgent.response_cache.clear()
+    yield
+    SimpleAgent.response_cache.clear()
 
 
 def test_simple_agent_initialization():
@@ -18,9 +26,11 @@ def test_simple_agent_initialization():
 
         agent = SimpleAgent(model_name="gpt-4o-mini")
         assert agent is not None
-        assert agent.get_tools() == []
+        assert agent.get_tools() == ()
 
-        # Verify _create_model was called with correct params
+        # The model is only created on first use, with the configured params
+        MockCreateModel.assert_not_called()
+        assert agent.model is agent.model
         MockCreateModel.assert_called_once_with("gpt-4o-mini", 0.0)
 
 
@@ -43,10 +53,7 @@ def test_simple_agent_run_with_string(monkeypatch):
             return FakeChain()
 
     monkeypatch.setattr("agentic_framework.core.simple_agent._create_model", fake_model)
-    monkeypatch.setattr(
-        "agentic_framework.core.simple_agent.ChatPromptTemplate",
-        SimpleNamespace(from_messages=lambda messages: FakePrompt()),
-    )
+    monkeypatch.setattr(SimpleAgent, "PROMPT", FakePrompt())
 
     agent = SimpleAgent()
     result = asyncio.run(agent.run("hello"))
@@ -71,11 +78,147 @@ def test_simple_agent_run_with_message_list_raises(monkeypatch):
         return FakeModel()
 
     monkeypatch.setattr("agentic_framework.core.simple_agent._create_model", fake_model)
-    monkeypatch.setattr(
-        "agentic_framework.core.simple_agent.ChatPromptTemplate",
-        SimpleNamespace(from_messages=lambda messages: FakePrompt()),
-    )
+    monkeypatch.setattr(SimpleAgent, "PROMPT", FakePrompt())
 
     agent = SimpleAgent()
     with pytest.raises(NotImplementedError):
         asyncio.run(agent.run([HumanMessage(content="nope")]))
+
+
+def _patch_counting_chain(monkeypatch, calls):
+    class FakeChain:
+        async def ainvoke(self, payload):
+            calls.append(payload)
+            return SimpleNamespace(content=f"answer {len(calls)}")
+
+        async def abatch(self, payloads, config=None):
+            return [await self.ainvoke(payload) for payload in payloads]
+
+    class FakePrompt:
+        def __or__(self, model):
+            return FakeChain()
+
+    monkeypatch.setattr("agentic_framework.core.simple_agent._create_model", lambda *args: object())
+    monkeypatch.setattr(SimpleAgent, "PROMPT", FakePrompt())
+
+
+def test_simple_agent_caches_deterministic_responses(monkeypatch):
+    calls = []
+    _patch_counting_chain(monkeypatch, calls)
+
+    first = asyncio.run(SimpleAgent(model_name="gpt-4o-mini", cache_responses=True).run("hello"))
+    second = asyncio.run(SimpleAgent(model_name="gpt-4o-mini", cache_responses=True).run("hello"))
+
+    assert first == second == "answer 1"
+    assert len(calls) == 1
+    assert SimpleAgent.response_cache.hits == 1
+
+
+def test_simple_agent_does_not_cache_by_default(monkeypatch):
+    calls = []
+    _patch_counting_chain(monkeypatch, calls)
+    agent = SimpleAgent(model_name="gpt-4o-mini")
+
+    asyncio.run(agent.run("hello"))
+    asyncio.run(agent.run("hello"))
+
+    assert len(calls) == 2
+    assert len(SimpleAgent.response_cache) == 0
+
+
+def test_simple_agent_cache_is_keyed_on_provider(monkeypatch):
+    calls = []
+    _patch_counting_chain(monkeypatch, calls)
+    provider = "openai"
+    monkeypatch.setattr("agentic_framework.core.simple_agent.detect_provider", lambda: provider)
+    agent = SimpleAgent(model_name="gpt-4o-mini", cache_responses=True)
+
+    asyncio.run(agent.run("hello"))
+    provider = "azure_openai"
+    asyncio.run(agent.run("hello"))
+
+    assert len(calls) == 2
+
+
+def test_simple_agent_skips_cache_when_temperature_is_positive(monkeypatch):
+    calls = []
+    _patch_counting_chain(monkeypatch, calls)
+    agent = SimpleAgent(model_name="gpt-4o-mini", temperature=0.7, cache_responses=True)
+
+    asyncio.run(agent.run("hello"))
+    asyncio.run(agent.run("hello"))
+
+    assert len(calls) == 2
+    assert len(SimpleAgent.response_cache) == 0
+
+
+def test_simple_agent_run_batch_only_sends_cache_misses(monkeypatch):
+    calls = []
+    _patch_counting_chain(monkeypatch, calls)
+    agent = SimpleAgent(model_name="gpt-4o-mini", cache_responses=True)
+
+    asyncio.run(agent.run("cached"))
+    results = asyncio.run(agent.run_batch(["first", "cached", "second"]))
+
+    assert results == ["answer 2", "answer 1", "answer 3"]
+    assert calls == [{"input": "cached"}, {"input": "first"}, {"input": "second"}]
+
+
+def test_simple_agent_instances_share_prompt_template(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.simple_agent._create_model", lambda *args: lambda value: value)
+
+    assert SimpleAgent().prompt is SimpleAgent().prompt is SimpleAgent.PROMPT
+
+
+class EchoAgent(Agent):
+    __slots__ = ("active", "peak")
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, input_data, config=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        if input_data == "bad":
+            raise ValueError("bad input")
+        return input_data.upper()
+
+    def get_tools(self):
+        return ()
+
+
+def test_run_batch_async_bounds_concurrency_and_keeps_order():
+    agent = EchoAgent()
+
+    results = asyncio.run(agent.run_batch_async(["a", "bad", "c", "d"], max_concurrency=2))
+
+    assert results[0] == "A"
+    assert isinstance(results[1], ValueError)
+    assert results[2:] == ["C", "D"]
+    assert agent.peak == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_run_batch_async_rejects_non_positive_concurrency(max_concurrency):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        asyncio.run(EchoAgent().run_batch_async(["a"], max_concurrency=max_concurrency))
+
+
+def test_run_batch_async_spaces_starts_by_rpm(monkeypatch):
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(seconds):
+        if seconds:
+            delays.append(round(seconds, 1))
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", recording_sleep)
+
+    results = asyncio.run(EchoAgent().run_batch_async(["a", "b", "c"], rpm=60))
+
+    assert results == ["A", "B", "C"]
+    assert delays == [1.0, 2.0]
@@ -0,0 +1,59 @@
+import asyncio
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from agentic_framework.core.checkpoint import BoundedInMemorySaver
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+
+
+def _save(saver, thread_id):
+    saver.put(_config(thread_id), empty_checkpoint(), {}, {})
+
+
+def test_bounded_saver_evicts_least_recently_used_thread():
+    saver = BoundedInMemorySaver(max_threads=2)
+    _save(saver, "a")
+    _save(saver, "b")
+    assert saver.get_tuple(_config("a")) is not None  # "a" becomes most recently used
+
+    _save(saver, "c")
+
+    assert saver.get_tuple(_config("b")) is None
+    assert saver.get_tuple(_config("a")) is not None
+    assert saver.get_tuple(_config("c")) is not None
+
+
+def test_bounded_saver_keeps_all_checkpoints_of_retained_threads():
+    saver = BoundedInMemorySaver(max_threads=1)
+    _save(saver, "a")
+    _save(saver, "a")
+
+    assert len(list(saver.list(_config("a")))) == 2
+
+
+def test_bounded_saver_delete_thread_frees_a_slot():
+    saver = BoundedInMemorySaver(max_threads=2)
+    _save(saver, "a")
+    _save(saver, "b")
+    saver.delete_thread("a")
+    _save(saver, "c")
+
+    assert saver.get_tuple(_config("b")) is not None
+    assert saver.get_tuple(_config("c")) is not None
+
+
+def test_bounded_saver_evicts_through_the_async_api():
+    saver = BoundedInMemorySaver(max_threads=1)
+
+    async def save_both():
+        await saver.aput(_config("a"), empty_checkpoint(), {}, {})
+        await saver.aput(_config("b"), empty_checkpoint(), {}, {})
+        return await saver.aget_tuple(_config("a")), await saver.aget_tuple(_config("b"))
+
+    evicted, kept = asyncio.run(save_both())
+
+    assert evicted is None
+    assert kept is not None
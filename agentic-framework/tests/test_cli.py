@@ -1,4 +1,5 @@
 import asyncio
+import logging
 
 import pytest
 import typer
@@ -32,22 +33,80 @@ class FakeProvider:
 
 
 def test_execute_agent_without_mcp(monkeypatch):
-    monkeypatch.setattr(cli.AgentRegistry, "get", lambda name: FakeAgent)
-    monkeypatch.setattr(cli.AgentRegistry, "get_mcp_servers", lambda name: None)
+    monkeypatch.setitem(cli._AGENT_INDEX, "simple", (FakeAgent, None))
 
     result = cli.execute_agent(agent_name="simple", input_text="hello", timeout_sec=5)
     assert result == "handled:hello:None"
 
 
 def test_execute_agent_with_mcp(monkeypatch):
-    monkeypatch.setattr(cli.AgentRegistry, "get", lambda name: FakeAgent)
-    monkeypatch.setattr(cli.AgentRegistry, "get_mcp_servers", lambda name: ["web-fetch"])
+    monkeypatch.setitem(cli._AGENT_INDEX, "chef", (FakeAgent, ["web-fetch"]))
     monkeypatch.setattr(cli, "MCPProvider", FakeProvider)
 
     result = cli.execute_agent(agent_name="chef", input_text="hello", timeout_sec=5)
     assert result == "handled:hello:['mcp-tool']"
 
 
+def test_execute_agent_uses_configured_loop_factory(monkeypatch):
+    monkeypatch.setitem(cli._AGENT_INDEX, "simple", (FakeAgent, None))
+    created = []
+
+    def fake_loop_factory():
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    monkeypatch.setattr(cli, "_LOOP_FACTORY", fake_loop_factory)
+    monkeypatch.setattr(cli, "_RUNNER", None)
+
+    result = cli.execute_agent(agent_name="simple", input_text="hello", timeout_sec=5)
+    assert result == "handled:hello:None"
+    assert len(created) == 1
+
+
+def test_execute_agent_many_shares_one_event_loop(monkeypatch):
+    monkeypatch.setattr(cli, "_RUNNER", None)
+    loops = []
+
+    class LoopRecordingAgent(FakeAgent):
+        async def run(self, input_text):
+            loops.append(asyncio.get_running_loop())
+            return await super().run(input_text)
+
+    monkeypatch.setitem(cli._AGENT_INDEX, "simple", (LoopRecordingAgent, None))
+
+    results = cli.execute_agent_many(agent_name="simple", inputs=["a", "b"], timeout_sec=5)
+    assert results == ["handled:a:None", "handled:b:None"]
+    assert loops[0] is loops[1]
+
+
+def test_execute_agent_many_opens_one_mcp_session(monkeypatch):
+    sessions = []
+
+    class CountingProvider(FakeProvider):
+        def tool_session(self):
+            sessions.append(self.server_names)
+            return FakeSession()
+
+    monkeypatch.setitem(cli._AGENT_INDEX, "chef", (FakeAgent, ["web-fetch"]))
+    monkeypatch.setattr(cli, "MCPProvider", CountingProvider)
+
+    results = cli.execute_agent_many(agent_name="chef", inputs=["a", "b"], timeout_sec=5)
+    assert results == ["handled:a:['mcp-tool']", "handled:b:['mcp-tool']"]
+    assert sessions == [["web-fetch"]]
+
+
+def test_execute_agent_many_gives_each_run_its_own_timeout(monkeypatch):
+    class HalfTimeoutAgent(FakeAgent):
+        async def run(self, input_text):
+            await asyncio.sleep(0.6)
+            return input_text
+
+    monkeypatch.setitem(cli._AGENT_INDEX, "simple", (HalfTimeoutAgent, None))
+
+    assert cli.execute_agent_many(agent_name="simple", inputs=["a", "b"], timeout_sec=1) == ["a", "b"]
+
+
 def test_execute_agent_missing_agent_raises_exit(monkeypatch):
     monkeypatch.setattr(cli.AgentRegistry, "get", lambda name: None)
 
@@ -55,23 +114,35 @@ def test_execute_agent_missing_agent_raises_exit(monkeypatch):
         cli.execute_agent(agent_name="unknown", input_text="hello", timeout_sec=5)
 
 
-def test_execute_agent_timeout_raises_timeout_error(monkeypatch):
+def test_lookup_agent_memoizes_registry_entry(monkeypatch):
+    monkeypatch.setattr(cli, "_AGENT_INDEX", {})
+
+    entry = cli._lookup_agent("simple")
+
+    assert entry == (cli.AgentRegistry.get("simple"), cli.AgentRegistry.get_mcp_servers("simple"))
+    assert cli._AGENT_INDEX["simple"] is entry
+
+
+def test_execute_agent_falls_back_to_registry_for_late_registrations(monkeypatch):
     monkeypatch.setattr(cli.AgentRegistry, "get", lambda name: FakeAgent)
     monkeypatch.setattr(cli.AgentRegistry, "get_mcp_servers", lambda name: None)
 
-    async def fake_wait_for(coro, timeout):
-        coro.close()
-        raise asyncio.TimeoutError
+    result = cli.execute_agent(agent_name="registered-later", input_text="hello", timeout_sec=5)
+    assert result == "handled:hello:None"
+
 
-    monkeypatch.setattr(cli.asyncio, "wait_for", fake_wait_for)
+def test_execute_agent_timeout_raises_timeout_error(monkeypatch):
+    class SlowAgent(FakeAgent):
+        async def run(self, input_text):
+            await asyncio.sleep(10)
 
-    with pytest.raises(TimeoutError):
-        cli.execute_agent(agent_name="simple", input_text="hello", timeout_sec=5)
+    monkeypatch.setitem(cli._AGENT_INDEX, "simple", (SlowAgent, None))
 
+    with pytest.raises(TimeoutError, match="timed out after 0s"):
+        cli.execute_agent(agent_name="simple", input_text="hello", timeout_sec=0)
 
-def test_create_agent_command_handles_mcp_connection_error(monkeypatch):
-    monkeypatch.setattr(cli.AgentRegistry, "get", lambda name: FakeAgent)
 
+def test_create_agent_command_handles_mcp_connection_error(monkeypatch):
     def fake_execute_agent(agent_name, input_text, timeout_sec):
         raise MCPConnectionError("web-fetch", RuntimeError("down"))
 
@@ -90,6 +161,87 @@ def test_create_agent_command_handles_mcp_connection_error(monkeypatch):
     assert called["value"] is True
 
 
+def test_create_agent_command_echoes_result_verbatim(monkeypatch, capsys):
+    monkeypatch.setattr(cli, "execute_agent", lambda agent_name, input_text, timeout_sec: "[not markup] done")
+
+    cli.create_agent_command("news")(input_text="hello", timeout_sec=5)
+
+    out = capsys.readouterr().out
+    assert "Result from news:" in out
+    assert "[not markup] done" in out
+
+
+@pytest.mark.parametrize("verbose", [False, True])
+def test_create_agent_command_shows_causes_only_when_verbose(monkeypatch, verbose):
+    def fake_execute_agent(agent_name, input_text, timeout_sec):
+        raise RuntimeError("top") from ValueError("root")
+
+    printed = []
+    monkeypatch.setattr(cli, "execute_agent", fake_execute_agent)
+    monkeypatch.setattr(cli, "_VERBOSE", verbose)
+    monkeypatch.setattr(cli.console, "print", lambda content: printed.append(content))
+
+    with pytest.raises(typer.Exit):
+        cli.create_agent_command("news")(input_text="hello", timeout_sec=5)
+
+    assert any("cause: root" in line for line in printed) is verbose
+    assert any("Run with --verbose" in line for line in printed) is not verbose
+
+
+def test_print_chained_causes_prints_whole_chain_once(monkeypatch):
+    printed = []
+    monkeypatch.setattr(cli.console, "print", lambda content: printed.append(content))
+
+    try:
+        try:
+            raise ValueError("root")
+        except ValueError as root:
+            raise RuntimeError("middle") from root
+    except RuntimeError as middle:
+        error = KeyError("top")
+        error.__context__ = middle
+
+    cli._print_chained_causes(error)
+
+    assert printed == ["[red]  cause: middle[/red]\n[red]  cause: root[/red]"]
+
+
+def test_print_chained_causes_stops_on_cycles(monkeypatch):
+    printed = []
+    monkeypatch.setattr(cli.console, "print", lambda content: printed.append(content))
+    first = RuntimeError("first")
+    second = RuntimeError("second")
+    first.__cause__ = second
+    second.__cause__ = first
+
+    cli._print_chained_causes(first)
+
+    assert printed == ["[red]  cause: second[/red]"]
+
+
+def test_configure_logging_defers_opening_log_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "LOGS_DIR", tmp_path)
+
+    cli.configure_logging(verbose=False)
+    try:
+        handler = logging.getLogger().handlers[0]
+        assert isinstance(handler, logging.FileHandler)
+        assert handler.stream is None
+    finally:
+        logging.basicConfig(handlers=[logging.NullHandler()], force=True)
+
+
+def test_configure_logging_records_verbosity(monkeypatch, tmp_path):
+    monkeypatch.setattr(cli, "LOGS_DIR", tmp_path)
+    monkeypatch.setattr(cli, "_VERBOSE", False)
+
+    cli.configure_logging(verbose=True)
+    try:
+        assert cli._VERBOSE is True
+    finally:
+        logging.basicConfig(handlers=[logging.NullHandler()], force=True)
+
+
 def test_list_agents_prints_panel(monkeypatch):
     monkeypatch.setattr(cli.AgentRegistry, "list_agents", lambda: ["a", "b"])
     printed = {"value": None}
@@ -101,3 +253,23 @@ def test_list_agents_prints_panel(monkeypatch):
     cli.list_agents()
 
     assert printed["value"] is not None
+
+
+def test_agent_info_renders_details_in_one_print(monkeypatch):
+    class InfoAgent(FakeAgent):
+        system_prompt = "Be helpful."
+
+        def get_tools(self):
+            return []
+
+    monkeypatch.setitem(cli._AGENT_INDEX, "info-agent", (InfoAgent, ["web-fetch"]))
+    printed = []
+    monkeypatch.setattr(cli.console, "print", lambda content: printed.append(content))
+
+    cli.agent_info("info-agent")
+
+    assert len(printed) == 1
+    assert "[bold]Class:[/bold] InfoAgent" in printed[0]
+    assert "[bold]MCP Servers:[/bold] web-fetch" in printed[0]
+    assert "Be helpful." in printed[0]
+    assert "No tools configured" in printed[0]
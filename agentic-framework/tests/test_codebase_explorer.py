@@ -2,13 +2,16 @@
 
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+from agentic_framework.tools import codebase_explorer
 from agentic_framework.tools.codebase_explorer import (
     LANGUAGE_EXTENSIONS,
     LANGUAGE_PATTERNS,
     FileEditorTool,
+    FileFinderTool,
     FileFragmentReaderTool,
     FileOutlinerTool,
     StructureExplorerTool,
@@ -98,6 +101,31 @@ def helper_function():
         assert 7 in lines  # def __init__
         assert 10 in lines  # async def run
 
+    def test_python_outline_ignores_definitions_in_strings(self, outliner, temp_dir):
+        """Definitions come from the AST, so docstring text and decorators do not confuse it."""
+        code = '''"""Usage:
+
+def not_a_function():
+"""
+
+
+@decorator
+def real(a,
+         b):
+    pass
+'''
+        (temp_dir / "doc.py").write_text(code)
+
+        assert outliner.invoke("doc.py") == [{"line": 8, "signature": "def real(a,"}]
+
+    def test_python_outline_falls_back_to_regex_on_syntax_error(self, outliner, temp_dir):
+        """Files that do not parse still get a best-effort outline."""
+        (temp_dir / "broken.py").write_text("def ok():\n    pass\n\ndef broken(:\n")
+
+        result = outliner.invoke("broken.py")
+
+        assert [item["line"] for item in result] == [1, 4]
+
     def test_javascript_outline(self, outliner, temp_dir):
         """Test JavaScript file outline extraction."""
         code = """
@@ -532,6 +560,35 @@ class TestFileFragmentReaderTool:
         result = reader.invoke("test.txt:2:4")
         assert result == "line2\nline3\nline4\n"
 
+    def test_read_fragment_edges(self, reader, temp_dir):
+        """Ranges past either end are clamped, CRLF is normalized and the last line may lack a newline."""
+        (temp_dir / "crlf.txt").write_bytes(b"one\r\ntwo\r\nthree")
+        (temp_dir / "empty.txt").write_text("")
+
+        assert reader.invoke("crlf.txt:0:2") == "one\ntwo\n"
+        assert reader.invoke("crlf.txt:3:99") == "three"
+        assert reader.invoke("crlf.txt:5:9") == ""
+        assert reader.invoke("empty.txt:1:5") == ""
+
+    def test_read_fragment_counts_bare_cr_line_endings(self, reader, temp_dir):
+        """Old Mac line endings count as line breaks, as with text-mode universal newlines."""
+        (temp_dir / "cr.txt").write_bytes(b"a\rb\rc\r")
+        (temp_dir / "mixed.txt").write_bytes(b"one\rtwo\r\nthree\nfour")
+
+        assert reader.invoke("cr.txt:1:1") == "a\n"
+        assert reader.invoke("cr.txt:2:3") == "b\nc\n"
+        assert reader.invoke("mixed.txt:2:3") == "two\nthree\n"
+        assert reader.invoke("mixed.txt:4:4") == "four"
+
+    def test_read_fragment_sees_edited_file(self, reader, temp_dir):
+        """The cached line index is rebuilt when the file changes."""
+        path = temp_dir / "edit.txt"
+        path.write_text("a\nb\n")
+        assert reader.invoke("edit.txt:2:2") == "b\n"
+
+        path.write_text("first line\nsecond line\nthird\n")
+        assert reader.invoke("edit.txt:2:3") == "second line\nthird\n"
+
     def test_invalid_format(self, reader):
         """Test that invalid format returns error."""
         result = reader.invoke("invalid")
@@ -566,6 +623,90 @@ class TestStructureExplorerTool:
         assert "file2.py" in children_names
         assert "subdir" in children_names
 
+    def test_discover_structure_nests_sorted_entries_up_to_max_depth(self, explorer, temp_dir):
+        """Children are sorted by name and directories at max_depth are listed but not expanded."""
+        (temp_dir / "b").mkdir()
+        (temp_dir / "b" / "inner").mkdir()
+        (temp_dir / "b" / "inner" / "deep.py").write_text("# deep")
+        (temp_dir / "a.txt").write_text("x" * 2048)
+
+        result = explorer.invoke("2")
+
+        assert result["children"][0] == {"name": "a.txt", "type": "file", "size_kb": 2.0}
+        b = result["children"][1]
+        assert b["name"] == "b"
+        assert b["children"] == [{"name": "inner", "type": "directory", "children": []}]
+
+    def test_discover_structure_skips_ignored_paths(self, explorer, temp_dir):
+        """Entries matching any ignore pattern are left out of the tree."""
+        (temp_dir / "node_modules").mkdir()
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "__pycache__").mkdir()
+        (temp_dir / "src" / "main.py").write_text("# main")
+
+        result = explorer.invoke("3")
+
+        assert [c["name"] for c in result["children"]] == ["src"]
+        assert [c["name"] for c in result["children"][0]["children"]] == ["main.py"]
+        assert explorer._is_ignored(temp_dir.resolve().parent)
+
+
+class TestFileFinderTool:
+    """Tests for FileFinderTool."""
+
+    @pytest.fixture
+    def finder(self, tmp_path, monkeypatch):
+        codebase_explorer._list_files.cache_clear()
+        root = tmp_path.resolve()
+        calls = []
+
+        def fake_run(cmd, input=None, **kwargs):
+            calls.append(cmd[0])
+            if cmd[0] == "fd":
+                stdout = "".join(f"{root / name}\n" for name in ("src/app.py", "src/config.py", "README.md"))
+                return SimpleNamespace(returncode=0, stdout=stdout, stderr="")
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(codebase_explorer.subprocess, "run", fake_run)
+        monkeypatch.setattr(codebase_explorer, "fuzz_process", None)
+        yield FileFinderTool(str(root)), calls
+        codebase_explorer._list_files.cache_clear()
+
+    def test_reuses_file_listing_between_searches(self, finder):
+        """Searches within the listing TTL run fd only once and return relative paths."""
+        tool, calls = finder
+
+        assert tool.invoke("config") == ["src/config.py"]
+        assert tool.invoke(".py") == ["src/app.py", "src/config.py"]
+        assert calls.count("fd") == 1
+
+    def test_ranks_with_rapidfuzz_when_available(self, finder, monkeypatch):
+        """With rapidfuzz installed, fzf is not spawned."""
+        tool, calls = finder
+        seen = {}
+
+        def fake_extract(pattern, choices, scorer, limit, score_cutoff):
+            seen.update(pattern=pattern, choices=choices, limit=limit)
+            return [("README.md", 90.0, 2)]
+
+        monkeypatch.setattr(codebase_explorer, "fuzz", SimpleNamespace(WRatio=object()))
+        monkeypatch.setattr(codebase_explorer, "fuzz_process", SimpleNamespace(extract=fake_extract))
+
+        assert tool.invoke("readme") == ["README.md"]
+        assert seen == {"pattern": "readme", "choices": ("src/app.py", "src/config.py", "README.md"), "limit": 30}
+        assert calls == ["fd"]
+
+    def test_fd_failure_is_reported_and_not_cached(self, monkeypatch, tmp_path):
+        codebase_explorer._list_files.cache_clear()
+
+        def failing_run(cmd, **kwargs):
+            return SimpleNamespace(returncode=1, stdout="", stderr="fd: boom")
+
+        monkeypatch.setattr(codebase_explorer.subprocess, "run", failing_run)
+
+        assert FileFinderTool(str(tmp_path)).invoke("x") == "Error executing fd: fd: boom"
+        assert codebase_explorer._list_files.cache_info().currsize == 0
+
 
 class TestLanguagePatterns:
     """Tests to verify all language patterns are valid regex."""
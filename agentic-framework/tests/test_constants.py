@@ -9,17 +9,25 @@ import pytest
 requires_external_service = pytest.mark.skip(reason="Requires external service credentials")
 
 
+def _clear_provider_caches():
+    from agentic_framework.constants import refresh_provider_cache
+
+    refresh_provider_cache()
+
+
 @pytest.fixture(autouse=True)
 def reset_env():
-    """Reset environment variables before each test."""
+    """Reset environment variables and cached provider detection around each test."""
     # Save original env vars
     original = dict(os.environ)
+    _clear_provider_caches()
 
     yield
 
     # Restore original env vars
     os.environ.clear()
     os.environ.update(original)
+    _clear_provider_caches()
 
 
 class TestDetectProvider:
@@ -427,6 +435,31 @@ class TestDetectProvider:
 
         assert detect_provider() == "anthropic"
 
+    def test_detect_provider_ignores_empty_values(self, monkeypatch):
+        """Test an empty API key is treated as unset."""
+        from agentic_framework.constants import _PROVIDER_RULES, detect_provider
+
+        for env_keys, _ in _PROVIDER_RULES:
+            for key in env_keys:
+                monkeypatch.delenv(key, raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "")
+        monkeypatch.setenv("GROQ_API_KEY", "test-key")
+
+        assert detect_provider() == "groq"
+
+    def test_detect_provider_is_cached_until_cleared(self, monkeypatch):
+        """Test detect_provider() caches its result until refresh_provider_cache() is called."""
+        from agentic_framework.constants import detect_provider, refresh_provider_cache
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        assert detect_provider() == "anthropic"
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY")
+        assert detect_provider() == "anthropic"
+
+        refresh_provider_cache()
+        assert detect_provider() != "anthropic"
+
 
 class TestGetDefaultModel:
     """Tests for get_default_model() function."""
@@ -570,6 +603,19 @@ class TestGetDefaultModel:
         for provider in provider_types:
             assert provider in DEFAULT_MODELS, f"Missing default model for provider: {provider}"
 
+    def test_default_models_are_read_only(self):
+        """Test that DEFAULT_MODELS cannot be mutated at runtime."""
+        from agentic_framework.constants import DEFAULT_MODELS
+
+        with pytest.raises(TypeError):
+            DEFAULT_MODELS["openai"] = "other-model"  # type: ignore[index]
+
+    def test_all_model_name_env_vars_defined(self):
+        """Test that every provider has a model-name override variable."""
+        from agentic_framework.constants import _MODEL_NAME_ENV_VARS, Provider
+
+        assert set(_MODEL_NAME_ENV_VARS) == set(get_args(Provider))
+
 
 class TestCreateModel:
     """Tests for _create_model() function."""
@@ -926,3 +972,92 @@ class TestCreateModel:
         model_attr = getattr(model, "model_id", model.model if hasattr(model, "model") else None)
         assert model_attr == "anthropic.claude-3-5-sonnet-20241022-v2:0"
         assert model.temperature == 0.5
+
+    def test_create_model_shares_instances_per_settings(self, monkeypatch):
+        """Test models with the same provider, name and temperature are created once."""
+        from agentic_framework import constants
+
+        created = []
+
+        def fake_factory(model_name, temperature):
+            created.append((model_name, temperature))
+            return object()
+
+        monkeypatch.setitem(constants._PROVIDER_FACTORIES, constants.detect_provider(), fake_factory)
+
+        first = constants._create_model("gpt-4", 0.5)
+        assert constants._create_model("gpt-4", 0.5) is first
+        assert constants._create_model("gpt-4", 0.1) is not first
+        assert created == [("gpt-4", 0.5), ("gpt-4", 0.1)]
+
+        constants.refresh_provider_cache()
+        assert constants._create_model("gpt-4", 0.5) is not first
+
+    def test_provider_factories_cover_all_providers(self):
+        """Test every Provider literal has a model factory registered."""
+        from agentic_framework.constants import _PROVIDER_FACTORIES, Provider
+
+        assert set(_PROVIDER_FACTORIES) == set(get_args(Provider))
+
+
+class TestLegacyDefaultModel:
+    """Tests for the lazily resolved DEFAULT_MODEL module attribute."""
+
+    def test_default_model_resolved_on_access(self, monkeypatch):
+        """Test DEFAULT_MODEL follows the detected provider at access time."""
+        import agentic_framework.constants as constants
+
+        monkeypatch.setattr(constants, "get_default_model", lambda: "lazy-model")
+
+        assert constants.DEFAULT_MODEL == "lazy-model"
+
+    def test_unknown_attribute_raises(self):
+        """Test the module __getattr__ hook still raises for unknown names."""
+        import agentic_framework.constants as constants
+
+        with pytest.raises(AttributeError):
+            constants.NOT_A_CONSTANT
+
+
+class TestLoadEnv:
+    """Tests for .env loading."""
+
+    def test_loads_dotenv(self, monkeypatch):
+        """Test that .env is loaded when AGENTIC_SKIP_DOTENV is unset."""
+        import dotenv
+
+        from agentic_framework import constants
+
+        calls = []
+        monkeypatch.delenv("AGENTIC_SKIP_DOTENV", raising=False)
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda: calls.append(True))
+
+        constants._load_env()
+
+        assert calls == [True]
+
+    def test_skip_dotenv_opt_out(self, monkeypatch):
+        """Test that AGENTIC_SKIP_DOTENV=1 skips loading .env."""
+        import dotenv
+
+        from agentic_framework import constants
+
+        calls = []
+        monkeypatch.setenv("AGENTIC_SKIP_DOTENV", "1")
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda: calls.append(True))
+
+        constants._load_env()
+
+        assert calls == []
+
+
+class TestBaseDir:
+    """Tests for the project root paths."""
+
+    def test_base_dir_is_project_root(self):
+        """Test that BASE_DIR points at the directory holding src/ and matches BASE_DIR_STR."""
+        from agentic_framework import constants
+
+        assert constants.BASE_DIR.is_absolute()
+        assert (constants.BASE_DIR / "src" / "agentic_framework" / "constants.py").is_file()
+        assert constants.BASE_DIR_STR == str(constants.BASE_DIR)
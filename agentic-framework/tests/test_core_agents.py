@@ -1,4 +1,6 @@
 import asyncio
+import subprocess
+import sys
 from types import SimpleNamespace
 
 from agentic_framework.core.chef_agent import ChefAgent
@@ -10,6 +12,9 @@ class DummyGraph:
     async def ainvoke(self, payload, config):
         return {"messages": [SimpleNamespace(content="done")]}
 
+    def copy(self, update=None):
+        return self
+
 
 def test_chef_agent_prompt_and_mcp(monkeypatch):
     monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
@@ -23,6 +28,22 @@ def test_chef_agent_prompt_and_mcp(monkeypatch):
     assert result == "done"
 
 
+def test_core_agents_have_no_instance_dict(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
+
+    for agent_cls in (ChefAgent, TravelAgent, NewsAgent):
+        assert not hasattr(agent_cls(initial_mcp_tools=[]), "__dict__")
+
+
+def test_core_agents_share_class_level_system_prompt(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
+
+    first = ChefAgent(initial_mcp_tools=[])
+    second = ChefAgent(initial_mcp_tools=[])
+
+    assert first.system_prompt is second.system_prompt is ChefAgent.SYSTEM_PROMPT
+
+
 def test_travel_and_news_prompts(monkeypatch):
     monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
     monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: DummyGraph())
@@ -37,3 +58,14 @@ def test_travel_and_news_prompts(monkeypatch):
     assert "news agent" in news.system_prompt
     assert travel_result == "done"
     assert news_result == "done"
+
+
+def test_core_package_imports_langgraph_agent_lazily():
+    code = (
+        "import sys\n"
+        "import agentic_framework.core.simple_agent\n"
+        "assert 'agentic_framework.core.langgraph_agent' not in sys.modules\n"
+        "from agentic_framework.core import LangGraphMCPAgent\n"
+        "assert LangGraphMCPAgent.__module__ == 'agentic_framework.core.langgraph_agent'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
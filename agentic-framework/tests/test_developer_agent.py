@@ -8,6 +8,9 @@ class DummyGraph:
     async def ainvoke(self, payload, config):
         return {"messages": [SimpleNamespace(content="done")]}
 
+    def copy(self, update=None):
+        return self
+
 
 def test_developer_agent_system_prompt(monkeypatch):
     monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
@@ -98,3 +101,13 @@ def test_developer_agent_with_mcp_tools(monkeypatch):
     assert len(tools) == 7
     tool_names = {tool.name for tool in tools}
     assert "webfetch" in tool_names
+
+
+def test_developer_agent_instances_share_local_tools(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: DummyGraph())
+
+    first = DeveloperAgent(initial_mcp_tools=[])
+    second = DeveloperAgent(initial_mcp_tools=[])
+
+    assert all(a is b for a, b in zip(first.get_tools(), second.get_tools(), strict=True))
@@ -1,9 +1,15 @@
 """Tests for the GitHub PR Reviewer agent."""
 
 import asyncio
+import json
+import threading
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+import requests
+
+from agentic_framework.core import github_pr_reviewer
 from agentic_framework.core.github_pr_reviewer import (
     GitHubPRReviewerAgent,
     get_pr_comments,
@@ -15,10 +21,27 @@ from agentic_framework.core.github_pr_reviewer import (
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_github_client_state() -> None:
+    github_pr_reviewer._ETAG_CACHE.clear()
+    github_pr_reviewer._RATE_LIMIT_RESETS.clear()
+    github_pr_reviewer._LOW_QUOTAS.clear()
+    github_pr_reviewer._LAST_REQUEST_AT.clear()
+    github_pr_reviewer._RATE_LIMITER = github_pr_reviewer._TokenBucket(rate=80 / 60, capacity=10)
+
+
+def _json_bytes(data: object) -> bytes:
+    """Encode a fake GitHub response body the way it arrives on ``response.content``."""
+    return json.dumps(data).encode()
+
+
 class DummyGraph:
     async def ainvoke(self, payload: dict, config: dict) -> dict:
         return {"messages": [SimpleNamespace(content="done")]}
 
+    def copy(self, update: dict | None = None) -> "DummyGraph":
+        return self
+
 
 # ---------------------------------------------------------------------------
 # Agent-level tests
@@ -61,6 +84,47 @@ def test_github_pr_reviewer_tools_count(monkeypatch: object) -> None:
     assert tool_names == expected
 
 
+def test_github_pr_reviewer_instances_share_tools(monkeypatch: object) -> None:
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())  # type: ignore[attr-defined]
+
+    first = GitHubPRReviewerAgent(initial_mcp_tools=[]).get_tools()
+    second = GitHubPRReviewerAgent(initial_mcp_tools=[]).get_tools()
+
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_github_pr_reviewer_async_tool_calls_overlap_off_the_event_loop(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+    barrier = threading.Barrier(2, timeout=5)
+    loop_threads: list[threading.Thread] = []
+
+    def fake_get(url: str, **kwargs: object) -> MagicMock:
+        assert threading.current_thread() not in loop_threads
+        barrier.wait()
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.links = {}
+        response.content = _json_bytes({"title": url.rsplit("/", 1)[-1]})
+        return response
+
+    tools_by_name = {t.name: t for t in github_pr_reviewer._github_tools()}
+
+    async def review_two() -> list[str]:
+        loop_threads.append(threading.current_thread())
+        metadata = tools_by_name["get_pr_metadata"]
+        return await asyncio.gather(
+            metadata.ainvoke({"repo": "owner/repo", "pr_number": 1}),
+            metadata.ainvoke({"repo": "owner/repo", "pr_number": 2}),
+        )
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=fake_get):
+        results = asyncio.run(review_two())
+
+    assert results[0].startswith("PR #1: 1")
+    assert results[1].startswith("PR #2: 2")
+
+
 def test_github_pr_reviewer_tool_descriptions(monkeypatch: object) -> None:
     monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())  # type: ignore[attr-defined]
     monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: DummyGraph())  # type: ignore[attr-defined]
@@ -85,6 +149,15 @@ def test_github_pr_reviewer_run(monkeypatch: object) -> None:
     assert result == "done"
 
 
+def test_github_pr_reviewer_constructs_without_token(monkeypatch: object) -> None:
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)  # type: ignore[attr-defined]
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())  # type: ignore[attr-defined]
+
+    # Construction must not need the token (e.g. for `info github-pr-reviewer`); the tools report it.
+    agent = GitHubPRReviewerAgent(initial_mcp_tools=[])
+    assert len(agent.get_tools()) == 6
+
+
 # ---------------------------------------------------------------------------
 # Missing-token tests (all 6 tools)
 # ---------------------------------------------------------------------------
@@ -93,8 +166,7 @@ def test_github_pr_reviewer_run(monkeypatch: object) -> None:
 def test_get_pr_diff_missing_token(monkeypatch: object) -> None:
     monkeypatch.delenv("GITHUB_TOKEN", raising=False)  # type: ignore[attr-defined]
     result = get_pr_diff("owner/repo", 42)
-    assert "Error" in result
-    assert "GITHUB_TOKEN" in result
+    assert result.startswith("Error: GITHUB_TOKEN environment variable is not set.")
 
 
 def test_get_pr_comments_missing_token(monkeypatch: object) -> None:
@@ -139,7 +211,7 @@ def test_get_pr_metadata_missing_token(monkeypatch: object) -> None:
 
 def test_get_pr_diff_api_error(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", side_effect=Exception("timeout")):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=Exception("timeout")):
         result = get_pr_diff("owner/repo", 42)
     assert "Error" in result
     assert "timeout" in result
@@ -147,35 +219,35 @@ def test_get_pr_diff_api_error(monkeypatch: object) -> None:
 
 def test_get_pr_comments_api_error(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", side_effect=Exception("503")):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=Exception("503")):
         result = get_pr_comments("owner/repo", 42)
     assert "Error" in result
 
 
 def test_post_review_comment_api_error(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
-    with patch("agentic_framework.core.github_pr_reviewer.requests.post", side_effect=Exception("422")):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.post", side_effect=Exception("422")):
         result = post_review_comment("owner/repo", 42, "abc", "file.py", 5, "comment")
     assert "Error" in result
 
 
 def test_post_general_comment_api_error(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
-    with patch("agentic_framework.core.github_pr_reviewer.requests.post", side_effect=Exception("403")):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.post", side_effect=Exception("403")):
         result = post_general_comment("owner/repo", 42, "summary")
     assert "Error" in result
 
 
 def test_reply_to_review_comment_api_error(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
-    with patch("agentic_framework.core.github_pr_reviewer.requests.post", side_effect=Exception("404")):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.post", side_effect=Exception("404")):
         result = reply_to_review_comment("owner/repo", 42, 999, "reply")
     assert "Error" in result
 
 
 def test_get_pr_metadata_api_error(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", side_effect=Exception("not found")):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=Exception("not found")):
         result = get_pr_metadata("owner/repo", 42)
     assert "Error" in result
 
@@ -189,18 +261,21 @@ def test_get_pr_diff_success(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
 
     mock_response = MagicMock()
-    mock_response.json.return_value = [
-        {
-            "filename": "src/main.py",
-            "status": "modified",
-            "additions": 5,
-            "deletions": 2,
-            "patch": "@@ -1,3 +1,6 @@\n+new line",
-        }
-    ]
+    mock_response.links = {}
+    mock_response.content = _json_bytes(
+        [
+            {
+                "filename": "src/main.py",
+                "status": "modified",
+                "additions": 5,
+                "deletions": 2,
+                "patch": "@@ -1,3 +1,6 @@\n+new line",
+            }
+        ]
+    )
     mock_response.raise_for_status = MagicMock()
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=mock_response):
         result = get_pr_diff("owner/repo", 42)
 
     assert "src/main.py" in result
@@ -209,22 +284,78 @@ def test_get_pr_diff_success(monkeypatch: object) -> None:
     assert "@@ -1,3" in result
 
 
+def test_get_pr_diff_fetches_remaining_pages_in_order(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+    base = "https://api.github.com/repos/owner/repo/pulls/42/files?per_page=100"
+
+    def page(number: int, **extra: object) -> MagicMock:
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.links = extra.get("links", {})
+        response.content = _json_bytes([{"filename": f"file{number}.py", "status": "modified"}])
+        return response
+
+    pages = {
+        base: page(1, links={"next": {"url": f"{base}&page=2"}, "last": {"url": f"{base}&page=3"}}),
+        f"{base}&page=2": page(2),
+        f"{base}&page=3": page(3),
+    }
+
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=lambda url, **kwargs: pages[url],
+    ) as mock_get:
+        result = get_pr_diff("owner/repo", 42)
+
+    assert mock_get.call_count == 3
+    assert "(3 file(s) changed)" in result
+    assert result.index("file1.py") < result.index("file2.py") < result.index("file3.py")
+
+
+def test_get_pr_diff_clips_large_patches_and_skips_lockfiles(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+    monkeypatch.setenv("AGENTIC_MAX_PATCH_BYTES", "10")  # type: ignore[attr-defined]
+
+    mock_response = MagicMock()
+    mock_response.links = {}
+    mock_response.content = _json_bytes(
+        [
+            {"filename": "src/big.py", "status": "modified", "patch": "+" + "x" * 29},
+            {"filename": "web/package-lock.json", "status": "modified", "patch": "+lockfile-contents"},
+            {"filename": "src/small.py", "status": "modified", "patch": "+tiny"},
+        ]
+    )
+    mock_response.raise_for_status = MagicMock()
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=mock_response):
+        result = get_pr_diff("owner/repo", 42)
+
+    assert "+xxxxxxxxx\n…[truncated 20 bytes]" in result
+    assert "lockfile-contents" not in result
+    assert "web/package-lock.json" in result
+    assert "+tiny" in result
+
+
 def test_get_pr_diff_no_patch(monkeypatch: object) -> None:
     """Files without a patch (e.g. binary files) should not crash."""
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
 
     mock_response = MagicMock()
-    mock_response.json.return_value = [
-        {
-            "filename": "image.png",
-            "status": "added",
-            "additions": 0,
-            "deletions": 0,
-        }
-    ]
+    mock_response.links = {}
+    mock_response.content = _json_bytes(
+        [
+            {
+                "filename": "image.png",
+                "status": "added",
+                "additions": 0,
+                "deletions": 0,
+            }
+        ]
+    )
     mock_response.raise_for_status = MagicMock()
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=mock_response):
         result = get_pr_diff("owner/repo", 42)
 
     assert "image.png" in result
@@ -236,32 +367,38 @@ def test_get_pr_comments_with_both_types(monkeypatch: object) -> None:
 
     review_response = MagicMock()
     review_response.raise_for_status = MagicMock()
-    review_response.json.return_value = [
-        {
-            "id": 1,
-            "user": {"login": "reviewer"},
-            "path": "src/main.py",
-            "line": 10,
-            "body": "Consider extracting this into a function",
-        }
-    ]
+    review_response.content = _json_bytes(
+        [
+            {
+                "id": 1,
+                "user": {"login": "reviewer"},
+                "path": "src/main.py",
+                "line": 10,
+                "body": "Consider extracting this into a function",
+            }
+        ]
+    )
 
     issue_response = MagicMock()
     issue_response.raise_for_status = MagicMock()
-    issue_response.json.return_value = [
-        {
-            "id": 2,
-            "user": {"login": "author"},
-            "body": "Thanks for the review!",
-        }
-    ]
-
-    with patch(
-        "agentic_framework.core.github_pr_reviewer.requests.get",
-        side_effect=[review_response, issue_response],
-    ):
+    issue_response.content = _json_bytes(
+        [
+            {
+                "id": 2,
+                "user": {"login": "author"},
+                "body": "Thanks for the review!",
+            }
+        ]
+    )
+
+    def fake_get(url: str, **kwargs: object) -> MagicMock:
+        return review_response if "/pulls/" in url else issue_response
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=fake_get) as mock_get:
         result = get_pr_comments("owner/repo", 42)
 
+    assert mock_get.call_count == 2
+
     assert "reviewer" in result
     assert "src/main.py" in result
     assert "Consider extracting" in result
@@ -269,17 +406,32 @@ def test_get_pr_comments_with_both_types(monkeypatch: object) -> None:
     assert "Thanks for the review" in result
 
 
+def test_get_pr_comments_fetches_both_listings_concurrently(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    empty_response = MagicMock()
+    empty_response.raise_for_status = MagicMock()
+    empty_response.content = _json_bytes([])
+
+    def fake_get(url: str, **kwargs: object) -> MagicMock:
+        both_in_flight.wait()  # breaks (and the tool reports an error) unless both GETs overlap
+        return empty_response
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=fake_get):
+        result = get_pr_comments("owner/repo", 42)
+
+    assert "Error" not in result
+
+
 def test_get_pr_comments_empty(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
 
     empty_response = MagicMock()
     empty_response.raise_for_status = MagicMock()
-    empty_response.json.return_value = []
+    empty_response.content = _json_bytes([])
 
-    with patch(
-        "agentic_framework.core.github_pr_reviewer.requests.get",
-        side_effect=[empty_response, empty_response],
-    ):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=empty_response):
         result = get_pr_comments("owner/repo", 42)
 
     assert "None" in result
@@ -292,7 +444,7 @@ def test_post_review_comment_success(monkeypatch: object) -> None:
     mock_response.raise_for_status = MagicMock()
     mock_response.json.return_value = {"html_url": "https://github.com/owner/repo/pull/42#discussion_r1"}
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.post", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.post", return_value=mock_response):
         result = post_review_comment("owner/repo", 42, "abc123", "src/main.py", 10, "Bug here")
 
     assert "src/main.py" in result
@@ -307,7 +459,7 @@ def test_post_general_comment_success(monkeypatch: object) -> None:
     mock_response.raise_for_status = MagicMock()
     mock_response.json.return_value = {"html_url": "https://github.com/owner/repo/pull/42#issuecomment-1"}
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.post", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.post", return_value=mock_response):
         result = post_general_comment("owner/repo", 42, "Great PR!")
 
     assert "PR #42" in result
@@ -321,7 +473,7 @@ def test_reply_to_review_comment_success(monkeypatch: object) -> None:
     mock_response.raise_for_status = MagicMock()
     mock_response.json.return_value = {"html_url": "https://github.com/owner/repo/pull/42#discussion_r2"}
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.post", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.post", return_value=mock_response):
         result = reply_to_review_comment("owner/repo", 42, 100, "Thanks for the feedback!")
 
     assert "100" in result
@@ -333,19 +485,21 @@ def test_get_pr_metadata_success(monkeypatch: object) -> None:
 
     mock_response = MagicMock()
     mock_response.raise_for_status = MagicMock()
-    mock_response.json.return_value = {
-        "title": "Add feature X",
-        "body": "This PR adds feature X",
-        "user": {"login": "contributor"},
-        "state": "open",
-        "base": {"ref": "main"},
-        "head": {"ref": "feature-x", "sha": "abc123def456"},
-        "changed_files": 3,
-        "additions": 50,
-        "deletions": 10,
-    }
+    mock_response.content = _json_bytes(
+        {
+            "title": "Add feature X",
+            "body": "This PR adds feature X",
+            "user": {"login": "contributor"},
+            "state": "open",
+            "base": {"ref": "main"},
+            "head": {"ref": "feature-x", "sha": "abc123def456"},
+            "changed_files": 3,
+            "additions": 50,
+            "deletions": 10,
+        }
+    )
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=mock_response):
         result = get_pr_metadata("owner/repo", 42)
 
     assert "Add feature X" in result
@@ -361,25 +515,90 @@ def test_get_pr_metadata_success(monkeypatch: object) -> None:
 # ---------------------------------------------------------------------------
 
 
+def test_github_session_pools_connections_without_adapter_retries() -> None:
+    from agentic_framework.core import github_pr_reviewer
+
+    adapter = github_pr_reviewer._SESSION.get_adapter("https://api.github.com/repos/owner/repo")
+
+    assert adapter._pool_maxsize == 10  # type: ignore[attr-defined]
+    assert adapter.max_retries.total == 0  # type: ignore[attr-defined]
+
+
+def test_get_pr_metadata_revalidates_with_etag(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+
+    fresh = MagicMock()
+    fresh.status_code = 200
+    fresh.headers = {"ETag": '"v1"'}
+    fresh.content = _json_bytes({"title": "Cached title", "head": {"sha": "abc"}})
+
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    not_modified.headers = {}
+
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=[fresh, not_modified],
+    ) as mock_get:
+        first = get_pr_metadata("owner/repo", 42)
+        second = get_pr_metadata("owner/repo", 42)
+
+    assert first == second
+    assert "Cached title" in second
+    assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+    not_modified.json.assert_not_called()
+
+
+def test_etag_revalidation_survives_eviction_by_another_worker(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+
+    fresh = MagicMock()
+    fresh.status_code = 200
+    fresh.headers = {"ETag": '"v1"'}
+    fresh.content = _json_bytes({"title": "Cached title", "head": {"sha": "abc"}})
+
+    not_modified = MagicMock()
+    not_modified.status_code = 304
+    not_modified.headers = {}
+
+    responses = iter([fresh, not_modified])
+
+    def get(*args: object, **kwargs: object) -> MagicMock:
+        response = next(responses)
+        if response is not_modified:
+            github_pr_reviewer._ETAG_CACHE.clear()
+        return response
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=get):
+        first = get_pr_metadata("owner/repo", 42)
+        second = get_pr_metadata("owner/repo", 42)
+
+    assert first == second
+
+
 def test_get_pr_diff_retries_on_429_and_succeeds(monkeypatch: object) -> None:
     monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
 
     rate_limited = MagicMock()
     rate_limited.status_code = 429
+    rate_limited.headers = {}
 
     success = MagicMock()
+    success.links = {}
     success.status_code = 200
     success.raise_for_status = MagicMock()
-    success.json.return_value = []
+    success.content = _json_bytes([])
 
     with patch(
-        "agentic_framework.core.github_pr_reviewer.requests.get",
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
         side_effect=[rate_limited, success],
     ):
-        with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
-            result = get_pr_diff("owner/repo", 42)
+        with patch("agentic_framework.core.github_pr_reviewer._RANDOM.uniform", side_effect=lambda low, high: high):
+            with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+                result = get_pr_diff("owner/repo", 42)
 
-    mock_sleep.assert_called_once_with(1)  # 2**0 = 1s first backoff
+    mock_sleep.assert_called_once_with(1)  # full jitter capped at 2**0 = 1s on the first backoff
     assert "Error" not in result
     assert "0 file(s)" in result
 
@@ -389,6 +608,7 @@ def test_post_general_comment_retries_on_503(monkeypatch: object) -> None:
 
     unavailable = MagicMock()
     unavailable.status_code = 503
+    unavailable.headers = {}
 
     success = MagicMock()
     success.status_code = 200
@@ -396,17 +616,182 @@ def test_post_general_comment_retries_on_503(monkeypatch: object) -> None:
     success.json.return_value = {"html_url": "https://github.com/owner/repo/pull/1#issuecomment-1"}
 
     with patch(
-        "agentic_framework.core.github_pr_reviewer.requests.post",
+        "agentic_framework.core.github_pr_reviewer._SESSION.post",
         side_effect=[unavailable, success],
     ):
-        with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
-            result = post_general_comment("owner/repo", 1, "summary")
+        with patch("agentic_framework.core.github_pr_reviewer._RANDOM.uniform", side_effect=lambda low, high: high):
+            with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+                result = post_general_comment("owner/repo", 1, "summary")
 
     mock_sleep.assert_called_once_with(1)
     assert "Error" not in result
     assert "https://github.com" in result
 
 
+def test_get_pr_metadata_retries_connection_errors_and_502(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+
+    bad_gateway = MagicMock()
+    bad_gateway.status_code = 502
+    bad_gateway.headers = {}
+
+    success = MagicMock()
+    success.status_code = 200
+    success.headers = {}
+    success.content = _json_bytes({"title": "Recovered"})
+
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=[requests.exceptions.ConnectionError("reset by peer"), bad_gateway, success],
+    ):
+        with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+            result = get_pr_metadata("owner/repo", 42)
+
+    assert mock_sleep.call_count == 2
+    assert 0 <= mock_sleep.call_args_list[0].args[0] <= 1
+    assert 0 <= mock_sleep.call_args_list[1].args[0] <= 2
+    assert "Recovered" in result
+
+
+def test_get_pr_metadata_reports_persistent_timeouts(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=requests.exceptions.Timeout("read timed out"),
+    ) as mock_get:
+        with patch("agentic_framework.core.github_pr_reviewer.time.sleep"):
+            result = get_pr_metadata("owner/repo", 42)
+
+    assert mock_get.call_count == 3
+    assert "read timed out" in result
+
+
+def test_github_request_does_not_sleep_after_the_last_attempt() -> None:
+    unavailable = MagicMock()
+    unavailable.status_code = 503
+    unavailable.headers = {}
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=unavailable) as mock_get:
+        with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+            response = github_pr_reviewer._github_request("get", "https://api.github.com/x")
+
+    assert response is unavailable
+    assert mock_get.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+def test_github_request_does_not_retry_non_transient_exceptions() -> None:
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=requests.exceptions.InvalidURL("bad url"),
+    ) as mock_get:
+        with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+            with pytest.raises(requests.exceptions.InvalidURL):
+                github_pr_reviewer._github_request("get", "https://api.github.com/x")
+
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_github_request_spreads_requests_when_quota_runs_low(monkeypatch: object) -> None:
+    clock = [1000.0]
+
+    def fake_sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    monkeypatch.setattr("agentic_framework.core.github_pr_reviewer.time.time", lambda: clock[0])  # type: ignore[attr-defined]
+    monkeypatch.setattr("agentic_framework.core.github_pr_reviewer.time.sleep", fake_sleep)  # type: ignore[attr-defined]
+
+    low = MagicMock()
+    low.status_code = 200
+    low.headers = {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "1100"}
+    healthy = MagicMock()
+    healthy.status_code = 200
+    healthy.headers = {"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": "4600"}
+    sent_at: list[float] = []
+
+    def fake_get(url: str, **kwargs: object) -> MagicMock:
+        sent_at.append(clock[0])
+        return [low, low, healthy, healthy][len(sent_at) - 1]
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=fake_get):
+        for _ in range(4):
+            github_pr_reviewer._github_request("get", "https://api.github.com/x")
+
+    # 10 calls left for 100s: the next call waits 10s, the one after (10 left for 90s) 9s,
+    # and pacing stops once the quota has recovered.
+    assert sent_at == [1000.0, 1010.0, 1019.0, 1019.0]
+
+
+def test_github_request_honors_retry_after(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+
+    rate_limited = MagicMock()
+    rate_limited.status_code = 429
+    rate_limited.headers = {"Retry-After": "7"}
+
+    success = MagicMock()
+    success.links = {}
+    success.status_code = 200
+    success.headers = {}
+    success.content = _json_bytes([])
+
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=[rate_limited, success],
+    ):
+        with patch("agentic_framework.core.github_pr_reviewer._RANDOM.uniform", return_value=0.25):
+            with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+                result = get_pr_diff("owner/repo", 42)
+
+    mock_sleep.assert_called_once_with(7.25)
+    assert "0 file(s)" in result
+
+
+def test_github_request_retries_exhausted_rate_limit_until_reset(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+    monkeypatch.setattr("agentic_framework.core.github_pr_reviewer.time.time", lambda: 1000.0)  # type: ignore[attr-defined]
+
+    exhausted = MagicMock()
+    exhausted.status_code = 403
+    exhausted.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1005"}
+
+    success = MagicMock()
+    success.links = {}
+    success.status_code = 200
+    success.headers = {"X-RateLimit-Remaining": "4999"}
+    success.content = _json_bytes([])
+
+    with patch(
+        "agentic_framework.core.github_pr_reviewer._SESSION.get",
+        side_effect=[exhausted, success],
+    ):
+        with patch("agentic_framework.core.github_pr_reviewer._RANDOM.uniform", return_value=0.0):
+            with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+                result = get_pr_diff("owner/repo", 42)
+
+    mock_sleep.assert_called_once_with(5.0)
+    assert "Error" not in result
+
+
+def test_github_request_returns_rate_limited_response_when_reset_is_far(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+
+    exhausted = MagicMock()
+    exhausted.status_code = 403
+    exhausted.headers = {"Retry-After": "3600"}
+    exhausted.raise_for_status.side_effect = Exception("403 rate limit exceeded")
+
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=exhausted) as mock_get:
+        with patch("agentic_framework.core.github_pr_reviewer.time.sleep") as mock_sleep:
+            result = get_pr_diff("owner/repo", 42)
+
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
+    assert "rate limit" in result
+
+
 # ---------------------------------------------------------------------------
 # Line-number validation tests
 # ---------------------------------------------------------------------------
@@ -432,20 +817,83 @@ def test_get_pr_metadata_null_body(monkeypatch: object) -> None:
 
     mock_response = MagicMock()
     mock_response.raise_for_status = MagicMock()
-    mock_response.json.return_value = {
-        "title": "Quick fix",
-        "body": None,
-        "user": {"login": "dev"},
-        "state": "open",
-        "base": {"ref": "main"},
-        "head": {"ref": "fix", "sha": "deadbeef"},
-        "changed_files": 1,
-        "additions": 2,
-        "deletions": 1,
-    }
+    mock_response.content = _json_bytes(
+        {
+            "title": "Quick fix",
+            "body": None,
+            "user": {"login": "dev"},
+            "state": "open",
+            "base": {"ref": "main"},
+            "head": {"ref": "fix", "sha": "deadbeef"},
+            "changed_files": 1,
+            "additions": 2,
+            "deletions": 1,
+        }
+    )
 
-    with patch("agentic_framework.core.github_pr_reviewer.requests.get", return_value=mock_response):
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", return_value=mock_response):
         result = get_pr_metadata("owner/repo", 42)
 
     assert "Quick fix" in result
     assert "deadbeef" in result
+
+
+def test_get_headers_reuses_headers_per_token(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "token-a")  # type: ignore[attr-defined]
+    first = github_pr_reviewer._get_headers()
+    assert github_pr_reviewer._get_headers() is first
+    assert first["Authorization"] == "Bearer token-a"
+
+    monkeypatch.setenv("GITHUB_TOKEN", "token-b")  # type: ignore[attr-defined]
+    assert github_pr_reviewer._get_headers()["Authorization"] == "Bearer token-b"
+
+
+def test_token_bucket_allows_burst_then_paces(monkeypatch: object) -> None:
+    now = [100.0]
+    sleeps: list[float] = []
+    monkeypatch.setattr("agentic_framework.core.github_pr_reviewer.time.monotonic", lambda: now[0])  # type: ignore[attr-defined]
+    monkeypatch.setattr("agentic_framework.core.github_pr_reviewer.time.sleep", sleeps.append)  # type: ignore[attr-defined]
+    bucket = github_pr_reviewer._TokenBucket(rate=2.0, capacity=2)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+
+    bucket.acquire()
+    assert sleeps == [0.5]
+
+    now[0] += 10.0  # refills, but never above capacity
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == [0.5]
+
+
+def test_identical_concurrent_gets_share_one_request(monkeypatch: object) -> None:
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")  # type: ignore[attr-defined]
+    started, release = threading.Event(), threading.Event()
+
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = _json_bytes({"title": "Shared"})
+
+    def slow_get(url: str, **kwargs: object) -> MagicMock:
+        started.set()
+        release.wait(timeout=5)
+        return response
+
+    results: list[str] = []
+    with patch("agentic_framework.core.github_pr_reviewer._SESSION.get", side_effect=slow_get) as mock_get:
+        first = threading.Thread(target=lambda: results.append(get_pr_metadata("owner/repo", 42)))
+        second = threading.Thread(target=lambda: results.append(get_pr_metadata("owner/repo", 42)))
+        first.start()
+        assert started.wait(timeout=5)
+        second.start()
+        second.join(timeout=0.2)  # gives the second caller time to find the in-flight GET
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+    assert mock_get.call_count == 1
+    assert len(results) == 2 and all("Shared" in result for result in results)
+    assert github_pr_reviewer._INFLIGHT == {}
@@ -1,6 +1,7 @@
 import asyncio
 from types import SimpleNamespace
 
+import pytest
 from langchain_core.messages import HumanMessage
 
 from agentic_framework.core.langgraph_agent import LangGraphMCPAgent
@@ -33,6 +34,12 @@ class DummyGraph:
         self.calls.append((payload, config))
         return {"messages": [SimpleNamespace(content="ok")]}
 
+    async def abatch(self, payloads, config):
+        return [await self.ainvoke(payload, item_config) for payload, item_config in zip(payloads, config)]
+
+    def copy(self, update=None):
+        return self
+
 
 class DummyModel:
     """A fake model that can be combined with other runnables."""
@@ -64,10 +71,10 @@ def test_langgraph_agent_initializes_with_local_and_initial_mcp_tools(monkeypatc
     result = asyncio.run(agent.run("hello"))
 
     assert result == "ok"
-    assert captured["tools"] == ["local-tool", "mcp-tool"]
+    assert captured["tools"] == ("local-tool", "mcp-tool")
     assert graph.calls[0][1] == {"configurable": {"thread_id": "thread-42"}}
     assert graph.calls[0][0]["messages"][0].content == "hello"
-    assert agent.get_tools() == ["local-tool", "mcp-tool"]
+    assert agent.get_tools() == ("local-tool", "mcp-tool")
 
 
 def test_langgraph_agent_uses_provider_tools_once(monkeypatch):
@@ -91,7 +98,38 @@ def test_langgraph_agent_uses_provider_tools_once(monkeypatch):
     asyncio.run(agent.run("second"))
 
     assert provider.calls == 1
-    assert captured["tools"] == ["local-tool", "mcp-a", "mcp-b"]
+    assert captured["tools"] == ("local-tool", "mcp-a", "mcp-b")
+    assert len(graph.calls) == 2
+
+
+def test_langgraph_agent_concurrent_runs_initialize_once(monkeypatch):
+    graph = DummyGraph()
+    created = []
+
+    class SlowProvider(DummyProvider):
+        async def get_tools(self):
+            await asyncio.sleep(0)
+            return await super().get_tools()
+
+    provider = SlowProvider(["mcp-a"])
+
+    def fake_create_agent(**kwargs):
+        created.append(kwargs)
+        return graph
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", fake_create_agent)
+
+    agent = DummyAgent(mcp_provider=provider)
+
+    async def run_test():
+        await asyncio.gather(agent.run("first"), agent.run("second"))
+
+    asyncio.run(run_test())
+
+    assert provider.calls == 1
+    assert len(created) == 1
+    assert agent.get_tools() == ("local-tool", "mcp-a")
     assert len(graph.calls) == 2
 
 
@@ -111,3 +149,265 @@ def test_langgraph_agent_run_accepts_message_list_and_custom_config(monkeypatch)
     assert result == "ok"
     assert graph.calls[0][0]["messages"] == messages
     assert graph.calls[0][1] == {"configurable": {"thread_id": "abc"}}
+
+
+def test_langgraph_agent_run_batch_uses_one_thread_per_input(monkeypatch):
+    graph = DummyGraph()
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: graph)
+
+    agent = DummyAgent(initial_mcp_tools=[], thread_id="t")
+    results = asyncio.run(agent.run_batch(["a", "b"]))
+
+    assert results == ["ok", "ok"]
+    assert [call[0]["messages"][0].content for call in graph.calls] == ["a", "b"]
+    assert [call[1] for call in graph.calls] == [
+        {"configurable": {"thread_id": "t:0"}},
+        {"configurable": {"thread_id": "t:1"}},
+    ]
+
+
+def test_langgraph_agent_creates_model_on_first_run(monkeypatch):
+    created_models = []
+    captured = {}
+
+    def fake_model(*args, **kwargs):
+        created_models.append(args)
+        return DummyModel()
+
+    def fake_create_agent(**kwargs):
+        captured.update(kwargs)
+        return DummyGraph()
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", fake_model)
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", fake_create_agent)
+
+    agent = DummyAgent(model_name="gpt-test", temperature=0.3, initial_mcp_tools=[])
+    assert created_models == []
+
+    asyncio.run(agent.run("hello"))
+    asyncio.run(agent.run("again"))
+
+    assert created_models == [("gpt-test", 0.3)]
+    assert captured["model"] is agent.model
+
+
+def test_langgraph_agent_instances_share_compiled_graph_but_not_state(monkeypatch):
+    compiled = []
+    copies = []
+
+    class CopyableGraph(DummyGraph):
+        def copy(self, update=None):
+            copies.append(update)
+            return DummyGraph()
+
+    def fake_create_agent(**kwargs):
+        compiled.append(kwargs)
+        return CopyableGraph()
+
+    # _create_model shares one model instance per settings, as the real factory does.
+    models: dict = {}
+    monkeypatch.setattr(
+        "agentic_framework.core.langgraph_agent._create_model",
+        lambda model, temp: models.setdefault((model, temp), DummyModel()),
+    )
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", fake_create_agent)
+
+    first = DummyAgent(model_name="gpt-test", initial_mcp_tools=[])
+    second = DummyAgent(model_name="gpt-test", initial_mcp_tools=[])
+    other_model = DummyAgent(model_name="gpt-other", initial_mcp_tools=[])
+    for agent in (first, second, other_model):
+        asyncio.run(agent.run("hello"))
+
+    assert len(compiled) == 2
+    assert "checkpointer" not in compiled[0]
+    assert len(copies) == 3
+    assert copies[0]["checkpointer"] is not copies[1]["checkpointer"]
+
+
+def test_langgraph_agent_never_shares_graphs_with_other_tool_objects_or_mcp_tools(monkeypatch):
+    compiled = []
+
+    class ToolAgent(DummyAgent):
+        def __init__(self, tool, **kwargs):
+            super().__init__(**kwargs)
+            self._tools = (tool,)
+
+    def fake_create_agent(**kwargs):
+        compiled.append(kwargs["tools"])
+        return DummyGraph()
+
+    model = DummyModel()
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model_name, temp: model)
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", fake_create_agent)
+
+    # Same tool name, different tool objects: each agent must run its own tool.
+    first_tool = SimpleNamespace(name="lookup")
+    second_tool = SimpleNamespace(name="lookup")
+    asyncio.run(ToolAgent(first_tool, initial_mcp_tools=[]).run("hi"))
+    asyncio.run(ToolAgent(second_tool, initial_mcp_tools=[]).run("hi"))
+    # MCP tools may belong to a session that later closes, so their graphs are never reused.
+    mcp_tool = SimpleNamespace(name="mcp")
+    asyncio.run(ToolAgent(first_tool, initial_mcp_tools=[mcp_tool]).run("hi"))
+    asyncio.run(ToolAgent(first_tool, initial_mcp_tools=[mcp_tool]).run("hi"))
+
+    assert [tools[0] for tools in compiled[:2]] == [first_tool, second_tool]
+    assert len(compiled) == 4
+
+
+def test_langgraph_agent_graph_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: DummyGraph())
+    monkeypatch.setattr(LangGraphMCPAgent, "_GRAPH_CACHE_SIZE", 2)
+
+    for model_name in ("a", "b", "c"):
+        asyncio.run(DummyAgent(model_name=model_name, initial_mcp_tools=[]).run("hi"))
+
+    assert len(LangGraphMCPAgent._GRAPH_CACHE) == 2
+
+
+def test_langgraph_agent_retries_initialization_after_mcp_failure(monkeypatch):
+    class FlakyProvider(DummyProvider):
+        async def get_tools(self):
+            self.calls += 1
+            if self.calls == 1:
+                raise ConnectionError("mcp down")
+            return list(self._tools)
+
+    created = []
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr(
+        "agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: created.append(kwargs) or DummyGraph()
+    )
+
+    provider = FlakyProvider(["mcp-a"])
+    agent = DummyAgent(mcp_provider=provider)
+
+    async def run_twice():
+        try:
+            await agent.run("first")
+        except ConnectionError:
+            pass
+        return await agent.run("second")
+
+    assert asyncio.run(run_twice()) == "ok"
+    assert provider.calls == 2
+    assert len(created) == 1
+    assert agent.get_tools() == ("local-tool", "mcp-a")
+
+
+def test_langgraph_agent_retries_after_graph_build_failure_without_duplicating_tools(monkeypatch):
+    attempts = []
+
+    def flaky_create_agent(**kwargs):
+        attempts.append(kwargs["tools"])
+        if len(attempts) == 1:
+            raise RuntimeError("build failed")
+        return DummyGraph()
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", flaky_create_agent)
+
+    agent = DummyAgent(initial_mcp_tools=["mcp-a"])
+
+    async def run_twice():
+        try:
+            await agent.run("first")
+        except RuntimeError:
+            pass
+        return await agent.run("second")
+
+    assert asyncio.run(run_twice()) == "ok"
+    assert attempts[1] == ("local-tool", "mcp-a")
+    assert agent.get_tools() == ("local-tool", "mcp-a")
+
+
+def test_langgraph_agent_run_batch_async_gives_each_input_its_own_thread(monkeypatch):
+    graph = DummyGraph()
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: graph)
+
+    agent = DummyAgent(initial_mcp_tools=[], thread_id="t")
+    results = asyncio.run(agent.run_batch_async(["a", "b"], max_concurrency=2))
+
+    assert results == ["ok", "ok"]
+    assert sorted(call[1]["configurable"]["thread_id"] for call in graph.calls) == ["t:0", "t:1"]
+
+
+class ReplyGraph(DummyGraph):
+    def __init__(self, reply):
+        super().__init__()
+        self.reply = reply
+
+    async def ainvoke(self, payload, config):
+        self.calls.append((payload, config))
+        return {"messages": [SimpleNamespace(content=self.reply)]}
+
+
+def test_langgraph_agent_run_multi_answers_all_inputs_in_one_call(monkeypatch):
+    graph = ReplyGraph('```json\n["Flight A", "Flight B"]\n```')
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: graph)
+
+    agent = DummyAgent(initial_mcp_tools=[])
+    answers = asyncio.run(agent.run_multi(["LIS to BER", "OPO to MAD"]))
+
+    assert answers == ["Flight A", "Flight B"]
+    assert len(graph.calls) == 1
+    prompt = graph.calls[0][0]["messages"][0].content
+    assert "Request 1:\nLIS to BER" in prompt
+    assert "Request 2:\nOPO to MAD" in prompt
+    assert graph.calls[0][1]["configurable"]["thread_id"].startswith("1:multi:")
+
+
+def test_langgraph_agent_run_multi_falls_back_to_separate_runs(monkeypatch):
+    graph = ReplyGraph("Sorry, here is one combined answer.")
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda *args, **kwargs: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: graph)
+
+    agent = DummyAgent(initial_mcp_tools=[], thread_id="t")
+    answers = asyncio.run(agent.run_multi(["LIS to BER", "OPO to MAD"]))
+
+    assert answers == ["Sorry, here is one combined answer."] * 2
+    thread_ids = [call[1]["configurable"]["thread_id"] for call in graph.calls]
+    assert thread_ids[0].startswith("t:multi:")
+    assert thread_ids[1:] == ["t:0", "t:1"]
+
+
+def test_langgraph_agent_run_joins_only_text_parts_of_multi_part_content(monkeypatch):
+    class BlocksGraph(DummyGraph):
+        async def ainvoke(self, payload, config):
+            blocks = [
+                {"type": "reasoning", "reasoning": "The user greets me."},
+                {"type": "text", "text": "Hello, "},
+                {"type": "tool_use", "id": "call-1", "name": "lookup", "input": {}},
+                {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}},
+                "world",
+            ]
+            return {"messages": [SimpleNamespace(content=blocks)]}
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: DummyModel())
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: BlocksGraph())
+
+    agent = DummyAgent(initial_mcp_tools=[])
+
+    assert asyncio.run(agent.run("hello")) == "Hello, world"
+
+
+def test_langgraph_agent_without_system_prompt_is_rejected_on_instantiation(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: DummyModel())
+
+    # Intermediate base classes may leave the prompt to their subclasses.
+    class ToolsBase(LangGraphMCPAgent):
+        def local_tools(self):
+            return ("tool",)
+
+    with pytest.raises(TypeError, match="ToolsBase must set SYSTEM_PROMPT"):
+        ToolsBase(model_name="gpt-test", initial_mcp_tools=[])
+
+    class ConstantPromptAgent(ToolsBase):
+        SYSTEM_PROMPT = "constant prompt"
+
+    assert ConstantPromptAgent(model_name="gpt-test", initial_mcp_tools=[]).system_prompt == "constant prompt"
@@ -0,0 +1,45 @@
+from agentic_framework.core.llm_cache import LLMCache
+
+
+def test_llm_cache_hit_and_miss_counters():
+    cache = LLMCache()
+    key = LLMCache.make_key("openai", "gpt-4o-mini", "system", "hello")
+
+    assert cache.get(key) is None
+    cache.set(key, "world")
+
+    assert cache.get(key) == "world"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_llm_cache_key_depends_on_provider_model_and_prompts():
+    base = LLMCache.make_key("openai", "gpt-4o-mini", "system", "hello")
+
+    assert LLMCache.make_key("openai", "gpt-4o-mini", "system", "hello") == base
+    assert LLMCache.make_key("azure_openai", "gpt-4o-mini", "system", "hello") != base
+    assert LLMCache.make_key("openai", "gpt-4o", "system", "hello") != base
+    assert LLMCache.make_key("openai", "gpt-4o-mini", "other", "hello") != base
+    assert LLMCache.make_key("openai", "gpt-4o-mini", "system", "bye") != base
+
+
+def test_llm_cache_evicts_least_recently_used():
+    cache = LLMCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_llm_cache_clear_resets_entries_and_counters():
+    cache = LLMCache()
+    cache.set("a", "1")
+    cache.get("a")
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
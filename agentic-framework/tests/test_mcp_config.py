@@ -10,3 +10,25 @@ def test_get_mcp_servers_config_returns_copy(monkeypatch):
 def test_get_mcp_servers_config_applies_override():
     resolved = get_mcp_servers_config(override={"new-server": {"transport": "sse", "url": "https://example.com"}})
     assert resolved["new-server"]["url"] == "https://example.com"
+
+
+def test_get_mcp_servers_config_returns_fresh_entries_each_call():
+    first = get_mcp_servers_config()
+    first["web-fetch"]["url"] = "https://mutated.example.com"
+
+    second = get_mcp_servers_config()
+
+    assert second["web-fetch"]["url"] == DEFAULT_MCP_SERVERS["web-fetch"]["url"]
+
+
+def test_get_mcp_servers_config_override_merges_with_default_entry():
+    resolved = get_mcp_servers_config(override={"web-fetch": {"url": "https://fetch.example.com"}})
+
+    assert resolved["web-fetch"] == {"url": "https://fetch.example.com", "transport": "http"}
+    assert get_mcp_servers_config()["web-fetch"]["url"] == DEFAULT_MCP_SERVERS["web-fetch"]["url"]
+
+
+def test_get_mcp_servers_config_limits_to_requested_servers():
+    resolved = get_mcp_servers_config(server_names=["web-fetch", "unknown"])
+
+    assert list(resolved) == ["web-fetch"]
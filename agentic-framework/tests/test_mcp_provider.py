@@ -1,8 +1,9 @@
 import asyncio
 
 import pytest
+from mcp.types import ListToolsResult, Tool
 
-from agentic_framework.mcp.provider import MCPConnectionError, MCPProvider
+from agentic_framework.mcp.provider import _TOOLS_CACHE, _TOOLS_FETCHES, MCPConnectionError, MCPProvider
 
 
 class DummySession:
@@ -46,6 +47,59 @@ def test_mcp_provider_get_tools_caches_result(monkeypatch):
     assert provider.client.get_tools_calls == 1
 
 
+def test_mcp_provider_get_tools_shares_concurrent_fetch(monkeypatch):
+    class SlowClient(DummyClient):
+        async def get_tools(self):
+            await asyncio.sleep(0)
+            return await super().get_tools()
+
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", SlowClient)
+    provider = MCPProvider(servers_config={"srv": {"url": "https://example.com", "transport": "sse"}})
+
+    async def run_test():
+        return await asyncio.gather(provider.get_tools(), provider.get_tools(), provider.get_tools())
+
+    assert asyncio.run(run_test()) == [["cached-tool"]] * 3
+    assert provider.client.get_tools_calls == 1
+
+
+def test_mcp_provider_get_tools_survives_a_cancelled_caller(monkeypatch):
+    release = None
+
+    class BlockingClient(DummyClient):
+        async def get_tools(self):
+            await release.wait()
+            return await super().get_tools()
+
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", BlockingClient)
+    provider = MCPProvider(servers_config={"srv": {"url": "https://example.com", "transport": "sse"}})
+
+    async def run_test():
+        nonlocal release
+        release = asyncio.Event()
+        cancelled = asyncio.ensure_future(provider.get_tools())
+        waiting = asyncio.ensure_future(provider.get_tools())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return await waiting
+
+    assert asyncio.run(run_test()) == ["cached-tool"]
+    assert provider.client.get_tools_calls == 1
+    assert not _TOOLS_FETCHES
+
+
+def test_mcp_provider_get_tools_refetches_after_ttl(monkeypatch):
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", DummyClient)
+    provider = MCPProvider(servers_config={"srv": {"url": "https://example.com", "transport": "sse"}}, tools_ttl=0)
+
+    asyncio.run(provider.get_tools())
+    asyncio.run(provider.get_tools())
+
+    assert provider.client.get_tools_calls == 2
+
+
 def test_mcp_provider_tool_session_loads_tools(monkeypatch):
     monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", DummyClient)
 
@@ -105,3 +159,146 @@ def test_mcp_provider_tool_session_fail_fast_true_raises(monkeypatch):
 
     with pytest.raises(MCPConnectionError):
         asyncio.run(run_test())
+
+
+def test_mcp_provider_get_tools_shares_cache_across_providers(monkeypatch):
+    fetches = []
+
+    class CountingClient(DummyClient):
+        async def get_tools(self):
+            fetches.append(self.config)
+            return ["cached-tool"]
+
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", CountingClient)
+    config = {"srv": {"url": "https://example.com", "transport": "sse"}}
+    other = {"srv": {"url": "https://other.example.com", "transport": "sse"}}
+
+    async def run_test():
+        return await asyncio.gather(
+            MCPProvider(servers_config=config).get_tools(),
+            MCPProvider(servers_config=dict(config)).get_tools(),
+            MCPProvider(servers_config=other).get_tools(),
+        )
+
+    assert asyncio.run(run_test()) == [["cached-tool"]] * 3
+    assert asyncio.run(MCPProvider(servers_config=config).get_tools()) == ["cached-tool"]
+    assert fetches == [config, other]
+
+
+def test_mcp_provider_tool_session_connects_concurrently_and_closes_in_same_task(monkeypatch):
+    entered: dict[str, asyncio.Task] = {}
+    exited: dict[str, asyncio.Task] = {}
+
+    class ConcurrentSession(DummySession):
+        async def __aenter__(self):
+            entered[self.name] = asyncio.current_task()
+            # Only returns once every server is connecting at the same time.
+            while len(entered) < 2:
+                await asyncio.sleep(0)
+            return await super().__aenter__()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            exited[self.name] = asyncio.current_task()
+            return False
+
+    class ConcurrentClient(DummyClient):
+        def session(self, name: str):
+            return ConcurrentSession(name)
+
+    async def fake_load_mcp_tools(session, callbacks, tool_interceptors, server_name, tool_name_prefix):
+        return [f"tool-{server_name}"]
+
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", ConcurrentClient)
+    monkeypatch.setattr("agentic_framework.mcp.provider.load_mcp_tools", fake_load_mcp_tools)
+    provider = MCPProvider(
+        servers_config={
+            "srv-a": {"url": "https://a.example.com", "transport": "sse"},
+            "srv-b": {"url": "https://b.example.com", "transport": "sse"},
+        }
+    )
+
+    async def run_test():
+        async with asyncio.timeout(5):
+            async with provider.tool_session() as tools:
+                assert tools == ["tool-srv-a", "tool-srv-b"]
+                assert exited == {}
+
+    asyncio.run(run_test())
+
+    assert exited == entered
+
+
+def test_mcp_provider_get_tools_reuses_disk_cache_across_processes(monkeypatch, tmp_path):
+    opened = []
+
+    class ListingSession:
+        async def list_tools(self, cursor=None):
+            if cursor is None:
+                return ListToolsResult(tools=[Tool(name="search", inputSchema={"type": "object"})], nextCursor="p2")
+            return ListToolsResult(tools=[Tool(name="fetch", inputSchema={"type": "object"})])
+
+    class ListingClient(DummyClient):
+        handle_tool_errors = True
+
+        def session(self, name: str):
+            opened.append(name)
+            session = ListingSession()
+
+            class Context:
+                async def __aenter__(self):
+                    return session
+
+                async def __aexit__(self, exc_type, exc, tb):
+                    return False
+
+            return Context()
+
+    monkeypatch.setenv("AGENTIC_MCP_TOOLS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", ListingClient)
+    config = {"srv": {"url": "https://srv.example.com", "transport": "sse"}}
+
+    first = asyncio.run(MCPProvider(servers_config=config).get_tools())
+    _TOOLS_CACHE.clear()  # a new process starts with an empty in-memory cache
+    second = asyncio.run(MCPProvider(servers_config=config).get_tools())
+
+    assert [tool.name for tool in first] == ["search", "fetch"]
+    assert [tool.name for tool in second] == ["search", "fetch"]
+    assert opened == ["srv"]
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+def test_mcp_provider_tool_session_bounds_parallel_handshakes(monkeypatch):
+    connecting = 0
+    peak = 0
+
+    class CountingSession(DummySession):
+        async def __aenter__(self):
+            nonlocal connecting, peak
+            connecting += 1
+            peak = max(peak, connecting)
+            await asyncio.sleep(0)
+            connecting -= 1
+            return await super().__aenter__()
+
+    class CountingClient(DummyClient):
+        def session(self, name: str):
+            return CountingSession(name)
+
+    async def fake_load_mcp_tools(session, callbacks, tool_interceptors, server_name, tool_name_prefix):
+        return [f"tool-{server_name}"]
+
+    monkeypatch.setenv("MCP_MAX_PARALLEL", "1")
+    monkeypatch.setattr("agentic_framework.mcp.provider.MultiServerMCPClient", CountingClient)
+    monkeypatch.setattr("agentic_framework.mcp.provider.load_mcp_tools", fake_load_mcp_tools)
+    names = ["srv-a", "srv-b", "srv-c"]
+    provider = MCPProvider(
+        servers_config={name: {"url": f"https://{name}.example.com", "transport": "sse"} for name in names}
+    )
+
+    async def run_test():
+        async with provider.tool_session() as tools:
+            return tools
+
+    # Every session stays open for the agent even though only one handshake ran at a time.
+    assert asyncio.run(run_test()) == [f"tool-{name}" for name in names]
+    assert peak == 1
@@ -1,5 +1,11 @@
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from agentic_framework import registry
 from agentic_framework.interfaces.base import Agent
-from agentic_framework.registry import AgentRegistry
+from agentic_framework.registry import AgentRegistry, DuplicateAgentRegistrationError
 
 
 def test_registry_discovers_core_agents():
@@ -14,6 +20,149 @@ def test_registry_discovers_core_agents():
     assert "developer" in agents
 
 
+def test_registry_discovers_on_first_query_without_importing_agents(monkeypatch, tmp_path):
+    package = tmp_path / "lazy_agents_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "lazy_agent.py").write_text(
+        "from agentic_framework.interfaces.base import Agent\n"
+        "from agentic_framework.registry import AgentRegistry\n\n\n"
+        '@AgentRegistry.register("lazy-test", mcp_servers=["web-fetch"])\n'
+        "class LazyAgent(Agent):\n"
+        "    async def run(self, input_data, config=None):\n"
+        '        return "ok"\n\n'
+        "    def get_tools(self):\n"
+        "        return []\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(registry, "_AGENTS_PACKAGE_NAME", "lazy_agents_pkg")
+    monkeypatch.setattr(AgentRegistry, "_discovered", False)
+
+    try:
+        # The first query discovers agents on its own.
+        assert "lazy-test" in AgentRegistry.list_agents()
+        assert AgentRegistry.get_mcp_servers("lazy-test") == ["web-fetch"]
+        assert "lazy_agents_pkg.lazy_agent" not in sys.modules
+
+        agent_cls = AgentRegistry.get("lazy-test")
+        assert agent_cls is not None and agent_cls.__name__ == "LazyAgent"
+        assert "lazy_agents_pkg.lazy_agent" in sys.modules
+    finally:
+        AgentRegistry._registry.pop("lazy-test", None)
+        AgentRegistry._mcp_servers.pop("lazy-test", None)
+        AgentRegistry._agent_modules.pop("lazy-test", None)
+        sys.modules.pop("lazy_agents_pkg.lazy_agent", None)
+        sys.modules.pop("lazy_agents_pkg", None)
+
+
+_AGENT_BODY = (
+    "    async def run(self, input_data, config=None):\n"
+    '        return "ok"\n\n'
+    "    def get_tools(self):\n"
+    "        return []\n"
+)
+
+
+def _write_agents_package(monkeypatch, tmp_path, package_name, modules):
+    package = tmp_path / package_name
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for module_name, source in modules.items():
+        (package / f"{module_name}.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(registry, "_AGENTS_PACKAGE_NAME", package_name)
+    monkeypatch.setattr(AgentRegistry, "_discovered", False)
+
+
+def _forget_agents(package_name, names):
+    for name in names:
+        AgentRegistry._registry.pop(name, None)
+        AgentRegistry._mcp_servers.pop(name, None)
+        AgentRegistry._agent_modules.pop(name, None)
+    for module in [module for module in sys.modules if module.split(".")[0] == package_name]:
+        sys.modules.pop(module)
+
+
+def test_registry_imports_modules_that_register_without_a_literal_decorator(monkeypatch, tmp_path):
+    header = "from agentic_framework.interfaces.base import Agent\n"
+    _write_agents_package(
+        monkeypatch,
+        tmp_path,
+        "indirect_agents_pkg",
+        {
+            "qualified": header + "from agentic_framework import registry\n\n\n"
+            '@registry.AgentRegistry.register("qualified-test")\n'
+            "class QualifiedAgent(Agent):\n" + _AGENT_BODY,
+            "aliased": header + "from agentic_framework.registry import AgentRegistry as Registry\n\n\n"
+            '@Registry.register("aliased-test")\n'
+            "class AliasedAgent(Agent):\n" + _AGENT_BODY,
+            "programmatic": header + "from agentic_framework.registry import AgentRegistry\n\n\n"
+            "class ProgrammaticAgent(Agent):\n" + _AGENT_BODY + "\n\n"
+            'AgentRegistry.register("programmatic-test")(ProgrammaticAgent)\n',
+        },
+    )
+    names = ["qualified-test", "aliased-test", "programmatic-test"]
+
+    try:
+        agents = AgentRegistry.list_agents()
+        for name in names:
+            assert name in agents
+            assert AgentRegistry.get(name) is not None
+    finally:
+        _forget_agents("indirect_agents_pkg", names)
+
+
+def test_registry_lightweight_discovery_reports_duplicate_names_in_strict_mode(monkeypatch, tmp_path):
+    source = (
+        "from agentic_framework.interfaces.base import Agent\n"
+        "from agentic_framework.registry import AgentRegistry\n\n\n"
+        '@AgentRegistry.register("twin-test")\n'
+        "class {name}(Agent):\n" + _AGENT_BODY
+    )
+    _write_agents_package(
+        monkeypatch,
+        tmp_path,
+        "twin_agents_pkg",
+        {"first": source.format(name="FirstAgent"), "second": source.format(name="SecondAgent")},
+    )
+    AgentRegistry.set_strict_registration(True)
+
+    try:
+        with pytest.raises(DuplicateAgentRegistrationError, match="twin-test"):
+            AgentRegistry.discover_lightweight()
+    finally:
+        AgentRegistry.set_strict_registration(False)
+        _forget_agents("twin_agents_pkg", ["twin-test"])
+
+
+def test_registry_loads_entry_point_agents_on_first_use(monkeypatch, tmp_path):
+    (tmp_path / "entry_point_agent.py").write_text(
+        "from agentic_framework.interfaces.base import Agent\n\n\n"
+        "class PluginAgent(Agent):\n"
+        "    async def run(self, input_data, config=None):\n"
+        '        return "ok"\n\n'
+        "    def get_tools(self):\n"
+        "        return []\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    plugin = EntryPoint(name="plugin-test", value="entry_point_agent:PluginAgent", group="agentic_framework.agents")
+    monkeypatch.setattr(registry, "entry_points", lambda group: [plugin] if group == "agentic_framework.agents" else [])
+    monkeypatch.setattr(AgentRegistry, "_discovered", False)
+
+    try:
+        assert "plugin-test" in AgentRegistry.list_agents()
+        assert "entry_point_agent" not in sys.modules
+
+        agent_cls = AgentRegistry.get("plugin-test")
+        assert agent_cls is not None and agent_cls.__name__ == "PluginAgent"
+        assert AgentRegistry.get_mcp_servers("plugin-test") is None
+    finally:
+        AgentRegistry._registry.pop("plugin-test", None)
+        AgentRegistry._mcp_servers.pop("plugin-test", None)
+        AgentRegistry._agent_entry_points.pop("plugin-test", None)
+        sys.modules.pop("entry_point_agent", None)
+
+
 def test_registry_register_get_and_mcp_servers():
     @AgentRegistry.register("test-agent", mcp_servers=["web-fetch"])
     class TestAgent(Agent):
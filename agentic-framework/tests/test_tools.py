@@ -1,3 +1,6 @@
+import io
+
+from agentic_framework.tools import code_searcher
 from agentic_framework.tools.example import CalculatorTool, WeatherTool
 
 
@@ -47,3 +50,71 @@ def test_calculator_safe_operations():
     assert tool.invoke("min(1, 5, 3)") == "1"
     assert tool.invoke("max(1, 5, 3)") == "5"
     assert tool.invoke("sum([1, 2, 3])") == "6"
+
+
+def test_code_searcher_stops_ripgrep_after_max_matches(monkeypatch):
+    processes: list = []
+
+    class FakeProcess:
+        def __init__(self, cmd, **kwargs):
+            self.cmd = cmd
+            self.stdout = io.StringIO("".join(f"a.py:{n}:1:hit\n" for n in range(1, 101)))
+            self.returncode = None
+            self.terminated = False
+            processes.append(self)
+
+        def terminate(self):
+            self.terminated = True
+
+        def communicate(self):
+            self.returncode = -15 if self.terminated else 0
+            return "", ""
+
+    monkeypatch.setattr(code_searcher.subprocess, "Popen", FakeProcess)
+
+    result = code_searcher.CodeSearcher(".").grep_search("hit")
+
+    assert result == [f"a.py:{n}:1:hit" for n in range(1, code_searcher.MAX_MATCHES + 1)]
+    assert processes[0].terminated
+    assert processes[0].stdout.readline() == f"a.py:{code_searcher.MAX_MATCHES + 1}:1:hit\n"
+
+
+def test_code_searcher_reports_ripgrep_errors(monkeypatch):
+    class FailingProcess:
+        def __init__(self, cmd, **kwargs):
+            assert kwargs["stderr"] is not code_searcher.subprocess.PIPE
+            self.stdout = io.StringIO("")
+            self.returncode = None
+            self.stderr_file = kwargs["stderr"]
+
+        def communicate(self):
+            self.returncode = 2
+            self.stderr_file.write("regex parse error")
+            return "", None
+
+    monkeypatch.setattr(code_searcher.subprocess, "Popen", FailingProcess)
+
+    assert code_searcher.CodeSearcher(".").grep_search("(") == "Error executing rg: regex parse error"
+
+
+def test_code_searcher_sends_every_pattern_to_one_ripgrep(monkeypatch):
+    commands = []
+
+    class RecordingProcess:
+        def __init__(self, cmd, **kwargs):
+            commands.append(cmd)
+            self.stdout = io.StringIO("a.py:1:1:def foo\nb.py:2:1:-x flag\n")
+
+        def terminate(self):
+            pass
+
+        def communicate(self):
+            return "", ""
+
+    monkeypatch.setattr(code_searcher.subprocess, "Popen", RecordingProcess)
+
+    result = code_searcher.CodeSearcher("repo").grep_search(["def foo", "-x"])
+
+    assert result == ["a.py:1:1:def foo", "b.py:2:1:-x flag"]
+    assert len(commands) == 1
+    assert commands[0][-5:] == ["-e", "def foo", "-e", "-x", "repo"]
@@ -18,6 +18,9 @@ class DummyGraph:
         }
         return {"messages": [SimpleNamespace(content=outputs[self.label])]}
 
+    def copy(self, update=None):
+        return self
+
 
 def test_travel_coordinator_orchestrates_three_specialists(monkeypatch):
     calls: list[tuple[str, dict, dict]] = []
@@ -43,12 +46,15 @@ def test_travel_coordinator_orchestrates_three_specialists(monkeypatch):
     )
 
     assert result == "FINAL_BRIEF"
-    assert [entry[0] for entry in calls] == ["flight", "city", "review"]
-    assert "FLIGHT_REPORT" in calls[1][1]["messages"][0].content
-    assert "CITY_REPORT" in calls[2][1]["messages"][0].content
-    assert calls[0][2]["configurable"]["thread_id"] == "trip-42:flight"
-    assert calls[1][2]["configurable"]["thread_id"] == "trip-42:city"
-    assert calls[2][2]["configurable"]["thread_id"] == "trip-42:review"
+    by_stage = {entry[0]: entry for entry in calls}
+    assert sorted(by_stage) == ["city", "flight", "review"]
+    assert calls[-1][0] == "review"
+    assert "FLIGHT_REPORT" not in by_stage["city"][1]["messages"][0].content
+    assert "FLIGHT_REPORT" in by_stage["review"][1]["messages"][0].content
+    assert "CITY_REPORT" in by_stage["review"][1]["messages"][0].content
+    assert by_stage["flight"][2]["configurable"]["thread_id"] == "trip-42:flight"
+    assert by_stage["city"][2]["configurable"]["thread_id"] == "trip-42:city"
+    assert by_stage["review"][2]["configurable"]["thread_id"] == "trip-42:review"
 
 
 def test_travel_coordinator_get_tools_aggregates_from_specialists(monkeypatch):
@@ -64,3 +70,99 @@ def test_travel_coordinator_get_tools_aggregates_from_specialists(monkeypatch):
     tools = agent.get_tools()
     assert tools.count("kiwi-tool") == 3
     assert tools.count("web-fetch-tool") == 3
+
+
+def test_travel_coordinator_runs_flight_and_city_stages_concurrently(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    class BlockingGraph(DummyGraph):
+        async def ainvoke(self, payload, config):
+            if self.label != "review":
+                started.append(self.label)
+                if len(started) == 2:
+                    both_started.set()
+                await asyncio.wait_for(both_started.wait(), timeout=5)
+            return await super().ainvoke(payload, config)
+
+    def fake_create_agent(**kwargs):
+        system_prompt = kwargs["system_prompt"]
+        if "flight specialist" in system_prompt:
+            return BlockingGraph("flight", [])
+        if "destination intelligence specialist" in system_prompt:
+            return BlockingGraph("city", [])
+        return BlockingGraph("review", [])
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", fake_create_agent)
+
+    agent = TravelCoordinatorAgent(initial_mcp_tools=[])
+    result = asyncio.run(agent.run("Plan Lisbon to Porto."))
+
+    assert result == "FINAL_BRIEF"
+    assert sorted(started) == ["city", "flight"]
+
+
+def test_travel_coordinator_loads_mcp_tools_once_for_all_specialists(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
+    built_with: list[tuple] = []
+
+    def fake_create_agent(**kwargs):
+        built_with.append(kwargs["tools"])
+        return DummyGraph("review", [])
+
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent.create_agent", fake_create_agent)
+
+    class CountingProvider:
+        calls = 0
+
+        async def get_tools(self):
+            self.calls += 1
+            return ["kiwi-tool"]
+
+    provider = CountingProvider()
+    agent = TravelCoordinatorAgent(mcp_provider=provider)
+
+    async def run_twice():
+        await asyncio.gather(agent.run("Plan Lisbon to Porto."), agent.run("Plan Porto to Faro."))
+
+    asyncio.run(run_twice())
+
+    assert provider.calls == 1
+    assert built_with == [("kiwi-tool",)] * 3
+
+
+def test_travel_coordinator_stage_config_copies_only_configurable():
+    callbacks = [object()]
+    config = {"configurable": {"thread_id": "trip", "user": "u1"}, "callbacks": callbacks}
+
+    stage = TravelCoordinatorAgent._stage_config(config, "flight")
+
+    assert stage == {"configurable": {"thread_id": "trip:flight", "user": "u1"}, "callbacks": callbacks}
+    assert stage["callbacks"] is callbacks
+    assert config["configurable"]["thread_id"] == "trip"
+    assert TravelCoordinatorAgent._stage_config({}, "city") == {"configurable": {}}
+
+
+def test_travel_coordinator_specialists_share_one_checkpointer(monkeypatch):
+    monkeypatch.setattr("agentic_framework.core.langgraph_agent._create_model", lambda model, temp: object())
+    savers = []
+
+    class RecordingGraph(DummyGraph):
+        def copy(self, update=None):
+            savers.append(update["checkpointer"])
+            return self
+
+    monkeypatch.setattr(
+        "agentic_framework.core.langgraph_agent.create_agent", lambda **kwargs: RecordingGraph("review", [])
+    )
+
+    first = TravelCoordinatorAgent(initial_mcp_tools=[])
+    second = TravelCoordinatorAgent(initial_mcp_tools=[])
+    asyncio.run(first.run("Plan Lisbon to Porto."))
+    asyncio.run(second.run("Plan Porto to Faro."))
+
+    assert len(savers) == 6
+    assert savers[0] is savers[1] is savers[2]
+    assert savers[3] is savers[4] is savers[5]
+    assert savers[0] is not savers[3]